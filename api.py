@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""Local read-only JSON API over the collected feedback.
+
+Serves the records in `feedback_all.jsonl` newest first, filtered like
+`search.py query`, from an asyncio HTTP/1.1 server (keep-alive, GET and
+HEAD only):
+
+    GET /items?product=claude&category=onboarding&source=reddit
+              &since=2026-08-01&until=2026-09-01&limit=50&cursor=...
+    GET /items/<id>
+
+Repeated `product`, `category` and `source` parameters match any of
+their values. A listing answers `{"items": [...], "next": cursor}`;
+passing `next` back as `cursor` gives the following page, which starts
+right after the last item's (timestamp, ID) key instead of counting past
+every earlier item, so page 1,000 costs the same as page 1.
+
+Pages are found in the search index (`search_index.sqlite`) and records
+read at their offsets in the JSONL file through the ID index
+(`feedback_index.sqlite`), both opened on the first request and synced
+whenever the JSONL file changes. SQLite work runs on one worker thread
+so the event loop keeps serving other clients meanwhile. The most
+recently requested responses are kept in an LRU cache until the data
+changes, and every response carries an ETag of its body so clients can
+revalidate with `If-None-Match` and get a bodiless 304.
+
+Usage:
+    python api.py --port 8765
+    curl 'http://127.0.0.1:8765/items?product=claude&limit=5'
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from compact import CATEGORY_BITS, PRODUCT_BITS
+from search import SEARCH_INDEX_FILE, SearchIndex
+from store import CUMULATIVE_FILE, FeedbackStore
+
+API_HOST = "127.0.0.1"
+API_PORT = 8765
+# Responses kept for repeated queries, least recently used dropped first.
+API_CACHE_SIZE = 256
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class BadRequest(ValueError):
+    """A request the API can't answer as asked."""
+
+
+@dataclass
+class Response:
+    """An HTTP response: status, JSON body and the body's ETag."""
+    status: int
+    body: bytes = b""
+    etag: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _json_response(status: int, data: object) -> Response:
+    return Response(status, json.dumps(data).encode())
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an `If-None-Match` header lists this ETag (weakly compared) or is `*`."""
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def encode_cursor(key: tuple[int, str]) -> str:
+    """Opaque cursor for the page after the item with this (timestamp, ID) key."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    """The (timestamp, ID) key a cursor from `encode_cursor` stands for."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as error:
+        raise BadRequest(f"Invalid cursor {cursor!r}") from error
+    if (
+        not isinstance(key, list)
+        or len(key) != 2
+        or not isinstance(key[0], int)
+        or isinstance(key[0], bool)
+        or not isinstance(key[1], str)
+    ):
+        raise BadRequest(f"Invalid cursor {cursor!r}")
+    return key[0], key[1]
+
+
+def _labels(params: dict[str, list[str]], name: str, known: dict[str, int]) -> list[str] | None:
+    values = params.get(name)
+    if values:
+        unknown = sorted(set(values) - known.keys())
+        if unknown:
+            raise BadRequest(f"Unknown {name} {', '.join(unknown)}; expected one of {', '.join(sorted(known))}")
+    return values
+
+
+def _time(params: dict[str, list[str]], name: str) -> str | None:
+    value = params.get(name, [None])[-1]
+    if value is not None:
+        try:
+            datetime.fromisoformat(value)
+        except ValueError as error:
+            raise BadRequest(f"Invalid {name} {value!r}; expected an ISO date or time") from error
+    return value
+
+
+def _limit(params: dict[str, list[str]]) -> int:
+    value = params.get("limit", [str(DEFAULT_LIMIT)])[-1]
+    try:
+        limit = int(value)
+    except ValueError as error:
+        raise BadRequest(f"Invalid limit {value!r}") from error
+    if not 1 <= limit <= MAX_LIMIT:
+        raise BadRequest(f"limit must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+class FeedbackAPI:
+    """Answers API requests from the indexes of a data directory."""
+
+    def __init__(self, data_dir: Path, cache_size: int = API_CACHE_SIZE):
+        self.jsonl_path = data_dir / CUMULATIVE_FILE
+        self.search_path = data_dir / SEARCH_INDEX_FILE
+        self.cache_size = cache_size
+        self.cache: OrderedDict[str, Response] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # SQLite connections belong to the thread that opened them, so all
+        # index work goes through this one thread.
+        self._db = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-db")
+        self._store: FeedbackStore | None = None
+        self._search: SearchIndex | None = None
+        self._version: tuple[int, int] | None = None
+
+    def close(self) -> None:
+        """Close the indexes and stop the worker thread."""
+        self._db.submit(self._close).result()
+        self._db.shutdown()
+
+    def _close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._search.close()
+
+    def _data_version(self) -> tuple[int, int]:
+        try:
+            stat = os.stat(self.jsonl_path)
+        except FileNotFoundError:
+            return 0, 0
+        return stat.st_size, stat.st_mtime_ns
+
+    def _sync(self) -> None:
+        """Open the indexes on first use and catch them up with the JSONL file."""
+        version = self._data_version()
+        if self._store is None:
+            self._store = FeedbackStore(self.jsonl_path)
+            self._search = SearchIndex(self.search_path)
+        elif version == self._version:
+            return
+        self._store.sync()
+        self._search.sync(self.jsonl_path)
+        self._version = version
+
+    async def respond(self, method: str, target: str, headers: dict[str, str]) -> Response:
+        """Answer one request, from the cache when the same query was answered since the data changed.
+
+        An unexpected error is logged and answered with a 500, so it
+        doesn't end the connection without a response.
+        """
+        try:
+            return await self._respond(method, target, headers)
+        except Exception as error:
+            print(f"  ✗ {method} {target} failed: {error!r}", flush=True)
+            return _json_response(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"})
+
+    async def _respond(self, method: str, target: str, headers: dict[str, str]) -> Response:
+        if method not in ("GET", "HEAD"):
+            response = _json_response(HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{method} not allowed"})
+            response.headers["Allow"] = "GET, HEAD"
+            return response
+
+        if self._data_version() != self._version:
+            await asyncio.get_running_loop().run_in_executor(self._db, self._sync)
+            self.cache.clear()
+
+        url = urlsplit(target)
+        key = f"{url.path}?{'&'.join(sorted(url.query.split('&')))}"
+        response = self.cache.get(key)
+        if response is not None:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            try:
+                response = await self._route(url.path, parse_qs(url.query))
+            except BadRequest as error:
+                return _json_response(HTTPStatus.BAD_REQUEST, {"error": str(error)})
+            if response.status == HTTPStatus.OK:
+                response.etag = _etag(response.body)
+                self.cache[key] = response
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+
+        if response.etag is not None and _etag_matches(headers.get("if-none-match", ""), response.etag):
+            return Response(HTTPStatus.NOT_MODIFIED, etag=response.etag)
+        return response
+
+    async def _route(self, path: str, params: dict[str, list[str]]) -> Response:
+        loop = asyncio.get_running_loop()
+        if path == "/items":
+            query = {
+                "products": _labels(params, "product", PRODUCT_BITS),
+                "categories": _labels(params, "category", CATEGORY_BITS),
+                "sources": params.get("source"),
+                "since": _time(params, "since"),
+                "until": _time(params, "until"),
+                "after": decode_cursor(params["cursor"][-1]) if "cursor" in params else None,
+                "limit": _limit(params),
+            }
+            return await loop.run_in_executor(self._db, self._list, query)
+        if path.startswith("/items/"):
+            return await loop.run_in_executor(self._db, self._get, unquote(path.removeprefix("/items/")))
+        return _json_response(HTTPStatus.NOT_FOUND, {"error": f"No such endpoint {path}"})
+
+    def _list(self, query: dict) -> Response:
+        limit = query.pop("limit")
+        # One extra key tells whether there is a next page.
+        keys = self._search.page(**query, limit=limit + 1)
+        page = keys[:limit]
+        lines = self._store.lines([item_id for _, item_id in page])
+        next_cursor = encode_cursor(page[-1]) if len(keys) > limit else None
+        # The stored lines are already JSON, so they are spliced in as they are.
+        body = b'{"items": [' + b", ".join(lines) + b'], "next": ' + json.dumps(next_cursor).encode() + b"}"
+        return Response(HTTPStatus.OK, body)
+
+    def _get(self, item_id: str) -> Response:
+        lines = self._store.lines([item_id])
+        if not lines:
+            return _json_response(HTTPStatus.NOT_FOUND, {"error": f"No item {item_id}"})
+        return Response(HTTPStatus.OK, lines[0])
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it or asks to."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._write(writer, _json_response(HTTPStatus.BAD_REQUEST, {"error": "Malformed request"}), False)
+                    break
+
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    if version == "HTTP/1.1"
+                    else headers.get("connection", "").lower() == "keep-alive"
+                )
+                response = await self.respond(method, target, headers)
+                await self._write(writer, response, keep_alive, head=method == "HEAD")
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, response: Response, keep_alive: bool, head: bool = False) -> None:
+        status = HTTPStatus(response.status)
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if response.status != HTTPStatus.NOT_MODIFIED:
+            lines += ["Content-Type: application/json", f"Content-Length: {len(response.body)}"]
+        if response.etag is not None:
+            lines += [f"ETag: {response.etag}", "Cache-Control: no-cache"]
+        lines += [f"{name}: {value}" for name, value in response.headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if not head:
+            writer.write(response.body)
+        await writer.drain()
+
+
+async def serve(data_dir: Path, host: str = API_HOST, port: int = API_PORT, cache_size: int = API_CACHE_SIZE) -> None:
+    """Serve the API until cancelled."""
+    api = FeedbackAPI(data_dir, cache_size)
+    server = await asyncio.start_server(api.handle_connection, host, port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"🌐 Serving {api.jsonl_path} on http://{host}:{port}/items", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        api.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve collected feedback as a local JSON API")
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Data directory")
+    parser.add_argument("--host", type=str, default=API_HOST, help="Address to listen on")
+    parser.add_argument("--port", type=int, default=API_PORT, help="Port to listen on (0 picks a free one)")
+    parser.add_argument("--cache-size", type=int, default=API_CACHE_SIZE, help="Responses kept in the LRU cache")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(Path(args.dir), args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Compact columnar archive format for historical feedback.
+
+An archive stores many feedback records column by column:
+
+- repeated values (`source`, `products`, `categories`, `sentiment`,
+  `processed`) are dictionary-encoded as small integer codes,
+- ISO timestamps become integer epoch microseconds,
+- integers are packed as fixed-width values,
+- strings are stored as a length column plus one UTF-8 blob,
+
+and every column is zlib-compressed separately, so analytics can decode
+only the columns they need. Reading an archive yields dicts identical to
+the JSONL lines written by `Feedback.to_dict`.
+
+File layout: `MAGIC`, a little-endian uint32 header length, a JSON header
+describing the columns, then the compressed column blobs in order.
+"""
+
+import json
+import struct
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+MAGIC = b"AIFBARC1"
+COMPRESSION_LEVEL = 6
+
+# Field order matches Feedback.to_dict so decoded dicts serialize identically.
+FIELDS = [
+    ("id", "str"),
+    ("source", "dict"),
+    ("source_url", "str"),
+    ("title", "str"),
+    ("text", "str"),
+    ("author", "str"),
+    ("timestamp", "ts"),
+    ("score", "int"),
+    ("num_comments", "int"),
+    ("products", "dict"),
+    ("categories", "dict"),
+    ("sentiment", "dict"),
+    ("collected_at", "ts"),
+    ("processed", "dict"),
+]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NULL_INT = -(2**63)
+_NULL_LEN = -1
+
+
+class ArchiveError(ValueError):
+    """Raised for malformed archives or records that don't fit the schema."""
+
+
+# =============================================================================
+# Column encoders
+# =============================================================================
+
+def _encode_str(values: list) -> bytes:
+    # Lengths are in characters so the blob can be decoded in one call and
+    # sliced, rather than decoding every value separately.
+    lengths = array("q", (_NULL_LEN if v is None else len(v) for v in values))
+    return lengths.tobytes() + "".join(v for v in values if v is not None).encode()
+
+
+def _decode_str(blob: bytes, rows: int) -> list:
+    lengths = array("q")
+    lengths.frombytes(blob[:rows * 8])
+    data = blob[rows * 8:].decode()
+    values = []
+    offset = 0
+    for length in lengths:
+        if length == _NULL_LEN:
+            values.append(None)
+        else:
+            values.append(data[offset:offset + length])
+            offset += length
+    return values
+
+
+def _encode_int(values: list) -> bytes:
+    return array("q", (_NULL_INT if v is None else v for v in values)).tobytes()
+
+
+def _decode_int(blob: bytes, rows: int) -> list:
+    values = array("q")
+    values.frombytes(blob)
+    return [None if v == _NULL_INT else v for v in values]
+
+
+def _timestamp_to_micros(value: str) -> int | None:
+    """Epoch microseconds for a UTC ISO timestamp, or None if it won't round-trip."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        return None
+    micros = (parsed - _EPOCH) // timedelta(microseconds=1)
+    return micros if _micros_to_timestamp(micros) == value else None
+
+
+def _micros_to_timestamp(micros: int) -> str:
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+def _decode_ts(blob: bytes, rows: int) -> list:
+    values = array("q")
+    values.frombytes(blob)
+    return [_micros_to_timestamp(v) for v in values]
+
+
+def _encode_column(name: str, encoding: str, values: list) -> tuple[dict, bytes]:
+    """Encode one column, falling back to plain strings for odd timestamps."""
+    meta: dict = {"name": name, "encoding": encoding}
+
+    if encoding == "ts":
+        micros = [_timestamp_to_micros(v) for v in values]
+        if any(m is None for m in micros):
+            # Non-UTC or malformed timestamps are kept verbatim.
+            meta["encoding"] = "str"
+            return meta, _encode_str(values)
+        return meta, array("q", micros).tobytes()
+
+    if encoding == "dict":
+        dictionary: dict[object, int] = {}
+        distinct = []
+        codes = []
+        for value in values:
+            key = tuple(value) if isinstance(value, list) else value
+            code = dictionary.get(key)
+            if code is None:
+                code = dictionary[key] = len(distinct)
+                distinct.append(value)
+            codes.append(code)
+        meta["values"] = distinct
+        typecode = "B" if len(distinct) <= 0xFF else "H" if len(distinct) <= 0xFFFF else "I"
+        meta["typecode"] = typecode
+        return meta, array(typecode, codes).tobytes()
+
+    if encoding == "int":
+        if any(v is not None and not isinstance(v, int) for v in values):
+            raise ArchiveError(f"Column {name} contains non-integer values")
+        return meta, _encode_int(values)
+
+    if any(v is not None and not isinstance(v, str) for v in values):
+        raise ArchiveError(f"Column {name} contains non-string values")
+    return meta, _encode_str(values)
+
+
+def _decode_column(meta: dict, blob: bytes, rows: int) -> list:
+    encoding = meta["encoding"]
+    if encoding == "ts":
+        return _decode_ts(blob, rows)
+    if encoding == "dict":
+        codes = array(meta["typecode"])
+        codes.frombytes(blob)
+        dictionary = meta["values"]
+        # Lists are copied so callers can mutate rows independently.
+        return [
+            list(value) if isinstance(value, list) else value
+            for value in (dictionary[code] for code in codes)
+        ]
+    if encoding == "int":
+        return _decode_int(blob, rows)
+    return _decode_str(blob, rows)
+
+
+# =============================================================================
+# Reading and writing
+# =============================================================================
+
+def write_archive(records: Iterable[dict], path: Path) -> int:
+    """Write feedback dicts to a columnar archive; return the row count."""
+    names = [name for name, _ in FIELDS]
+    columns: dict[str, list] = {name: [] for name in names}
+    rows = 0
+    for record in records:
+        if list(record) != names:
+            raise ArchiveError(f"Record {record.get('id')!r} does not match the feedback schema")
+        for name in names:
+            columns[name].append(record[name])
+        rows += 1
+
+    metas = []
+    blobs = []
+    for name, encoding in FIELDS:
+        meta, raw = _encode_column(name, encoding, columns[name])
+        blob = zlib.compress(raw, COMPRESSION_LEVEL)
+        meta["length"] = len(blob)
+        metas.append(meta)
+        blobs.append(blob)
+
+    header = json.dumps({"rows": rows, "columns": metas}).encode()
+    with path.open("wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    return rows
+
+
+class ArchiveReader:
+    """Read a columnar archive, decoding columns only when needed."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ArchiveError(f"{path} is not a feedback archive")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length))
+            self._data_start = f.tell()
+
+        self.rows: int = header["rows"]
+        self._columns: dict[str, tuple[dict, int]] = {}
+        offset = self._data_start
+        for meta in header["columns"]:
+            self._columns[meta["name"]] = (meta, offset)
+            offset += meta["length"]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def column_info(self) -> list[dict]:
+        """Name, encoding and compressed size of each column."""
+        return [meta for meta, _ in self._columns.values()]
+
+    def column(self, name: str) -> list:
+        """Decode and return every value of one column."""
+        if name not in self._columns:
+            raise ArchiveError(f"Unknown column {name!r}")
+        meta, offset = self._columns[name]
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            blob = zlib.decompress(f.read(meta["length"]))
+        return _decode_column(meta, blob, self.rows)
+
+    def __iter__(self) -> Iterator[dict]:
+        names = [name for name, _ in FIELDS]
+        columns = [self.column(name) for name in names]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+
+def read_archive(path: Path) -> Iterator[dict]:
+    """Yield every record in an archive as a `Feedback.to_dict`-style dict."""
+    yield from ArchiveReader(path)
+
+
+def pack_jsonl(paths: Iterable[Path], output: Path, dedupe: bool = False) -> int:
+    """Convert JSONL files into one archive.
+
+    With `dedupe`, only the last occurrence of each ID is kept (later files
+    win), which folds repeated daily snapshots into one record per item.
+    """
+    def records() -> Iterator[dict]:
+        for path in paths:
+            with path.open() as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    if not dedupe:
+        return write_archive(records(), output)
+
+    latest: dict[str, dict] = {}
+    for record in records():
+        latest.pop(record["id"], None)
+        latest[record["id"]] = record
+    return write_archive(latest.values(), output)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert feedback JSONL to and from columnar archives")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = subparsers.add_parser("pack", help="Pack JSONL files into an archive")
+    pack_parser.add_argument("output", type=str, help="Archive file to write")
+    pack_parser.add_argument("inputs", nargs="+", help="JSONL files to pack")
+    pack_parser.add_argument("--dedupe", action="store_true", help="Keep one record per ID")
+
+    unpack_parser = subparsers.add_parser("unpack", help="Write an archive back out as JSONL")
+    unpack_parser.add_argument("archive", type=str, help="Archive file to read")
+    unpack_parser.add_argument("--output", type=str, help="JSONL output (default: stdout)")
+
+    info_parser = subparsers.add_parser("info", help="Show archive row and column sizes")
+    info_parser.add_argument("archive", type=str, help="Archive file to read")
+
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        input_paths = [Path(p) for p in args.inputs]
+        count = pack_jsonl(input_paths, Path(args.output), dedupe=args.dedupe)
+        in_size = sum(p.stat().st_size for p in input_paths)
+        out_size = Path(args.output).stat().st_size
+        print(f"✓ Packed {count} records from {len(input_paths)} files: "
+              f"{in_size / 1e6:.1f} MB → {out_size / 1e6:.1f} MB")
+    elif args.command == "unpack":
+        lines = (json.dumps(record) + "\n" for record in read_archive(Path(args.archive)))
+        if args.output:
+            with open(args.output, "w") as out:
+                out.writelines(lines)
+        else:
+            import sys
+            sys.stdout.writelines(lines)
+    else:
+        reader = ArchiveReader(Path(args.archive))
+        print(f"{args.archive}: {reader.rows} rows")
+        for column_meta in reader.column_info():
+            print(f"  {column_meta['name']:<13} {column_meta['encoding']:<5} {column_meta['length']:>10,} bytes")
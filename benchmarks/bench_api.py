@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Load-test the local JSON API.
+
+Writes a synthetic history (default 100,000 items) and serves it with
+`api.py` in a subprocess. Concurrent clients (default 32), each on its
+own keep-alive connection, then send a mix of requests:
+- first pages of common filter combinations, mostly answered from the
+  server's LRU cache,
+- the same pages revalidated with their ETag, answered 304,
+- cursor walks through filtered listings, which are never cached.
+
+Reports throughput and p50/p99 latency per kind of request. A last walk
+through every page of the full listing shows that deep pages cost the
+same as the first. The load runs on bare asyncio connections: httpx's
+async client needs more CPU per request than the server and would be
+measured instead.
+
+Usage:
+    python benchmarks/bench_api.py --items 100000 --clients 32 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from store import CUMULATIVE_FILE  # noqa: E402
+from synthetic import CATEGORIES, PRODUCTS, write_synthetic_file  # noqa: E402
+
+HOT_QUERIES = [
+    {},
+    *({"product": product} for product in PRODUCTS),
+    {"source": "reddit"},
+    {"product": "claude", "category": "onboarding"},
+    {"product": "chatgpt", "since": "2025-06-01", "until": "2025-07-01"},
+]
+PAGE_SIZE = 50
+
+
+def percentiles(timings: list[float]) -> tuple[float, float]:
+    """p50 and p99 of timings in seconds, in milliseconds."""
+    timings = sorted(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return statistics.median(timings) * 1000, p99 * 1000
+
+
+class Connection:
+    """A minimal HTTP/1.1 keep-alive client for `GET` requests."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, base_url: str) -> "Connection":
+        url = urlsplit(base_url)
+        return cls(*await asyncio.open_connection(url.hostname, url.port))
+
+    async def get(self, path: str, params: dict, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """Status, headers (lowercased names) and body of one request."""
+        lines = [f"GET {path}?{urlencode(params)} HTTP/1.1", "Host: localhost"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        status_line, *header_lines = (await self.reader.readuntil(b"\r\n\r\n")).decode().split("\r\n")[:-2]
+        response_headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        body = await self.reader.readexactly(int(response_headers.get("content-length", 0)))
+        return int(status_line.split()[1]), response_headers, body
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+async def client(
+    base_url: str, requests: int, seed: int, timings: dict[str, list[float]], etags: dict[int, str]
+) -> None:
+    """Send `requests` mixed requests, recording each one's latency under its kind."""
+    connection = await Connection.open(base_url)
+    rng = random.Random(seed)
+    walk: dict | None = None
+    for _ in range(requests):
+        roll = rng.random()
+        if roll < 0.2:
+            kind = "walk"
+            if walk is None:
+                walk = {"product": rng.choice(PRODUCTS), "category": rng.choice(CATEGORIES), "limit": PAGE_SIZE}
+            params, headers = walk, {}
+        else:
+            query = rng.randrange(len(HOT_QUERIES))
+            params = {**HOT_QUERIES[query], "limit": PAGE_SIZE}
+            kind = "revalidate" if roll < 0.4 and query in etags else "first page"
+            headers = {"If-None-Match": etags[query]} if kind == "revalidate" else {}
+
+        start = time.perf_counter()
+        status, response_headers, body = await connection.get("/items", params, headers)
+        timings[kind].append(time.perf_counter() - start)
+
+        if kind == "walk":
+            next_cursor = json.loads(body)["next"]
+            walk = {**walk, "cursor": next_cursor} if next_cursor else None
+        elif kind == "first page":
+            etags[query] = response_headers["etag"]
+        else:
+            assert status == 304, f"revalidation got {status}"
+    connection.close()
+
+
+async def load(base_url: str, clients: int, requests: int) -> tuple[dict[str, list[float]], float]:
+    """Run the clients concurrently; return latencies per kind and the seconds taken."""
+    timings: dict[str, list[float]] = {"first page": [], "revalidate": [], "walk": []}
+    etags: dict[int, str] = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(base_url, requests, seed, timings, etags) for seed in range(clients)))
+    return timings, time.perf_counter() - start
+
+
+def walk_all(base_url: str) -> list[float]:
+    """Latency of every page of the unfiltered listing, in order."""
+    timings = []
+    with httpx.Client(base_url=base_url) as http:
+        params = {"limit": PAGE_SIZE}
+        while True:
+            start = time.perf_counter()
+            response = http.get("/items", params=params)
+            timings.append(time.perf_counter() - start)
+            next_cursor = response.json()["next"]
+            if next_cursor is None:
+                return timings
+            params["cursor"] = next_cursor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the local JSON API")
+    parser.add_argument("--items", type=int, default=100_000, help="Synthetic items served")
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_synthetic_file(Path(tmp) / CUMULATIVE_FILE, args.items)
+        server = subprocess.Popen(
+            [sys.executable, str(ROOT / "api.py"), "--dir", tmp, "--port", "0"],
+            stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            base_url = server.stdout.readline().split(" on ")[-1].strip().removesuffix("/items")
+
+            start = time.perf_counter()
+            httpx.get(f"{base_url}/items", params={"limit": 1}, timeout=600)
+            print(f"{args.items:,} items; first request (indexing) took {time.perf_counter() - start:.1f}s\n")
+
+            timings, elapsed = asyncio.run(load(base_url, args.clients, args.requests))
+            total = sum(len(kind_timings) for kind_timings in timings.values())
+            print(f"{args.clients} clients, {total} requests in {elapsed:.1f}s ({total / elapsed:.0f} requests/s)")
+            print(f"{'kind':<12} {'requests':>8} {'p50 ms':>8} {'p99 ms':>8}")
+            for kind, kind_timings in [*timings.items(), ("all", sum(timings.values(), []))]:
+                p50, p99 = percentiles(kind_timings)
+                print(f"{kind:<12} {len(kind_timings):8d} {p50:8.2f} {p99:8.2f}")
+
+            pages = walk_all(base_url)
+            print(f"\nfull listing, {len(pages)} pages of {PAGE_SIZE}, one client:")
+            for label, page_timings in [
+                ("pages 1-10", pages[:10]),
+                (f"pages {len(pages) // 2}-{len(pages) // 2 + 9}", pages[len(pages) // 2:len(pages) // 2 + 10]),
+                (f"last 10 pages", pages[-10:]),
+            ]:
+                p50, p99 = percentiles(page_timings)
+                print(f"  {label:<20} p50 {p50:6.2f} ms  p99 {p99:6.2f} ms")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Compare the columnar archive with plain JSONL for size and load time.
+
+Uses every feedback_*.jsonl snapshot in the repo, or a synthetic corpus
+with --synthetic N.
+
+Usage:
+    python benchmarks/bench_archive.py
+    python benchmarks/bench_archive.py --synthetic 500000
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from archive import ArchiveReader, pack_jsonl  # noqa: E402
+from synthetic import write_synthetic_file  # noqa: E402
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the columnar archive format")
+    parser.add_argument("--synthetic", type=int, help="Use N synthetic records instead of the repo snapshots")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        if args.synthetic:
+            inputs = [write_synthetic_file(tmp_dir / "synthetic.jsonl", args.synthetic)]
+        else:
+            inputs = sorted(ROOT.glob("feedback_*.jsonl"))
+
+        combined = tmp_dir / "combined.jsonl"
+        with combined.open("wb") as out:
+            for path in inputs:
+                out.write(path.read_bytes())
+        gzipped = tmp_dir / "combined.jsonl.gz"
+        gzipped.write_bytes(gzip.compress(combined.read_bytes()))
+
+        archive = tmp_dir / "combined.aifb"
+        pack_time, rows = timed(lambda: pack_jsonl([combined], archive))
+
+        def load_jsonl() -> list[dict]:
+            with combined.open() as f:
+                return [json.loads(line) for line in f if line.strip()]
+
+        def load_gzip() -> list[dict]:
+            with gzip.open(gzipped, "rt") as f:
+                return [json.loads(line) for line in f if line.strip()]
+
+        jsonl_time, jsonl_rows = timed(load_jsonl)
+        gzip_time, _ = timed(load_gzip)
+        archive_time, archive_rows = timed(lambda: list(ArchiveReader(archive)))
+
+        def load_columns() -> tuple[list, list]:
+            reader = ArchiveReader(archive)
+            return reader.column("timestamp"), reader.column("products")
+
+        columns_time, _ = timed(load_columns)
+
+        print(f"Corpus: {rows:,} records from {len(inputs)} file(s), packed in {pack_time:.2f}s")
+        print(f"  {'format':<28} {'size':>10} {'load':>9}")
+        print(f"  {'JSONL':<28} {combined.stat().st_size / 1e6:8.2f} MB {jsonl_time:8.3f}s")
+        print(f"  {'JSONL + gzip':<28} {gzipped.stat().st_size / 1e6:8.2f} MB {gzip_time:8.3f}s")
+        print(f"  {'archive (all columns)':<28} {archive.stat().st_size / 1e6:8.2f} MB {archive_time:8.3f}s")
+        print(f"  {'archive (timestamp+products)':<28} {'':>10} {columns_time:8.3f}s")
+        print(f"  identical records: {archive_rows == jsonl_rows}")
+
+
+if __name__ == "__main__":
+    main()
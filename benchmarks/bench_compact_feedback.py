@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Memory and throughput of CompactFeedback vs the Feedback dataclass.
+
+Loads synthetic JSONL lines into each representation, measures the memory
+held by the resulting list with tracemalloc, then times parsing and
+serializing back to the JSONL schema.
+
+Usage:
+    python benchmarks/bench_compact_feedback.py --records 1000000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from compact import CompactFeedback  # noqa: E402
+from scraper import AIProduct, Feedback, FeedbackCategory, FeedbackSource  # noqa: E402
+from synthetic import synthetic_records  # noqa: E402
+
+
+@dataclass
+class LegacyFeedback:
+    """The original Feedback layout (no __slots__), for comparison."""
+    id: str
+    source: FeedbackSource
+    source_url: str
+    title: str | None
+    text: str
+    author: str | None
+    timestamp: datetime
+    score: int | None
+    num_comments: int | None
+    products: list[AIProduct]
+    categories: list[FeedbackCategory]
+    sentiment: str | None
+    collected_at: datetime
+    processed: bool = False
+
+    to_dict = Feedback.to_dict
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LegacyFeedback":
+        feedback = Feedback.from_dict(data)
+        return cls(**{name: getattr(feedback, name) for name in Feedback.__slots__})
+
+
+REPRESENTATIONS = {
+    "Feedback (original)": LegacyFeedback,
+    "Feedback (slots)": Feedback,
+    "CompactFeedback": CompactFeedback,
+}
+
+
+def measure_memory(cls: type, lines: list[str]) -> float:
+    """MB held by a list of records parsed from the lines."""
+    gc.collect()
+    tracemalloc.start()
+    records = [cls.from_dict(json.loads(line)) for line in lines]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current / 1e6
+
+
+def measure_throughput(cls: type, lines: list[str]) -> tuple[float, float]:
+    """Records/sec for parsing lines and for serializing records back."""
+    start = time.perf_counter()
+    records = [cls.from_dict(json.loads(line)) for line in lines]
+    parse_rate = len(lines) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for record in records:
+        json.dumps(record.to_dict())
+    dump_rate = len(lines) / (time.perf_counter() - start)
+    return parse_rate, dump_rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark compact feedback records")
+    parser.add_argument("--records", type=int, default=1_000_000, help="Synthetic records")
+    args = parser.parse_args()
+
+    lines = [json.dumps(record) for record in synthetic_records(args.records)]
+    roundtrip_ok = all(CompactFeedback.from_json(line).to_json() == line for line in lines[:10_000])
+
+    print(f"{args.records:,} synthetic records (round-trip identical: {roundtrip_ok})")
+    print(f"  {'representation':<20} {'memory':>10} {'parse/s':>12} {'dump/s':>12}")
+    for name, cls in REPRESENTATIONS.items():
+        memory = measure_memory(cls, lines)
+        parse_rate, dump_rate = measure_throughput(cls, lines)
+        print(f"  {name:<20} {memory:7.0f} MB {parse_rate:12,.0f} {dump_rate:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Measure near-duplicate index throughput with a large stored history.
+
+Fills a fresh index with random signatures (default one million), then
+times signing and indexing new synthetic items against it, lookups alone,
+and how reliably lightly edited copies of stored items are found.
+
+Usage:
+    python benchmarks/bench_dedup.py --stored 1000000 --queries 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dedup import SIGNATURE_SIZE, DuplicateIndex, signature  # noqa: E402
+
+VOCABULARY = [f"w{i}" for i in range(20_000)]
+
+
+def make_item(rng: random.Random, item_id: str) -> dict:
+    return {
+        "id": item_id,
+        "title": " ".join(rng.choices(VOCABULARY, k=10)),
+        "text": " ".join(rng.choices(VOCABULARY, k=rng.randint(20, 120))),
+    }
+
+
+def edited(item: dict, rng: random.Random, item_id: str) -> dict:
+    """A copy with one word of the text replaced, as in a light cross-post edit."""
+    words = item["text"].split()
+    words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return {"id": item_id, "title": item["title"], "text": " ".join(words)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the near-duplicate index")
+    parser.add_argument("--stored", type=int, default=1_000_000, help="Signatures already indexed")
+    parser.add_argument("--queries", type=int, default=5_000, help="New items to index")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp, DuplicateIndex(Path(tmp) / "dedup.sqlite") as index:
+        start = time.perf_counter()
+        for i in range(args.stored):
+            index.insert(f"stored_{i}", os.urandom(SIGNATURE_SIZE * 4), f"stored_{i}")
+        index.conn.commit()
+        elapsed = time.perf_counter() - start
+        print(f"bulk insert    {args.stored:>9,} signatures    {elapsed:7.2f}s  {args.stored / elapsed:>9,.0f}/s")
+
+        originals = [make_item(rng, f"original_{i}") for i in range(args.queries)]
+        start = time.perf_counter()
+        for item in originals:
+            index.add(item)
+        index.conn.commit()
+        elapsed = time.perf_counter() - start
+        print(f"add new items  {args.queries:>9,} items         {elapsed:7.2f}s  {args.queries / elapsed:>9,.0f}/s"
+              f"  ({index.duplicates} false matches)")
+
+        values = [signature(item) for item in originals]
+        start = time.perf_counter()
+        for value in values:
+            index.nearest(value)
+        elapsed = time.perf_counter() - start
+        print(f"lookups only   {args.queries:>9,} queries       {elapsed:7.2f}s  {args.queries / elapsed:>9,.0f}/s")
+
+        copies = [edited(item, rng, f"copy_{i}") for i, item in enumerate(originals)]
+        found = sum(index.add(copy) == original["id"] for copy, original in zip(copies, originals))
+        print(f"edited copies  {found:,} of {len(copies):,} clustered with their original")
+
+
+if __name__ == "__main__":
+    main()
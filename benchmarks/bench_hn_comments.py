@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Measure comment-tree coverage against requests spent.
+
+Serves HackerNews threads several levels deep (default 100 stories, every
+fourth thread busy) and crawls them with `HNCommentCrawler` at a range of
+request budgets, reporting the share of comments reached, the relevant
+comments found and the wall time, with threads prioritised the way
+`scrape_hackernews` does (relevant stories first, busiest threads first)
+and walked in the order they come. A last pass varies depth and fan-out
+with no budget.
+
+Usage:
+    python benchmarks/bench_hn_comments.py --stories 100 --depth 4 --latency 0.01
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scraper import HN_CONCURRENCY, HNCommentCrawler, classify  # noqa: E402
+from stub_server import make_hn_fixture, serve  # noqa: E402
+from transport import Transport  # noqa: E402
+
+
+def crawl(
+    base_url: str,
+    fixture: dict,
+    budget: int,
+    max_depth: int,
+    max_fanout: int,
+    prioritized: bool,
+) -> tuple[HNCommentCrawler, int, float]:
+    """Crawl every fixture thread; return the crawler, relevant comments found and seconds taken."""
+    transport = Transport(max_connections=HN_CONCURRENCY)
+
+    def fetch(item_id: int) -> dict | None:
+        response = transport.get(f"{base_url}/v0/item/{item_id}.json")
+        return response.json() if response.status_code == 200 else None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=HN_CONCURRENCY) as pool:
+        crawler = HNCommentCrawler(
+            fetch, pool, budget=budget, max_depth=max_depth, max_fanout=max_fanout, prioritize=prioritized
+        )
+        for story_id in fixture["newstories"]:
+            story = fixture["items"][story_id]
+            crawler.add(story_id, story["kids"], story["descendants"], classify(story["title"]).relevant)
+        relevant_comments = sum(classify(comment["text"]).relevant for _, comment in crawler.crawl())
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return crawler, relevant_comments, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the HackerNews comment-tree crawler")
+    parser.add_argument("--stories", type=int, default=100, help="Stories in the HN fixture")
+    parser.add_argument("--depth", type=int, default=4, help="Comment levels in the fixture")
+    parser.add_argument("--latency", type=float, default=0.01, help="Per-request latency (s)")
+    parser.add_argument("--budgets", type=int, nargs="+", default=[500, 1_000, 2_000, 4_000], help="Request budgets")
+    args = parser.parse_args()
+
+    fixture = make_hn_fixture(num_stories=args.stories, depth=args.depth)
+    total = sum(fixture["items"][story_id]["descendants"] for story_id in fixture["newstories"])
+    print(f"{args.stories} threads, {total} comments, {args.depth} levels deep\n")
+
+    with serve(fixture, latency=args.latency) as base_url:
+        print(f"{'budget':>8}  {'order':<11} {'requests':>8} {'coverage':>9} {'relevant':>9} {'time':>7}")
+        for budget in args.budgets:
+            for prioritized in (True, False):
+                crawler, relevant, elapsed = crawl(base_url, fixture, budget, args.depth, 10, prioritized)
+                print(
+                    f"{budget:8d}  {'prioritized' if prioritized else 'in order':<11} {crawler.stats.requests:8d} "
+                    f"{crawler.stats.coverage:9.0%} {relevant:9d} {elapsed:6.2f}s"
+                )
+
+        print(f"\n{'depth':>5} {'fan-out':>7} {'requests':>8} {'coverage':>9} {'relevant':>9} {'time':>7}")
+        for max_depth, max_fanout in [(1, 10), (2, 3), (2, 10), (3, 2), (args.depth, 10)]:
+            crawler, relevant, elapsed = crawl(base_url, fixture, sys.maxsize, max_depth, max_fanout, True)
+            print(
+                f"{max_depth:5d} {max_fanout:7d} {crawler.stats.requests:8d} "
+                f"{crawler.stats.coverage:9.0%} {relevant:9d} {elapsed:6.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
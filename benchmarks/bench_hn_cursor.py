@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Measure HackerNews requests per run with and without the story cursor.
+
+Runs the HN scraper against the stub server once to seed the cursor, then
+adds a few new stories and new comments on existing ones (a typical
+"next day") and compares a steady-state run with the cursor against a
+full walk of `newstories.json` without it.
+
+Usage:
+    python benchmarks/bench_hn_cursor.py --stories 500 --new-stories 40
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scraper import scrape_hackernews  # noqa: E402
+from stub_server import BASE_TIME, make_hn_fixture, serve  # noqa: E402
+
+
+def add_activity(fixture: dict, new_stories: int, busy_threads: int, new_comments: int) -> None:
+    """Publish new stories and new first-level comments on older ones."""
+    items = fixture["items"]
+    next_id = max(items) + 1
+    newest_story = max(fixture["newstories"])
+
+    for i in range(new_stories):
+        story_id = newest_story + 1 + i
+        items[story_id] = {
+            "id": story_id,
+            "by": f"newposter{i}",
+            "time": BASE_TIME + 1_000_000 + i * 60,
+            "title": f"ChatGPT onboarding is confusing, new #{i}" if i % 3 == 0 else f"Ask HN: Backups #{i}",
+            "text": "",
+            "score": 1,
+            "descendants": 0,
+            "kids": [],
+            "type": "story",
+        }
+        fixture["newstories"].insert(0, story_id)
+    del fixture["newstories"][500:]
+
+    for story_id in fixture["newstories"][new_stories:new_stories + busy_threads]:
+        story = items[story_id]
+        for j in range(new_comments):
+            items[next_id] = {
+                "id": next_id,
+                "by": f"replier{j}",
+                "time": BASE_TIME + 1_000_000 + j,
+                "text": f"The Claude error message confused me too ({story_id}.{j})",
+                "parent": story_id,
+                "type": "comment",
+            }
+            story["kids"].insert(0, next_id)
+            story["descendants"] += 1
+            next_id += 1
+
+
+def run(base_url: str, fixture: dict, cursor_path: Path | None) -> tuple[float, int, int]:
+    fixture["stats"].clear()
+    start = time.perf_counter()
+    items = list(scrape_hackernews(
+        limit=10_000,
+        base_url=f"{base_url}/v0",
+        cursor_path=cursor_path,
+        # The fixture's timestamps are fixed, so widen the window to cover them
+        catch_up_hours=(time.time() - BASE_TIME) / 3600 + 1,
+        # Crawl every thread in full, so only the cursor decides what is fetched
+        comment_budget=sys.maxsize,
+    ))
+    return time.perf_counter() - start, len(items), sum(fixture["stats"].values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the HackerNews story cursor")
+    parser.add_argument("--stories", type=int, default=500, help="Stories in the HN fixture")
+    parser.add_argument("--new-stories", type=int, default=40, help="Stories published between runs")
+    parser.add_argument("--busy-threads", type=int, default=10, help="Older stories gaining comments")
+    parser.add_argument("--latency", type=float, default=0.01, help="Per-request latency (s)")
+    args = parser.parse_args()
+
+    fixture = make_hn_fixture(num_stories=args.stories)
+
+    with tempfile.TemporaryDirectory() as tmp, serve(fixture, latency=args.latency) as base_url:
+        cursor_path = Path(tmp) / "hn_cursor.json"
+        elapsed, items, requests = run(base_url, fixture, cursor_path)
+        print(f"{'first run':<22} {elapsed:6.2f}s  {items:4d} items  {requests:5d} requests")
+
+        add_activity(fixture, args.new_stories, args.busy_threads, new_comments=3)
+
+        elapsed, items, requests = run(base_url, fixture, None)
+        print(f"{'next run, full walk':<22} {elapsed:6.2f}s  {items:4d} items  {requests:5d} requests")
+        full_requests = requests
+
+        elapsed, items, requests = run(base_url, fixture, cursor_path)
+        print(f"{'next run, cursor':<22} {elapsed:6.2f}s  {items:4d} items  {requests:5d} requests")
+        print(f"request reduction:     {full_requests / max(requests, 1):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Benchmark serial vs concurrent HackerNews fetching against a local stub.
+
+Usage:
+    python benchmarks/bench_hn_fetch.py --stories 200 --latency 0.02
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scraper import scrape_hackernews  # noqa: E402
+from stub_server import make_hn_fixture, serve  # noqa: E402
+
+
+def run(base_url: str, limit: int, concurrency: int) -> tuple[float, list[str]]:
+    """Scrape the stub once and return wall time and yielded IDs."""
+    start = time.perf_counter()
+    ids = [
+        f.id
+        for f in scrape_hackernews(limit=limit, concurrency=concurrency, base_url=f"{base_url}/v0")
+    ]
+    return time.perf_counter() - start, ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark HN fetch concurrency")
+    parser.add_argument("--stories", type=int, default=200, help="Stories in the fixture")
+    parser.add_argument("--latency", type=float, default=0.02, help="Per-request latency (s)")
+    parser.add_argument("--limit", type=int, default=10_000, help="Scraper item limit")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent requests")
+    args = parser.parse_args()
+
+    fixture = make_hn_fixture(num_stories=args.stories)
+    with serve(fixture, latency=args.latency) as base_url:
+        serial_time, serial_ids = run(base_url, args.limit, concurrency=1)
+        concurrent_time, concurrent_ids = run(base_url, args.limit, args.concurrency)
+
+    requests = 1 + args.stories * 11
+    print(f"Fixture: {args.stories} stories, ~{requests} requests, {args.latency * 1000:.0f} ms latency")
+    print(f"  serial (1):         {serial_time:7.2f} s  {len(serial_ids)} items")
+    print(f"  concurrent ({args.concurrency:>2}):  {concurrent_time:7.2f} s  {len(concurrent_ids)} items")
+    print(f"  speedup:            {serial_time / concurrent_time:7.1f}x")
+    print(f"  identical output:   {serial_ids == concurrent_ids}")
+
+
+if __name__ == "__main__":
+    main()
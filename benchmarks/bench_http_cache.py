@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Measure the HTTP cache across repeated collection runs against a local stub.
+
+Runs the Reddit and HackerNews scrapers three times against the stub server
+with a fresh cache directory: a cold run, an immediate re-run (HN items
+served from cache within their TTL) and a run with the TTL expired
+(everything revalidated with conditional requests).
+
+Usage:
+    python benchmarks/bench_http_cache.py --stories 100
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from http_cache import HttpCache  # noqa: E402
+from scraper import scrape_hackernews, scrape_reddit  # noqa: E402
+from stub_server import make_hn_fixture, make_reddit_fixture, serve  # noqa: E402
+
+SUBREDDITS = [
+    "artificial", "ChatGPT", "ClaudeAI", "OpenAI",
+    "LocalLLaMA", "ArtificialIntelligence", "MachineLearning", "singularity",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the HTTP response cache")
+    parser.add_argument("--stories", type=int, default=100, help="Stories in the HN fixture")
+    parser.add_argument("--latency", type=float, default=0.01, help="Per-request latency (s)")
+    args = parser.parse_args()
+
+    fixture = make_hn_fixture(num_stories=args.stories)
+    fixture["reddit"] = make_reddit_fixture(SUBREDDITS)
+
+    with tempfile.TemporaryDirectory() as tmp, serve(fixture, latency=args.latency) as base_url:
+        runs = [("cold", None), ("re-run within TTL", None), ("TTL expired", 0)]
+        for name, ttl in runs:
+            cache = HttpCache(Path(tmp))
+            fixture["stats"].clear()
+            item_ttl = {} if ttl is None else {"item_ttl": ttl}
+            start = time.perf_counter()
+            items = list(scrape_reddit(limit=10_000, base_url=base_url, cache=cache))
+            items += list(scrape_hackernews(
+                limit=10_000, base_url=f"{base_url}/v0", cache=cache, **item_ttl
+            ))
+            elapsed = time.perf_counter() - start
+            served = dict(fixture["stats"])
+            print(f"{name:<18} {elapsed:6.2f}s  {len(items)} items  server replies {served}")
+            print(f"{'':<18} {cache.stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Compare the compiled KeywordMatcher with the per-function keyword scans.
+
+Classifies every title+text in the repo's feedback_*.jsonl snapshots (plus
+synthetic keyword mixes) both ways, checks the results are identical and
+reports throughput.
+
+Usage:
+    python benchmarks/bench_keyword_matcher.py --repeat 5
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from scraper import (  # noqa: E402
+    AI_KEYWORDS,
+    CATEGORY_KEYWORDS,
+    UX_KEYWORDS,
+    classify,
+    extract_categories,
+    extract_products,
+    is_relevant,
+)
+
+
+def load_texts() -> list[str]:
+    """Collect title+text strings from every snapshot in the repo."""
+    texts = []
+    for path in sorted(ROOT.glob("feedback_*.jsonl")):
+        with path.open() as f:
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    texts.append(f"{item['title'] or ''}\n\n{item['text'] or ''}")
+    return texts
+
+
+def synthetic_texts(count: int, seed: int = 0) -> list[str]:
+    """Random mixes of keywords and filler, including overlapping matches."""
+    rng = random.Random(seed)
+    vocabulary = (
+        AI_KEYWORDS + UX_KEYWORDS
+        + [kw for _, keywords in CATEGORY_KEYWORDS for kw in keywords]
+        + ["the", "and", "stone", "linux", "Claude", "ERROR:", "new user experience"]
+    )
+    return [
+        " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30)))
+        for _ in range(count)
+    ]
+
+
+def old_classify(text: str) -> tuple:
+    return is_relevant(text), extract_products(text), extract_categories(text)
+
+
+def new_classify(text: str) -> tuple:
+    result = classify(text)
+    return result.relevant, result.products, result.categories
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the compiled keyword matcher")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the corpus")
+    parser.add_argument("--synthetic", type=int, default=20_000, help="Synthetic texts to add")
+    args = parser.parse_args()
+
+    texts = load_texts() + synthetic_texts(args.synthetic) + [""]
+
+    mismatches = sum(1 for text in texts if old_classify(text) != new_classify(text))
+
+    timings = {}
+    for name, fn in [("per-function", old_classify), ("compiled", new_classify)]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in texts:
+                fn(text)
+        timings[name] = time.perf_counter() - start
+
+    total = len(texts) * args.repeat
+    print(f"Corpus: {len(texts)} texts x {args.repeat} passes")
+    for name, elapsed in timings.items():
+        print(f"  {name:<13} {elapsed:6.2f} s  {total / elapsed:10,.0f} texts/s")
+    print(f"  speedup       {timings['per-function'] / timings['compiled']:6.2f}x")
+    print(f"  mismatches    {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
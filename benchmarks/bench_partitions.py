@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Compare time-range reads from the partitioned store with scanning snapshots.
+
+Splits N synthetic items (default 200,000, two years of history) into
+runs of consecutive items, writes each run both as a loose
+`feedback_<run>.jsonl` snapshot and into a `PartitionedStore`, then reads
+the items of a week, a month and a year both ways: the scan parses every
+snapshot and filters by timestamp, the store only opens the partitions
+that overlap the range. A last step re-adds the newest run with fresh
+`collected_at` times to show it is recognised and not stored again.
+
+Usage:
+    python benchmarks/bench_partitions.py --items 200000 --runs 500
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from partitions import PartitionedStore  # noqa: E402
+from synthetic import synthetic_records  # noqa: E402
+
+RANGES = [
+    ("week", "2025-06-02", "2025-06-09"),
+    ("month", "2025-06-01", "2025-07-01"),
+    ("year", "2025-01-01", "2026-01-01"),
+]
+
+
+def scan(snapshots: list[Path], since: str, until: str) -> tuple[int, float]:
+    """Distinct items in the range and the seconds taken, reading every snapshot."""
+    since_time, until_time = datetime.fromisoformat(since), datetime.fromisoformat(until)
+    ids = set()
+    start = time.perf_counter()
+    for path in snapshots:
+        with path.open() as f:
+            for line in f:
+                item = json.loads(line)
+                timestamp = datetime.fromisoformat(item["timestamp"]).replace(tzinfo=None)
+                if since_time <= timestamp < until_time:
+                    ids.add(item["id"])
+    return len(ids), time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark partition pruning")
+    parser.add_argument("--items", type=int, default=200_000, help="Synthetic items in the history")
+    parser.add_argument("--runs", type=int, default=500, help="Collection runs the items are split into")
+    args = parser.parse_args()
+
+    records = sorted(synthetic_records(args.items), key=lambda record: record["timestamp"])
+    run_size = -(-len(records) // args.runs)
+    runs = {f"run-{i:05d}": records[i * run_size:(i + 1) * run_size] for i in range(args.runs)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshots = []
+        for run, items in runs.items():
+            path = Path(tmp) / f"feedback_{run}.jsonl"
+            path.write_text("".join(json.dumps(item) + "\n" for item in items))
+            snapshots.append(path)
+
+        store = PartitionedStore(Path(tmp) / "data")
+        start = time.perf_counter()
+        for run, items in runs.items():
+            store.add_run(run, items)
+        print(
+            f"{len(records)} items in {len(snapshots)} snapshots, stored in "
+            f"{len(store.manifest.partitions)} partitions in {time.perf_counter() - start:.2f}s\n"
+        )
+
+        print(f"{'range':<6} {'items':>7} {'partitions':>10} {'scan':>8} {'store':>8} {'speedup':>8}")
+        for name, since, until in RANGES:
+            scanned, scan_seconds = scan(snapshots, since, until)
+            start = time.perf_counter()
+            read = sum(1 for _ in store.items(since, until))
+            store_seconds = time.perf_counter() - start
+            assert read == scanned, f"store read {read} items, scan found {scanned}"
+            print(
+                f"{name:<6} {read:7d} {len(store.partitions(since, until)):10d} "
+                f"{scan_seconds:7.2f}s {store_seconds:7.3f}s {scan_seconds / store_seconds:7.0f}x"
+            )
+
+        last_run, last_items = list(runs.items())[-1]
+        rerun = [{**item, "collected_at": datetime.now().isoformat()} for item in last_items]
+        start = time.perf_counter()
+        result = store.add_run("rerun", rerun)
+        print(
+            f"\nre-run of {last_run} ({result.rows} items): same as {result.copy_of}, "
+            f"{result.parts_written} parts written in {time.perf_counter() - start:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
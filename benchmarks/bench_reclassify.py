@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Measure how reclassification scales with worker processes.
+
+Writes a synthetic corpus of snapshot files (default 64 files of 5,000
+items, with labels that mostly disagree with the classifier) and runs a
+dry-run reclassification with 1, 2, 4, ... workers up to the CPU count,
+reporting throughput and speedup over one worker.
+
+Usage:
+    python benchmarks/bench_reclassify.py --files 64 --items-per-file 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reclassify import reclassify  # noqa: E402
+from synthetic import write_synthetic_file  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark multi-process reclassification")
+    parser.add_argument("--files", type=int, default=64, help="Snapshot files in the corpus")
+    parser.add_argument("--items-per-file", type=int, default=5_000, help="Items per file")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="Largest pool to try")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [
+            write_synthetic_file(Path(tmp) / f"feedback_{i:03d}.jsonl", args.items_per_file, seed=i)
+            for i in range(args.files)
+        ]
+        total = args.files * args.items_per_file
+        print(f"{total} items in {args.files} files, {os.cpu_count()} CPUs\n")
+
+        workers = 1
+        baseline = None
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            reports = reclassify(paths, workers=workers, dry_run=True, verbose=False)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            changed = sum(r.changed for r in reports)
+            print(
+                f"{workers:3d} workers  {elapsed:7.2f}s  {total / elapsed:9.0f} items/s  "
+                f"{baseline / elapsed:5.2f}x  ({changed} relabelled)"
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Throughput and peak memory of the single-file HTML renderer.
+
+Renders a synthetic history (default 1,000,000 items) with
+`generate_html` and with the renderer it replaced, which sorted whole
+items through the external sort and rendered them afterwards, parsing
+every timestamp and formatting every badge. Each renderer runs in its own
+subprocess so its peak RSS is measured in isolation, and both outputs
+must be identical apart from the time they were generated.
+
+Usage:
+    python benchmarks/bench_render.py --items 1000000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import zip_longest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_html import (  # noqa: E402
+    _ITEMS_MARKER,
+    HTML_TEMPLATE,
+    ITEM_PREFIX,
+    escape_html,
+    generate_html,
+    render_overview,
+    truncate_text,
+)
+from jsonl_io import count_jsonl, external_sort, iter_jsonl  # noqa: E402
+from synthetic import write_synthetic_file  # noqa: E402
+
+RENDERERS = ["previous", "streaming"]
+
+
+def previous_item(feedback: dict, number: int) -> str:
+    """One item as the previous renderer built it."""
+    time_str = datetime.fromisoformat(feedback["timestamp"]).strftime("%Y-%m-%d %H:%M")
+    title = escape_html(feedback["title"] or "(no title)")
+    product_badges = " ".join(
+        f'<span class="badge badge-{product}">{product}</span>' for product in feedback["products"]
+    )
+    source_badge = f'<span class="badge badge-{feedback["source"]}">{feedback["source"]}</span>'
+    categories = ", ".join(feedback["categories"])
+    sentiment_html = ""
+    if feedback["sentiment"]:
+        sentiment_html = f' | <span class="sentiment-{feedback["sentiment"]}">{feedback["sentiment"]}</span>'
+    text_html = ""
+    if feedback["text"]:
+        text_html = f'<div class="text">{escape_html(truncate_text(feedback["text"], 400))}</div>'
+    score_str = f"{feedback['score']} points" if feedback["score"] is not None else "0 points"
+    comments_str = f"{feedback['num_comments']} comments" if feedback["num_comments"] is not None else "0 comments"
+    return f"""{ITEM_PREFIX}{number}. <a href="{feedback["source_url"]}" target="_blank">{title}</a>
+            </div>
+            <div class="meta">
+                {product_badges} {source_badge} |
+                {score_str} | {comments_str} |
+                {time_str} |
+                <span class="category">{categories}</span>{sentiment_html}
+            </div>
+            {text_html}
+        </div>
+        """
+
+
+def previous_generate_html(input_file: Path, output_file: Path) -> None:
+    """The renderer `generate_html` replaced: sort whole items, then render them."""
+    head, tail = HTML_TEMPLATE.format(
+        overview_html=render_overview(count_jsonl(input_file)),
+        nav_html="",
+        search_html="",
+        trends_html="",
+        items_html=_ITEMS_MARKER,
+    ).split(_ITEMS_MARKER)
+    feedbacks = external_sort(iter_jsonl(input_file), key=lambda x: (x["timestamp"], x["id"]), reverse=True)
+    with output_file.open("w") as f:
+        f.write(head)
+        for i, feedback in enumerate(feedbacks, 1):
+            if i > 1:
+                f.write("\n")
+            f.write(previous_item(feedback, i))
+        f.write(tail)
+
+
+def same_html(first: Path, second: Path) -> bool:
+    """Whether two pages are identical apart from their "Last updated" times."""
+    with first.open() as a, second.open() as b:
+        return all(
+            line_a == line_b or "Last updated:" in (line_a or "") and "Last updated:" in (line_b or "")
+            for line_a, line_b in zip_longest(a, b)
+        )
+
+
+def run_renderer(renderer: str, input_file: Path, output_file: Path) -> dict:
+    """Render with one renderer in this process and report time and peak RSS."""
+    start = time.perf_counter()
+    if renderer == "previous":
+        previous_generate_html(input_file, output_file)
+    else:
+        generate_html(input_file, output_file)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"seconds": elapsed, "peak_rss_mb": peak_kb / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark single-file HTML rendering")
+    parser.add_argument("--items", type=int, default=1_000_000, help="Synthetic items to render")
+    parser.add_argument("--renderer", choices=RENDERERS, help=argparse.SUPPRESS)
+    parser.add_argument("--input", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--output", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.renderer:
+        result = run_renderer(args.renderer, Path(args.input), Path(args.output))
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = write_synthetic_file(Path(tmp) / "synthetic.jsonl", args.items)
+        print(f"{args.items:,} items, {input_file.stat().st_size / 1e6:,.0f} MB of JSONL\n")
+        results = {}
+        for renderer in RENDERERS:
+            output_file = Path(tmp) / f"{renderer}.html"
+            output = subprocess.run(
+                [sys.executable, __file__, "--renderer", renderer, "--input", str(input_file),
+                 "--output", str(output_file)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results[renderer] = result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"  {renderer:<10} {result['seconds']:7.1f} s  {args.items / result['seconds']:8.0f} items/s  "
+                f"peak RSS {result['peak_rss_mb']:6.0f} MB"
+            )
+        assert same_html(Path(tmp) / "previous.html", Path(tmp) / "streaming.html"), "renderers produced different HTML"
+        print(f"\nidentical output, {results['previous']['seconds'] / results['streaming']['seconds']:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
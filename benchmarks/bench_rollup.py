@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare trend queries on the rollup with recounting the raw JSONL.
+
+Writes N synthetic items (default 200,000, two years of history), counts
+them into a rollup, then times a year of weekly counts for a product and
+category both ways, plus an incremental sync of one day's new items.
+
+Usage:
+    python benchmarks/bench_rollup.py --items 200000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rollup import Rollups, item_day  # noqa: E402
+from synthetic import synthetic_records, write_synthetic_file  # noqa: E402
+
+SINCE = "2025-01-06"
+UNTIL = "2026-01-05"
+
+
+def recount(jsonl_path: Path, product: str, category: str) -> dict[str, int]:
+    """Weekly counts straight from the JSONL file."""
+    counts: Counter[str] = Counter()
+    with jsonl_path.open() as f:
+        for line in f:
+            item = json.loads(line)
+            day = item_day(item)
+            if SINCE <= day < UNTIL and product in item["products"] and category in item["categories"]:
+                monday = date.fromisoformat(day) - timedelta(days=date.fromisoformat(day).weekday())
+                counts[monday.isoformat()] += 1
+    return dict(sorted(counts.items()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark trend rollups")
+    parser.add_argument("--items", type=int, default=200_000, help="Synthetic items in the history")
+    parser.add_argument("--new-items", type=int, default=300, help="Items appended before the incremental sync")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl_path = write_synthetic_file(Path(tmp) / "feedback_all.jsonl", args.items)
+
+        with Rollups(Path(tmp) / "rollups.sqlite") as rollups:
+            start = time.perf_counter()
+            rollups.sync(jsonl_path)
+            print(f"initial sync:       {time.perf_counter() - start:8.3f}s  {args.items} items")
+            rows = rollups.conn.execute("SELECT COUNT(*) FROM daily").fetchone()[0]
+            size = Path(tmp, "rollups.sqlite").stat().st_size
+            print(f"rollup:             {rows} rows, {size / 1e6:.1f} MB "
+                  f"(JSONL {jsonl_path.stat().st_size / 1e6:.0f} MB)")
+
+            start = time.perf_counter()
+            expected = recount(jsonl_path, "claude", "onboarding")
+            print(f"recount from JSONL: {time.perf_counter() - start:8.3f}s")
+
+            start = time.perf_counter()
+            series = dict(rollups.series(product="claude", category="onboarding", since=SINCE, until=UNTIL, period="week"))
+            print(f"rollup query:       {time.perf_counter() - start:8.3f}s  ({len(series)} weeks, "
+                  f"{'matches' if series == expected else 'DIFFERS FROM'} the recount)")
+
+            with jsonl_path.open("a") as f:
+                for record in synthetic_records(args.new_items, seed=1):
+                    record["id"] += "_new"
+                    f.write(json.dumps(record) + "\n")
+            start = time.perf_counter()
+            added = rollups.sync(jsonl_path)
+            print(f"incremental sync:   {time.perf_counter() - start:8.3f}s  {added} items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Measure full-text search latency over a large synthetic history.
+
+Indexes N synthetic records (default 200,000, roughly fifty times the
+current history) whose text draws on a Zipf-distributed vocabulary, then
+times typical queries: rare and common words, phrases, filters only and
+filters combined with text. Reports p50/p99 latency per query.
+
+Usage:
+    python benchmarks/bench_search.py --items 200000
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from search import SearchIndex  # noqa: E402
+from synthetic import synthetic_records  # noqa: E402
+
+VOCABULARY = [f"word{i}" for i in range(50_000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+QUERIES = [
+    ("rare word", {"query": "word40000"}),
+    ("common word", {"query": "word3"}),
+    ("common word, recent first", {"query": "word3", "order": "recent"}),
+    ("two words", {"query": "word10 word200"}),
+    ("phrase", {"query": '"word1 word2"', "raw": True}),
+    ("phrase, recent first", {"query": '"word1 word2"', "raw": True, "order": "recent"}),
+    ("product filter", {"products": ["claude"]}),
+    ("product + category + time", {"products": ["claude"], "categories": ["onboarding"], "since": "2025-06-01"}),
+    ("text + filters", {"query": "word50", "products": ["chatgpt"], "sources": ["reddit"]}),
+]
+
+
+def records(count: int):
+    rng = random.Random(1)
+    for record in synthetic_records(count):
+        record["text"] = " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=rng.randint(20, 150)))
+        yield record
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the full-text search index")
+    parser.add_argument("--items", type=int, default=200_000, help="Synthetic items to index")
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, SearchIndex(Path(tmp) / "search.sqlite") as index:
+        start = time.perf_counter()
+        index.add(records(args.items))
+        index.conn.commit()
+        elapsed = time.perf_counter() - start
+        size = (Path(tmp) / "search.sqlite").stat().st_size
+        print(f"Indexed {args.items:,} items in {elapsed:.1f}s ({size / 1e6:.0f} MB)\n")
+
+        print(f"{'query':<28} {'results':>7} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, kwargs in QUERIES:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                results = index.search(**kwargs)
+                timings.append((time.perf_counter() - start) * 1000)
+            timings.sort()
+            p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+            print(f"{name:<28} {len(results):>7} {statistics.median(timings):>8.2f} {p99:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
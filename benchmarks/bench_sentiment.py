@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Measure sentiment scoring throughput.
+
+Scores a synthetic corpus (default 200,000 items) in batches of several
+sizes, reporting items per second for each against scoring one text at a
+time and checking that batching does not change any score.
+
+Usage:
+    python benchmarks/bench_sentiment.py --items 200000 --batch-sizes 64 1024 16384
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scraper import classification_text  # noqa: E402
+from sentiment import score_texts  # noqa: E402
+from synthetic import synthetic_records  # noqa: E402
+
+
+def score_in_batches(texts: list[str], batch_size: int) -> tuple[list[float], float]:
+    """Scores of all texts and the seconds taken, scoring `batch_size` at a time."""
+    scores: list[float] = []
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        scores += score_texts(texts[i:i + batch_size])
+    return scores, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batched sentiment scoring")
+    parser.add_argument("--items", type=int, default=200_000, help="Items in the corpus")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 1024, 16384], help="Batch sizes to try")
+    args = parser.parse_args()
+
+    texts = [
+        classification_text(record["id"], record["title"], record["text"])
+        for record in synthetic_records(args.items)
+    ]
+    print(f"{len(texts)} items, {sum(map(len, texts)) / 1e6:.1f} MB of text\n")
+    single_scores, single_seconds = score_in_batches(texts, 1)
+    print(f"batch {1:6d}  {len(texts) / single_seconds:9.0f} items/s")
+    for batch_size in args.batch_sizes:
+        scores, seconds = score_in_batches(texts, batch_size)
+        assert scores == single_scores, f"scores differ at batch size {batch_size}"
+        print(f"batch {batch_size:6d}  {len(texts) / seconds:9.0f} items/s  {single_seconds / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
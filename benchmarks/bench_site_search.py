@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Measure the size and build cost of the client-side search index.
+
+Builds the `search/` assets for N synthetic items (default 100,000), then
+reports their total size, the time to rebuild after a day's new items,
+and how much a browser downloads for typical searches: `search.js` looks
+words up in the directory, then reads only segments that can match,
+newest first, until it has a page of results.
+
+Usage:
+    python benchmarks/bench_site_search.py --items 100000
+"""
+
+import argparse
+import base64
+import gzip
+import itertools
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_html import RenderCache, write_search_index  # noqa: E402
+from site_search import SEARCH_DIR, tokens, word_bucket  # noqa: E402
+from synthetic import synthetic_records  # noqa: E402
+
+# Spread words over first letters like real text, since the word directory
+# is split by first character.
+VOCABULARY = [f"{chr(ord('a') + i % 26)}w{i}" for i in range(50_000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+RESULTS_PER_PAGE = 50
+
+QUERIES = [
+    ("common word", [VOCABULARY[3]], None),
+    ("two words", [VOCABULARY[10], VOCABULARY[200]], None),
+    ("rare word", [VOCABULARY[40_000]], None),
+    ("product filter", [], ("products", "claude")),
+    ("word + category", [VOCABULARY[50]], ("categories", "onboarding")),
+]
+
+
+def records(count: int) -> list[dict]:
+    rng = random.Random(1)
+    items = []
+    for record in synthetic_records(count):
+        record["text"] = " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=rng.randint(20, 150)))
+        items.append(record)
+    items.sort(key=lambda x: (x["timestamp"], x["id"]), reverse=True)
+    return items
+
+
+def oldest_first(items_newest_first: list[dict], hashes: dict[str, str]) -> list[tuple[dict, str]]:
+    """The `(item, hash)` pairs `write_search_index` takes."""
+    return [(item, hashes[item["id"]]) for item in reversed(items_newest_first)]
+
+
+def decode(postings: list[int] | str | None, count: int) -> set[int]:
+    if postings is None:
+        return set()
+    if isinstance(postings, str):
+        bits = base64.b64decode(postings)
+        return {i for i in range(count) if bits[i >> 3] >> (i & 7) & 1}
+    return set(itertools.accumulate(postings))
+
+
+def gzipped_size(path: Path) -> int:
+    return len(gzip.compress(path.read_bytes()))
+
+
+def query_download(search_dir: Path, words: list[str], label: tuple[str, str] | None) -> tuple[int, int, int]:
+    """Matches found, segments read and gzipped bytes fetched for one search."""
+    manifest = json.loads((search_dir / "manifest.json").read_text())
+    sealed = manifest["directory"]["segments"]
+    candidates = set(range(sealed))
+    fetched = 0
+    for word in words:
+        bucket_file = search_dir / f"words-{word_bucket(word)}.json"
+        fetched += gzipped_size(bucket_file)
+        candidates &= decode(json.loads(bucket_file.read_text())["tokens"].get(word), sealed)
+
+    matches = 0
+    segments_read = 0
+    for number in range(len(manifest["segments"]), 0, -1):
+        if matches >= RESULTS_PER_PAGE:
+            break
+        if number <= sealed and number - 1 not in candidates:
+            continue
+        index_file = search_dir / f"index-{number}.json"
+        index = json.loads(index_file.read_text())
+        fetched += gzipped_size(index_file)
+        segments_read += 1
+        found = set(range(index["count"]))
+        if label:
+            found &= decode(index["labels"][label[0]].get(label[1]), index["count"])
+        for word in words:
+            found &= decode(index["tokens"].get(word), index["count"])
+        if found and matches < RESULTS_PER_PAGE:
+            fetched += gzipped_size(search_dir / f"items-{number}.json")
+        matches += len(found)
+    return matches, segments_read, fetched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the client-side search index")
+    parser.add_argument("--items", type=int, default=100_000, help="Synthetic items in the history")
+    parser.add_argument("--new-items", type=int, default=100, help="Items added by the incremental run")
+    args = parser.parse_args()
+
+    items = records(args.items + args.new_items)
+    newest, history = items[:args.new_items], items[args.new_items:]
+    hashes = {item["id"]: str(hash(json.dumps(item))) for item in items}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp)
+        cache = RenderCache(output_dir / "cache.sqlite")
+
+        start = time.perf_counter()
+        built, total = write_search_index(oldest_first(history, hashes), output_dir, 100, cache)
+        print(f"full build:        {time.perf_counter() - start:6.2f}s  {built}/{total} segments")
+
+        # Newest items usually sort last, landing in the open segment.
+        start = time.perf_counter()
+        built, total = write_search_index(oldest_first(newest + history, hashes), output_dir, 100, cache)
+        print(f"incremental build: {time.perf_counter() - start:6.2f}s  {built}/{total} segments")
+        cache.close()
+
+        search_dir = output_dir / SEARCH_DIR
+        files = sorted(search_dir.glob("*.json"))
+        raw = sum(f.stat().st_size for f in files)
+        packed = sum(gzipped_size(f) for f in files)
+        print(f"assets:            {raw / 1e6:.1f} MB ({packed / 1e6:.1f} MB gzipped) in {len(files)} files, "
+              f"{packed / len(items):.0f} gzipped bytes per item")
+        average_words = sum(len(tokens(item)) for item in items[:1000]) / 1000
+        directory = sorted(search_dir.glob("words-*.json"))
+        print(f"indexed words:     {average_words:.0f} distinct per item, word directory "
+              f"{sum(gzipped_size(f) for f in directory) / 1e6:.1f} MB gzipped in {len(directory)} files")
+
+        print(f"\n{'query':<18} {'matches':>8} {'segments':>9} {'downloaded':>11}")
+        for name, words, label in QUERIES:
+            matches, segments_read, fetched = query_download(search_dir, words, label)
+            print(f"{name:<18} {matches:>8} {segments_read:>9} {fetched / 1024:>8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
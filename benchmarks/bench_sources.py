@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Run every registered source against the stub server.
+
+Serves HackerNews, Reddit and Twitter fixtures with a per-request
+latency, then reports how many recent-search requests Twitter needs at the
+endpoint's default and maximum page sizes, and compares running all
+sources one after another with running them concurrently through
+`stream_feedback`.
+
+Usage:
+    python benchmarks/bench_sources.py --tweets 2000 --latency 0.02
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scraper import REDDIT_SUBREDDITS, SOURCES, scrape_twitter, stream_feedback  # noqa: E402
+from stub_server import make_hn_fixture, make_reddit_fixture, make_twitter_fixture, serve  # noqa: E402
+
+LIMIT = 10_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the source registry against a stub server")
+    parser.add_argument("--tweets", type=int, default=2_000, help="Tweets in the Twitter fixture")
+    parser.add_argument("--stories", type=int, default=100, help="Stories in the HN fixture")
+    parser.add_argument("--latency", type=float, default=0.02, help="Per-request latency (s)")
+    args = parser.parse_args()
+
+    fixture = make_hn_fixture(num_stories=args.stories)
+    fixture["reddit"] = make_reddit_fixture(REDDIT_SUBREDDITS, posts_per_subreddit=250)
+    fixture["tweets"] = make_twitter_fixture(num_tweets=args.tweets)
+
+    with serve(fixture, latency=args.latency) as base_url:
+        options = {
+            "reddit": {"base_url": base_url},
+            "hackernews": {"base_url": f"{base_url}/v0"},
+            "twitter": {"base_url": f"{base_url}/2", "bearer_token": "stub", "max_pages": 1_000},
+        }
+
+        for page_size in (10, 100):
+            fixture["stats"].clear()
+            start = time.perf_counter()
+            items = list(scrape_twitter(limit=LIMIT, page_size=page_size, **options["twitter"]))
+            print(f"twitter, {page_size:3d} per page: {time.perf_counter() - start:6.2f}s  "
+                  f"{sum(fixture['stats'].values()):4d} requests, {len(items)} items")
+
+        print()
+        sequential = 0.0
+        for name in SOURCES:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                items = list(stream_feedback(limit=LIMIT, sources=[name], source_options=options))
+            elapsed = time.perf_counter() - start
+            sequential += elapsed
+            print(f"{name:<11} alone:     {elapsed:6.2f}s  {len(items)} items")
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            items = list(stream_feedback(limit=LIMIT, sources=list(SOURCES), source_options=options))
+        elapsed = time.perf_counter() - start
+        print(f"\none after another: {sequential:6.2f}s")
+        print(f"concurrently:      {elapsed:6.2f}s  {len(items)} items ({sequential / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Peak memory and wall time of in-memory vs streaming JSONL processing.
+
+Each mode runs in its own subprocess over the same synthetic file so its
+peak RSS is measured in isolation.
+
+Usage:
+    python benchmarks/bench_streaming_io.py --lines 2000000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from generate_html import generate_html  # noqa: E402
+from jsonl_io import external_sort, iter_jsonl  # noqa: E402
+from synthetic import write_synthetic_file  # noqa: E402
+
+MODES = ["sort-in-memory", "sort-external", "render-streaming"]
+
+
+def sort_key(item: dict) -> tuple[str, str]:
+    return item["timestamp"], item["id"]
+
+
+def run_mode(mode: str, input_file: Path, chunk_size: int) -> dict:
+    """Run one mode in this process and report time and peak RSS."""
+    start = time.perf_counter()
+    if mode == "sort-in-memory":
+        items = list(iter_jsonl(input_file))
+        items.sort(key=sort_key, reverse=True)
+        count = sum(1 for _ in items)
+    elif mode == "sort-external":
+        count = sum(1 for _ in external_sort(iter_jsonl(input_file), sort_key, True, chunk_size))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_html(input_file, Path(tmp) / "index.html")
+        count = None
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"mode": mode, "items": count, "seconds": elapsed, "peak_rss_mb": peak_kb / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark streaming JSONL I/O")
+    parser.add_argument("--lines", type=int, default=2_000_000, help="Synthetic records")
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="External sort run size")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--input", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, Path(args.input), args.chunk_size)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = write_synthetic_file(Path(tmp) / "synthetic.jsonl", args.lines)
+        size_mb = input_file.stat().st_size / 1e6
+        print(f"Synthetic file: {args.lines:,} lines, {size_mb:,.0f} MB")
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--input", str(input_file),
+                 "--chunk-size", str(args.chunk_size)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"  {mode:<17} {result['seconds']:8.1f} s  peak RSS {result['peak_rss_mb']:8.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
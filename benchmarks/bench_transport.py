@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Exercise the shared transport against a fault-injecting stub server.
+
+Runs both scrapers against the stub without faults to get the expected
+items, then with injected 500s, 429s (with `Retry-After`) and dropped
+connections, once without retries and once with the default retry policy
+(backoff shortened to keep the run quick). Reports items lost, retries,
+throttling waits and connection reuse for each run.
+
+Usage:
+    python benchmarks/bench_transport.py --stories 200 --fault-rate 0.1
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scraper import REDDIT_SUBREDDITS, scrape_hackernews, scrape_reddit  # noqa: E402
+from stub_server import make_hn_fixture, make_reddit_fixture, serve  # noqa: E402
+from transport import Transport  # noqa: E402
+
+
+def run(base_url: str, transport: Transport) -> tuple[float, set[str]]:
+    start = time.perf_counter()
+    try:
+        ids = {f.id for f in scrape_reddit(limit=10_000, base_url=base_url, transport=transport)}
+        ids |= {f.id for f in scrape_hackernews(limit=10_000, base_url=f"{base_url}/v0", transport=transport)}
+    finally:
+        transport.close()
+    return time.perf_counter() - start, ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark retries and pooling under injected faults")
+    parser.add_argument("--stories", type=int, default=200, help="Stories in the HN fixture")
+    parser.add_argument("--fault-rate", type=float, default=0.1, help="Share of requests that fail")
+    parser.add_argument("--latency", type=float, default=0.005, help="Per-request latency (s)")
+    args = parser.parse_args()
+
+    fixture = make_hn_fixture(num_stories=args.stories)
+    fixture["reddit"] = make_reddit_fixture(REDDIT_SUBREDDITS, posts_per_subreddit=250)
+
+    with serve(fixture, latency=args.latency) as base_url:
+        _, expected = run(base_url, Transport())
+        print(f"Fault-free run: {len(expected)} items, server replies {dict(fixture['stats'])}")
+
+        fixture["faults"].update({
+            "error_rate": args.fault_rate * 0.5,
+            "throttle_rate": args.fault_rate * 0.3,
+            "drop_rate": args.fault_rate * 0.2,
+            "retry_after": 0.05,
+        })
+        for name, transport in [
+            ("no retries", Transport(retries=0)),
+            ("with retries", Transport(backoff=0.02)),
+        ]:
+            fixture["stats"].clear()
+            elapsed, ids = run(base_url, transport)
+            print(f"\n{name:<13} {elapsed:6.2f}s  {len(ids)} items, {len(expected - ids)} lost")
+            print(f"  server replies {dict(fixture['stats'])}")
+            print(f"  {transport.stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
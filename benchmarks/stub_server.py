@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Local stand-in for the HackerNews, Reddit and Twitter APIs used by the benchmarks.
+
+Serves `/v0/newstories.json`, `/v0/item/<id>.json`,
+`/r/<subreddit>/new.json` (paged with `limit` and `after`) and
+`/2/tweets/search/recent` (paged with `max_results` and `next_token`,
+filtered by `since_id`, requiring a bearer token) from an in-memory fixture with a configurable per-request latency, so scrapers can
+be exercised end to end without touching the network. Responses carry an
+`ETag` and honour `If-None-Match`; response status counts are kept in
+`fixture["stats"]`.
+
+Faults can be injected through `fixture["faults"]`: `error_rate` (500
+replies), `throttle_rate` (429 replies with `Retry-After: retry_after`) and
+`drop_rate` (connections closed without a reply), drawn from a generator
+seeded with `seed`. Dropped connections are counted as status 0.
+"""
+
+import hashlib
+import itertools
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+BASE_TIME = 1_760_000_000
+
+
+def make_hn_fixture(
+    num_stories: int = 500,
+    kids_per_story: int = 10,
+    relevant_every: int = 7,
+    depth: int = 1,
+    replies_per_comment: int = 3,
+    busy_every: int = 4,
+) -> dict:
+    """Build a deterministic set of HN stories and their comment trees.
+
+    Each story has `kids_per_story` top-level comments. With `depth` above
+    1, comments get replies down to that many levels: `replies_per_comment`
+    each in every `busy_every`-th thread, one each elsewhere. Replies in
+    relevant stories mention UX problems more often than elsewhere.
+    """
+    items = {}
+    story_ids = []
+    comment_ids = itertools.count(10_000_000)
+
+    def add_comments(parent: int, i: int, level: int, count: int, relevant_story: bool) -> list[int]:
+        kids = []
+        for j in range(count):
+            comment_id = next(comment_ids)
+            kids.append(comment_id)
+            if level == 1:
+                relevant = (i + j) % relevant_every == 0
+            else:
+                relevant = (j % 2 == 0) if relevant_story else (comment_id % relevant_every == 0)
+            text = (
+                f"ChatGPT error message was unclear for me ({i}.{j})"
+                if relevant
+                else f"Nice work on this ({i}.{j})"
+            )
+            items[comment_id] = {
+                "id": comment_id,
+                "by": f"user{j}",
+                "time": BASE_TIME + i * 60 + j,
+                "text": text,
+                "parent": parent,
+                "type": "comment",
+            }
+            if level < depth:
+                replies = replies_per_comment if i % busy_every == 0 else 1
+                reply_ids = add_comments(comment_id, i, level + 1, replies, relevant_story)
+                if reply_ids:
+                    items[comment_id]["kids"] = reply_ids
+        return kids
+
+    for i in range(num_stories):
+        story_id = 1_000_000 + num_stories - i
+        story_ids.append(story_id)
+        relevant = i % relevant_every == 0
+        title = (
+            f"Claude's onboarding is confusing #{i}"
+            if relevant
+            else f"Show HN: A static site generator #{i}"
+        )
+
+        before = len(items)
+        kids = add_comments(story_id, i, 1, kids_per_story, relevant)
+        items[story_id] = {
+            "id": story_id,
+            "by": f"poster{i}",
+            "time": BASE_TIME + i * 60,
+            "title": title,
+            "text": "",
+            "score": i % 50,
+            "descendants": len(items) - before,
+            "kids": kids,
+            "type": "story",
+        }
+
+    return {"newstories": story_ids, "items": items, "reddit": {}, "tweets": []}
+
+
+def make_reddit_fixture(subreddits: list[str], posts_per_subreddit: int = 25, relevant_every: int = 3) -> dict:
+    """Build `/r/<subreddit>/new.json` listings, newest post first."""
+    listings = {}
+    for s, subreddit in enumerate(subreddits):
+        children = []
+        for i in range(posts_per_subreddit):
+            post_id = f"{s:02d}{posts_per_subreddit - i:05d}"
+            relevant = i % relevant_every == 0
+            children.append({"kind": "t3", "data": {
+                "id": post_id,
+                "name": f"t3_{post_id}",
+                "title": f"Claude answer was confusing ({subreddit} {i})" if relevant else f"Weekend thread {i}",
+                "selftext": "",
+                "author": f"redditor{i}",
+                "permalink": f"/r/{subreddit}/comments/{post_id}/",
+                "created_utc": BASE_TIME + (posts_per_subreddit - i) * 60,
+                "score": i,
+                "num_comments": i % 7,
+            }})
+        listings[subreddit] = children
+    return listings
+
+
+def make_twitter_fixture(num_tweets: int = 1000, relevant_every: int = 4) -> list[dict]:
+    """Build recent-search results, newest tweet first, with their authors."""
+    tweets = []
+    for i in range(num_tweets):
+        tweet_id = str(1_900_000_000_000_000_000 + num_tweets - i)
+        relevant = i % relevant_every == 0
+        tweets.append({
+            "id": tweet_id,
+            "text": f"Gemini's interface is confusing when switching models ({i})" if relevant else f"Good morning ({i})",
+            "author_id": str(500 + i % 50),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(BASE_TIME + (num_tweets - i) * 30)),
+            "public_metrics": {"like_count": i % 40, "reply_count": i % 6, "retweet_count": 0, "quote_count": 0},
+        })
+    return tweets
+
+
+def _make_handler(fixture: dict, latency: float) -> type[BaseHTTPRequestHandler]:
+    stats = fixture.setdefault("stats", Counter())
+    fixture.setdefault("reddit", {})
+    fixture.setdefault("tweets", [])
+    faults = fixture.setdefault("faults", {})
+    rng = random.Random(faults.get("seed", 0))
+    lock = threading.Lock()
+
+    def draw_fault() -> str | None:
+        with lock:
+            roll = rng.random()
+        for fault in ("error", "throttle", "drop"):
+            rate = faults.get(f"{fault}_rate", 0.0)
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            if latency:
+                time.sleep(latency)
+
+            fault = draw_fault()
+            if fault == "drop":
+                self._count(0)
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_RDWR)
+                return
+            if fault:
+                status = 500 if fault == "error" else 429
+                self._count(status)
+                self.send_response(status)
+                if fault == "throttle":
+                    self.send_header("Retry-After", str(faults.get("retry_after", 1)))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            path, _, query = self.path.partition("?")
+            if path == "/v0/newstories.json":
+                self._send_json(fixture["newstories"])
+            elif path.startswith("/v0/item/") and path.endswith(".json"):
+                item_id = int(path[len("/v0/item/"):-len(".json")])
+                self._send_json(fixture["items"].get(item_id))
+            elif path.startswith("/r/") and path.endswith("/new.json"):
+                subreddit = path[len("/r/"):-len("/new.json")]
+                params = parse_qs(query)
+                children = fixture["reddit"].get(subreddit, [])
+                names = [child["data"]["name"] for child in children]
+                after = params.get("after", [None])[0]
+                start = names.index(after) + 1 if after in names else 0
+                page_size = int(params.get("limit", ["25"])[0])
+                page = children[start:start + page_size]
+                more = start + page_size < len(children)
+                self._send_json({
+                    "kind": "Listing",
+                    "data": {"children": page, "after": page[-1]["data"]["name"] if more else None},
+                })
+            elif path == "/2/tweets/search/recent":
+                self._search_tweets(parse_qs(query))
+            else:
+                self._count(404)
+                self.send_error(404)
+
+        def _search_tweets(self, params: dict[str, list[str]]) -> None:
+            if not self.headers.get("Authorization", "").startswith("Bearer "):
+                self._count(401)
+                self.send_error(401)
+                return
+            page_size = int(params.get("max_results", ["10"])[0])
+            if not 10 <= page_size <= 100 or "query" not in params:
+                self._count(400)
+                self.send_error(400)
+                return
+            tweets = fixture["tweets"]
+            since_id = params.get("since_id", [None])[0]
+            if since_id:
+                tweets = [tweet for tweet in tweets if int(tweet["id"]) > int(since_id)]
+            start = int(params.get("next_token", ["0"])[0])
+            page = tweets[start:start + page_size]
+            meta: dict = {"result_count": len(page)}
+            if page:
+                meta.update(newest_id=page[0]["id"], oldest_id=page[-1]["id"])
+            if start + page_size < len(tweets):
+                meta["next_token"] = str(start + page_size)
+            authors = sorted({tweet["author_id"] for tweet in page})
+            payload: dict = {"meta": meta}
+            if page:
+                payload["data"] = page
+                payload["includes"] = {"users": [{"id": author, "username": f"poster{author}"} for author in authors]}
+            self._send_json(payload)
+
+        def _count(self, status: int) -> None:
+            with lock:
+                stats[status] += 1
+
+        def _send_json(self, payload: object) -> None:
+            body = json.dumps(payload).encode()
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self._count(304)
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self._count(200)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return StubHandler
+
+
+@contextmanager
+def serve(fixture: dict, latency: float = 0.0) -> Iterator[str]:
+    """Run the stub server in a background thread and yield its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(fixture, latency))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address
+        yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Synthetic feedback records in the JSONL schema written by Feedback.to_dict."""
+
+import json
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PRODUCTS = ["claude", "chatgpt", "gemini", "copilot", "perplexity", "grok"]
+CATEGORIES = [
+    "naming_terminology", "feature_discovery", "error_messages", "tone",
+    "content_clarity", "onboarding", "navigation", "response_quality",
+]
+WORDS = (
+    "the claude chatgpt gemini answer was confusing and the error message "
+    "did not make sense onboarding flow menu output verbose tone robotic "
+    "great helpful response quality new user interface design"
+).split()
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def synthetic_records(count: int, seed: int = 0, text_words: int = 40) -> Iterator[dict]:
+    """Yield `count` feedback dicts with shuffled timestamps."""
+    rng = random.Random(seed)
+    for i in range(count):
+        source = "reddit" if i % 5 == 0 else "hackernews"
+        timestamp = START + timedelta(seconds=rng.randint(0, 2 * 365 * 86400))
+        products = sorted(rng.sample(PRODUCTS, rng.randint(1, 2)), key=PRODUCTS.index)
+        categories = sorted(rng.sample(CATEGORIES, rng.randint(1, 3)), key=CATEGORIES.index)
+        yield {
+            "id": f"{'reddit' if source == 'reddit' else 'hn_story'}_{i}",
+            "source": source,
+            "source_url": f"https://example.com/item?id={i}",
+            "title": " ".join(rng.choices(WORDS, k=8)),
+            "text": " ".join(rng.choices(WORDS, k=text_words)),
+            "author": f"user{rng.randint(0, 50_000)}",
+            "timestamp": timestamp.isoformat(),
+            "score": rng.randint(0, 500) if source == "reddit" else None,
+            "num_comments": rng.randint(0, 200),
+            "products": products,
+            "categories": categories,
+            "sentiment": None,
+            "collected_at": (timestamp + timedelta(hours=rng.randint(1, 48))).isoformat(),
+            "processed": False,
+        }
+
+
+def write_synthetic_file(path: Path, count: int, seed: int = 0) -> Path:
+    """Write `count` synthetic records to a JSONL file."""
+    with path.open("w") as f:
+        for record in synthetic_records(count, seed):
+            f.write(json.dumps(record) + "\n")
+    return path
@@ -1,16 +1,54 @@
 #!/usr/bin/env python3
-"""Main collection script - runs daily to collect feedback and generate HTML."""
+"""Main collection script - runs daily to collect feedback and generate HTML.
 
+Each run's items are stored in the date-partitioned store under `data/`
+(see `partitions`). Every run appends a report of where its time went
+(per-source fetching, classification, dedup, storage, indexing and
+rendering) to `run_reports.jsonl`; `--profile PATH` also writes a cProfile
+dump.
+"""
+
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
-from scraper import collect_feedback
-from generate_html import generate_html
+from scraper import STATE_DIR, source_state_options, stream_feedback
+from generate_html import RENDER_CACHE_FILE, generate_html_from_store, generate_paginated_html
+from dedup import DEDUP_INDEX_FILE, DuplicateIndex
+from http_cache import CACHE_DIR, HttpCache
+from instrument import REPORT_FILE, RunReport, load_history, profiled, recording, regressions, timed
+from partitions import DATA_DIR, PartitionedStore
+from rollup import ROLLUP_FILE, Rollups
+from search import SEARCH_INDEX_FILE, SearchIndex
+from store import CUMULATIVE_FILE, FeedbackStore
+
+# Cached HTTP responses not reused for this long are dropped before each run.
+HTTP_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
 
+def main(profile_path: Path | None = None) -> None:
+    """Run daily collection and HTML generation, recording a run report.
 
-def main() -> None:
-    """Run daily collection and HTML generation."""
+    The report is appended to `REPORT_FILE` even if the run fails. With a
+    `profile_path`, the whole run is profiled and the stats dumped there.
+    """
     output_dir = Path(__file__).parent
+    report = RunReport("collect")
+    try:
+        with recording(report), profiled(profile_path):
+            collect(output_dir)
+    finally:
+        report_file = output_dir / REPORT_FILE
+        report.append_to(report_file)
+        print(f"\n⏱️  Stage timings (appended to {report_file.name}):\n{report.summary()}")
+        for stage, seconds, median in regressions(load_history(report_file)):
+            print(f"⚠️  {stage} took {seconds:.2f}s, {seconds / median:.1f}x its median of {median:.2f}s")
+        if profile_path:
+            print(f"🔬 Profile written to {profile_path} (python -m pstats {profile_path})")
+
+
+def collect(output_dir: Path) -> None:
+    """Collect today's feedback into `output_dir` and regenerate the HTML views."""
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     date = datetime.now().strftime("%Y-%m-%d")
 
@@ -19,62 +57,102 @@ def main() -> None:
     print(f"Date: {date}")
     print("=" * 60)
 
-    # Collect feedback
-    output_file = output_dir / f"feedback_{timestamp}.jsonl"
-    feedback = collect_feedback(limit=100, output_path=output_file)
-
-    if not feedback:
+    # Collect feedback, writing each item to the run's incoming file and
+    # appending new ones to the cumulative file as the scrapers yield them.
+    # Near-duplicates of items already seen (cross-posts, reposts) are
+    # clustered with them and left out of the cumulative file. Runs left
+    # incoming by an interrupted collection are stored first.
+    partitioned = PartitionedStore(output_dir / DATA_DIR)
+    for result in partitioned.add_incoming():
+        print(f"📦 Stored {result.rows} items from interrupted run {result.run}")
+    output_file = partitioned.incoming_path(timestamp)
+    cumulative_file = output_dir / CUMULATIVE_FILE
+    http_cache = HttpCache(output_dir / CACHE_DIR)
+    http_cache.prune(max_age=HTTP_CACHE_MAX_AGE)
+    collected = 0
+
+    def collected_items() -> Iterator[dict]:
+        nonlocal collected
+        for item in stream_feedback(
+            limit=100,
+            output_path=output_file,
+            cache=http_cache,
+            source_options=source_state_options(output_dir / STATE_DIR),
+        ):
+            collected += 1
+            yield item.to_dict()
+
+    with FeedbackStore(cumulative_file) as store, DuplicateIndex(output_dir / DEDUP_INDEX_FILE) as duplicates:
+        with timed("dedup:sync") as counts:
+            counts["items"] = duplicates.sync(cumulative_file)
+        new_count = store.append(duplicates.unique(collected_items()))
+        total_items = len(store)
+        near_duplicates = duplicates.duplicates
+
+    if not collected:
+        output_file.unlink(missing_ok=True)
         print("\n⚠️  No feedback collected today")
         return
 
-    # Append to cumulative file
-    cumulative_file = output_dir / "feedback_all.jsonl"
-    print(f"\n📝 Appending {len(feedback)} items to cumulative file...")
-
-    # Read existing IDs to avoid duplicates
-    existing_ids = set()
-    if cumulative_file.exists():
-        with cumulative_file.open() as f:
-            import json
-            for line in f:
-                if line.strip():
-                    try:
-                        item = json.loads(line)
-                        existing_ids.add(item["id"])
-                    except json.JSONDecodeError:
-                        continue
-
-    # Append only new items
-    new_count = 0
-    with cumulative_file.open("a") as f:
-        import json
-        for item in feedback:
-            if item.id not in existing_ids:
-                f.write(json.dumps(item.to_dict()) + "\n")
-                new_count += 1
-
-    print(f"  ✓ Added {new_count} new items (skipped {len(feedback) - new_count} duplicates)")
-
-    # Generate main HTML
+    # Move the run into its date partitions
+    with timed("partitions") as counts:
+        stored = partitioned.add_run_file(output_file, timestamp)
+        output_file.unlink()
+        counts["items"] = stored.rows
+        counts["parts_written"] = stored.parts_written
+    if stored.copy_of:
+        print(f"🗂️  Run {timestamp} collected the same items as {stored.copy_of}; nothing new stored")
+    else:
+        print(
+            f"🗂️  Stored {stored.rows} items in {stored.parts_written} partitions "
+            f"({stored.parts_reused} unchanged partitions skipped)"
+        )
+
+    print(
+        f"\n📝 Added {new_count} new items to {cumulative_file.name} "
+        f"(skipped {collected - new_count} duplicates, {near_duplicates} of them near-duplicates)"
+    )
+
+    # Index new items for full-text search
+    with timed("search_index") as counts, SearchIndex(output_dir / SEARCH_INDEX_FILE) as search_index:
+        indexed = counts["items"] = search_index.sync(cumulative_file)
+    print(f"🔎 Indexed {indexed} items for search ({output_dir / SEARCH_INDEX_FILE})")
+
+    # Count new items into the daily trend rollups and generate main HTML
     print("\n🎨 Generating HTML views...")
-    generate_html(cumulative_file, output_dir / "index.html")
+    with Rollups(output_dir / ROLLUP_FILE) as rollups:
+        with timed("rollups") as counts:
+            counts["items"] = rollups.sync(cumulative_file)
+        with timed("render") as counts:
+            counts["files_written"] = generate_paginated_html(
+                cumulative_file,
+                output_dir,
+                cache_path=output_dir / RENDER_CACHE_FILE,
+                rollups=rollups,
+            )
 
     # Generate today's HTML
-    generate_html(output_file, output_dir / f"today_{date}.html")
+    with timed("render:today"):
+        generate_html_from_store(partitioned, output_dir / f"today_{date}.html", run=timestamp)
 
     # Stats
     print("\n" + "=" * 60)
     print("📊 Collection Complete!")
     print("=" * 60)
 
-    total_lines = sum(1 for _ in cumulative_file.open())
-    print(f"  Total items (all time): {total_lines}")
+    print(f"  Total items (all time): {total_items}")
     print(f"  New items today: {new_count}")
     print(f"\n📁 Files:")
-    print(f"  - Today's data: {output_file}")
+    print(f"  - Today's data: {partitioned.root} (run {timestamp})")
     print(f"  - All data: {cumulative_file}")
-    print(f"  - Main HTML: {output_dir / 'index.html'}")
+    print(f"  - Main HTML: {output_dir / 'index.html'} (archive pages in {output_dir / 'pages'})")
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Collect today's feedback and regenerate the HTML views")
+    parser.add_argument("--profile", type=str, help="Write a cProfile dump of the run to this file")
+    args = parser.parse_args()
+
+    main(Path(args.profile) if args.profile else None)
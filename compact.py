@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Memory-lean feedback records for bulk processing.
+
+`CompactFeedback` holds the same data as `Feedback` but with `products`
+and `categories` packed into integer bitmasks, timestamps as integer
+epoch microseconds and repeated strings shared, which makes it a good
+fit for reprocessing the full history in memory. It converts directly
+to and from the JSONL schema written by `Feedback.to_dict`.
+
+Bitmask bits follow the order the keyword extractors emit labels in, so
+decoded lists match what the scraper would have written.
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from scraper import (
+    CATEGORY_KEYWORDS,
+    PRODUCT_KEYWORDS,
+    AIProduct,
+    Feedback,
+    FeedbackCategory,
+    FeedbackSource,
+)
+
+
+def _in_extraction_order(extracted: list, enum_type: type) -> list:
+    """Extractor order first, then any remaining members (fallback values last)."""
+    return extracted + [member for member in enum_type if member not in extracted]
+
+
+PRODUCT_ORDER: list[AIProduct] = _in_extraction_order(
+    [product for product, _ in PRODUCT_KEYWORDS], AIProduct
+)
+CATEGORY_ORDER: list[FeedbackCategory] = _in_extraction_order(
+    [category for category, _ in CATEGORY_KEYWORDS], FeedbackCategory
+)
+
+PRODUCT_BITS: dict[str, int] = {p.value: 1 << i for i, p in enumerate(PRODUCT_ORDER)}
+CATEGORY_BITS: dict[str, int] = {c.value: 1 << i for i, c in enumerate(CATEGORY_ORDER)}
+
+_SOURCES: dict[str, str] = {s.value: s.value for s in FeedbackSource}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+_decode_cache: dict[tuple[int, bool], list[str]] = {}
+
+
+def encode_labels(values: list[str], bits: dict[str, int]) -> int:
+    """Pack label values into a bitmask."""
+    mask = 0
+    for value in values:
+        mask |= bits[value]
+    return mask
+
+
+def decode_labels(mask: int, categories: bool = False) -> list[str]:
+    """Unpack a product (or category) bitmask into label values."""
+    key = (mask, categories)
+    if key not in _decode_cache:
+        order = CATEGORY_ORDER if categories else PRODUCT_ORDER
+        _decode_cache[key] = [member.value for i, member in enumerate(order) if mask >> i & 1]
+    return list(_decode_cache[key])
+
+
+def to_micros(value: str) -> int:
+    """Epoch microseconds for an ISO timestamp."""
+    return (datetime.fromisoformat(value) - _EPOCH) // _ONE_MICROSECOND
+
+
+def from_micros(micros: int) -> str:
+    """UTC ISO timestamp for epoch microseconds."""
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+@dataclass(slots=True)
+class CompactFeedback:
+    """A feedback record packed for bulk processing."""
+    id: str
+    source: str
+    source_url: str
+    title: str | None
+    text: str
+    author: str | None
+    timestamp: int
+    score: int | None
+    num_comments: int | None
+    products: int
+    categories: int
+    sentiment: str | None
+    collected_at: int
+    processed: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactFeedback":
+        """Build a record from a `Feedback.to_dict` dictionary."""
+        sentiment = data["sentiment"]
+        return cls(
+            id=data["id"],
+            source=_SOURCES[data["source"]],
+            source_url=data["source_url"],
+            title=data["title"],
+            text=data["text"],
+            author=data["author"],
+            timestamp=to_micros(data["timestamp"]),
+            score=data["score"],
+            num_comments=data["num_comments"],
+            products=encode_labels(data["products"], PRODUCT_BITS),
+            categories=encode_labels(data["categories"], CATEGORY_BITS),
+            sentiment=sys.intern(sentiment) if sentiment else sentiment,
+            collected_at=to_micros(data["collected_at"]),
+            processed=data.get("processed", False),
+        )
+
+    @classmethod
+    def from_json(cls, line: str | bytes) -> "CompactFeedback":
+        """Build a record from one JSONL line."""
+        return cls.from_dict(json.loads(line))
+
+    @classmethod
+    def from_feedback(cls, feedback: Feedback) -> "CompactFeedback":
+        """Pack a `Feedback` instance."""
+        return cls.from_dict(feedback.to_dict())
+
+    def to_dict(self) -> dict:
+        """Convert to the JSONL schema written by `Feedback.to_dict`."""
+        return {
+            "id": self.id,
+            "source": self.source,
+            "source_url": self.source_url,
+            "title": self.title,
+            "text": self.text,
+            "author": self.author,
+            "timestamp": from_micros(self.timestamp),
+            "score": self.score,
+            "num_comments": self.num_comments,
+            "products": decode_labels(self.products),
+            "categories": decode_labels(self.categories, categories=True),
+            "sentiment": self.sentiment,
+            "collected_at": from_micros(self.collected_at),
+            "processed": self.processed,
+        }
+
+    def to_json(self) -> str:
+        """Serialize to one JSONL line (without the trailing newline)."""
+        return json.dumps(self.to_dict())
+
+    def to_feedback(self) -> Feedback:
+        """Unpack into a full `Feedback` instance."""
+        return Feedback.from_dict(self.to_dict())
+
+    def has_product(self, product: AIProduct) -> bool:
+        """True if the record mentions the product."""
+        return bool(self.products & PRODUCT_BITS[product.value])
+
+    def has_category(self, category: FeedbackCategory) -> bool:
+        """True if the record is labelled with the category."""
+        return bool(self.categories & CATEGORY_BITS[category.value])
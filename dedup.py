@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Near-duplicate detection for collected feedback.
+
+Each item's title and text are reduced to a set of word unigrams and
+bigrams and summarised by a MinHash signature of `SIGNATURE_SIZE` values;
+the share of equal values estimates the Jaccard similarity of two items.
+Items estimated at least `MIN_SIMILARITY` alike are treated as the same
+post (cross-posts, reposts, the same link submitted to several sites).
+
+Signatures are split into `BANDS` bands whose hashes are indexed in
+SQLite, so a lookup only compares against items sharing a whole band -
+which, by the pigeonhole principle, includes every item that differs in
+fewer than `BANDS` signature values.
+
+Every item is assigned to a cluster named after the first item of it that
+was indexed. `DuplicateIndex.unique` passes through only those cluster
+representatives, so collection can skip reposts of items already stored.
+Run `python dedup.py rebuild` to (re)index the cumulative JSONL file.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import struct
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from instrument import record
+from store import is_rewritten, set_indexed_size
+
+DEDUP_INDEX_FILE = "dedup_index.sqlite"
+
+SIGNATURE_SIZE = 16
+BANDS = 4
+# Items agreeing on 13 of 16 signature values always share a band.
+MIN_SIMILARITY = 13 / 16
+# Texts with fewer features than this are too short to call duplicates.
+MIN_FEATURES = 8
+
+_WORD_RE = re.compile(r"\w+")
+# One 64-byte BLAKE2b digest supplies all sixteen 32-bit hash functions.
+_DIGEST = struct.Struct(f"<{SIGNATURE_SIZE}I")
+_BAND_SIZE = SIGNATURE_SIZE // BANDS * 4
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    signature BLOB,
+    cluster TEXT NOT NULL,
+    {", ".join(f"b{band} INTEGER" for band in range(BANDS))}
+);
+{"".join(f"CREATE INDEX IF NOT EXISTS items_b{band} ON items (b{band});" for band in range(BANDS))}
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_INSERT = (
+    f"INSERT INTO items (id, signature, cluster, {', '.join(f'b{band}' for band in range(BANDS))}) "
+    f"VALUES (?, ?, ?, {', '.join('?' * BANDS)})"
+)
+_CANDIDATES = f"SELECT signature, cluster FROM items WHERE {' OR '.join(f'b{band} = ?' for band in range(BANDS))}"
+
+
+# =============================================================================
+# Signatures
+# =============================================================================
+
+def features(text: str) -> set[str]:
+    """Lowercased words and word bigrams of a text."""
+    words = _WORD_RE.findall(text.lower())
+    return {*words, *(f"{a} {b}" for a, b in zip(words, words[1:]))}
+
+
+def minhash(feature_set: Iterable[str]) -> bytes:
+    """MinHash signature of a set of features, packed as little-endian uint32s."""
+    rows = [
+        _DIGEST.unpack(hashlib.blake2b(feature.encode(), digest_size=_DIGEST.size).digest())
+        for feature in feature_set
+    ]
+    return _DIGEST.pack(*map(min, zip(*rows)))
+
+
+def signature(item: dict) -> bytes | None:
+    """Signature of an item's title and text, or None if the text is too short."""
+    feature_set = features(f"{item.get('title') or ''}\n\n{item.get('text') or ''}")
+    if len(feature_set) < MIN_FEATURES:
+        return None
+    return minhash(feature_set)
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(_DIGEST.unpack(a), _DIGEST.unpack(b))) / SIGNATURE_SIZE
+
+
+def _bands(signature_value: bytes) -> list[int]:
+    return [
+        int.from_bytes(
+            hashlib.blake2b(signature_value[start:start + _BAND_SIZE], digest_size=8).digest(),
+            "little",
+            signed=True,
+        )
+        for start in range(0, len(signature_value), _BAND_SIZE)
+    ]
+
+
+# =============================================================================
+# Persistent index
+# =============================================================================
+
+class DuplicateIndex:
+    """SQLite index of item signatures and duplicate clusters."""
+
+    def __init__(self, path: Path, min_similarity: float = MIN_SIMILARITY):
+        if min_similarity < MIN_SIMILARITY:
+            raise ValueError(f"min_similarity below {MIN_SIMILARITY} would miss matches outside shared bands")
+        self.path = path
+        self.min_similarity = min_similarity
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self.duplicates = 0
+
+    def __enter__(self) -> "DuplicateIndex":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commit and close the index database."""
+        self.conn.commit()
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def cluster_of(self, item_id: str) -> str | None:
+        """Cluster an indexed item belongs to."""
+        row = self.conn.execute("SELECT cluster FROM items WHERE id = ?", (item_id,)).fetchone()
+        return row[0] if row else None
+
+    def members(self, cluster: str) -> list[str]:
+        """IDs of every item in a cluster, representative first."""
+        rows = self.conn.execute(
+            "SELECT id FROM items WHERE cluster = ? ORDER BY id = ? DESC, rowid", (cluster, cluster)
+        )
+        return [row[0] for row in rows]
+
+    def nearest(self, signature_value: bytes) -> tuple[str, float] | None:
+        """Cluster and similarity of the most similar indexed item, if similar enough."""
+        best = None
+        for stored, cluster in self.conn.execute(_CANDIDATES, _bands(signature_value)):
+            score = similarity(stored, signature_value)
+            if score >= self.min_similarity and (best is None or score > best[1]):
+                best = (cluster, score)
+        return best
+
+    def add(self, item: dict) -> str:
+        """Index an item and return its cluster (its own ID if it is new)."""
+        cluster = self.cluster_of(item["id"])
+        if cluster is not None:
+            return cluster
+
+        value = signature(item)
+        match = self.nearest(value) if value is not None else None
+        cluster = match[0] if match else item["id"]
+        if match:
+            self.duplicates += 1
+
+        self.insert(item["id"], value, cluster)
+        return cluster
+
+    def insert(self, item_id: str, signature_value: bytes | None, cluster: str) -> None:
+        """Store a signature without looking for duplicates."""
+        bands = _bands(signature_value) if signature_value is not None else [None] * BANDS
+        self.conn.execute(_INSERT, (item_id, signature_value, cluster, *bands))
+
+    def unique(self, items: Iterable[dict]) -> Iterator[dict]:
+        """Index items, yielding only those that are not near-duplicates."""
+        try:
+            for item in items:
+                start = time.perf_counter()
+                unique = self.add(item) == item["id"]
+                record("dedup", time.perf_counter() - start, items=1, duplicates=int(not unique))
+                if unique:
+                    yield item
+        finally:
+            self.conn.commit()
+
+    @property
+    def indexed_size(self) -> int:
+        """Number of bytes of the synced JSONL file covered by the index."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'indexed_size'").fetchone()
+        return int(row[0]) if row else 0
+
+    def sync(self, jsonl_path: Path) -> int:
+        """Index lines appended to a JSONL file since the last sync.
+
+        Lets the index catch up with history it has not seen (e.g. the first
+        time it is used). If the file was rewritten, every signature is
+        dropped and the index rebuilt from scratch. Returns the number of
+        newly indexed items.
+        """
+        if not jsonl_path.exists():
+            return 0
+
+        start = self.indexed_size
+        if is_rewritten(self.conn, jsonl_path, start):
+            self.conn.execute("DELETE FROM items")
+            start = 0
+
+        before = len(self)
+        with jsonl_path.open("rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        item = None
+                    if item is not None:
+                        self.add(item)
+                offset += len(line)
+
+        set_indexed_size(self.conn, jsonl_path, offset)
+        self.conn.commit()
+        return len(self) - before
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from store import CUMULATIVE_FILE
+
+    parser = argparse.ArgumentParser(description="Manage the near-duplicate index")
+    parser.add_argument("command", choices=["rebuild", "stats"], help="Action to run")
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Data directory")
+    args = parser.parse_args()
+
+    data_dir = Path(args.dir)
+    if args.command == "rebuild":
+        (data_dir / DEDUP_INDEX_FILE).unlink(missing_ok=True)
+
+    with DuplicateIndex(data_dir / DEDUP_INDEX_FILE) as index:
+        if args.command == "rebuild":
+            print(f"🔁 Rebuilding {DEDUP_INDEX_FILE} from {CUMULATIVE_FILE}...")
+            index.sync(data_dir / CUMULATIVE_FILE)
+        clusters = index.conn.execute(
+            "SELECT COUNT(*) FROM (SELECT cluster FROM items GROUP BY cluster HAVING COUNT(*) > 1)"
+        ).fetchone()[0]
+        duplicates = index.conn.execute("SELECT COUNT(*) FROM items WHERE cluster != id").fetchone()[0]
+        print(f"📊 {len(index)} items indexed, {duplicates} near-duplicates in {clusters} clusters")
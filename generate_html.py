@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
 """Generate an HN-style HTML view of collected feedback."""
 
+import functools
+import hashlib
+import itertools
 import json
-from datetime import datetime
+import os
+import sqlite3
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+from instrument import record
+from jsonl_io import external_sort, iter_jsonl
+from partitions import DATA_DIR, PartitionedStore
+from rollup import ROLLUP_FILE, Rollups
+from site_search import SEARCH_DIR, SEARCH_JS, SEGMENT_SIZE, build_segment, build_word_directory, segment_key
+
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
@@ -44,6 +59,14 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             margin-bottom: 10px;
             border: 1px solid #828282;
         }}
+        .filters input, .filters select {{
+            font-family: inherit;
+            font-size: 9pt;
+            margin-right: 6px;
+        }}
+        .filters input {{
+            width: 35%;
+        }}
         .item {{
             padding: 3px 0;
             margin-bottom: 5px;
@@ -98,11 +121,15 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         .badge-unknown {{ background-color: #999; color: white; }}
         .badge-reddit {{ background-color: #ff4500; color: white; }}
         .badge-hackernews {{ background-color: #ff6600; color: white; }}
+        .badge-twitter {{ background-color: #000; color: white; }}
         .category {{
             font-size: 8pt;
             color: #666;
             font-style: italic;
         }}
+        .sentiment-positive {{ color: #2e7d32; }}
+        .sentiment-negative {{ color: #c62828; }}
+        .sentiment-neutral {{ color: #828282; }}
         .stats {{
             background-color: white;
             padding: 10px;
@@ -113,6 +140,35 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             margin-top: 0;
             color: #000;
         }}
+        .trends {{
+            border-collapse: collapse;
+            font-size: 8pt;
+            margin-top: 10px;
+        }}
+        .trends th, .trends td {{
+            padding: 2px 5px;
+            text-align: right;
+            color: #000;
+        }}
+        .trends th:first-child {{
+            text-align: left;
+        }}
+        .nav {{
+            font-size: 8pt;
+            padding: 5px 0;
+            margin-bottom: 10px;
+        }}
+        .nav a {{
+            color: #000;
+            text-decoration: none;
+        }}
+        .nav a:hover {{
+            text-decoration: underline;
+        }}
+        .nav .current {{
+            font-weight: bold;
+            color: #ff6600;
+        }}
     </style>
 </head>
 <body>
@@ -124,13 +180,21 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         <div class="stats">
             <h3>Overview</h3>
             <p>
-                <strong>{total_items}</strong> items collected |
-                Last updated: {last_updated}
+                {overview_html}
             </p>
+            {trends_html}
         </div>
 
+        {search_html}
+
+        <div id="feed">
+        {nav_html}
+
         {items_html}
 
+        {nav_html}
+        </div>
+
         <div style="padding: 20px; text-align: center; color: #828282; font-size: 8pt;">
             Generated from AI Product Feedback Collection System
         </div>
@@ -140,17 +204,42 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 """
 
 
+_ITEMS_MARKER = "\x00items\x00"
+TREND_WEEKS = 12
+
+
+@functools.cache
+def _badge(name: str) -> str:
+    return f'<span class="badge badge-{name}">{name}</span>'
+
+
+@functools.cache
+def _product_badges(products: tuple[str, ...]) -> str:
+    return " ".join(map(_badge, products))
+
+
 def get_product_badges(products: list[str]) -> str:
-    """Generate HTML badges for products."""
-    badges = []
-    for product in products:
-        badges.append(f'<span class="badge badge-{product}">{product}</span>')
-    return " ".join(badges)
+    """Generate HTML badges for products.
+
+    The few product combinations are formatted once and reused.
+    """
+    return _product_badges(tuple(products))
 
 
 def get_source_badge(source: str) -> str:
     """Generate HTML badge for source."""
-    return f'<span class="badge badge-{source}">{source}</span>'
+    return _badge(source)
+
+
+def format_time(timestamp: str) -> str:
+    """Format an ISO timestamp as "YYYY-MM-DD HH:MM" in its own timezone.
+
+    Timestamps already in extended ISO form (all the scrapers write) are
+    sliced instead of parsed; anything else goes through `fromisoformat`.
+    """
+    if len(timestamp) >= 16 and timestamp[10] in "T " and timestamp[4] == timestamp[7] == "-" and timestamp[13] == ":":
+        return f"{timestamp[:10]} {timestamp[11:16]}"
+    return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
 
 
 def truncate_text(text: str, max_length: int = 500) -> str:
@@ -162,6 +251,9 @@ def truncate_text(text: str, max_length: int = 500) -> str:
 
 def escape_html(text: str) -> str:
     """Escape HTML special characters."""
+    # Four str.replace scans are much faster than one str.translate or
+    # regex pass: each is a C loop that returns the text as is if the
+    # character is absent, while translate does a mapping lookup per character.
     return (
         text
         .replace("&", "&amp;")
@@ -171,85 +263,690 @@ def escape_html(text: str) -> str:
     )
 
 
-def generate_html(input_file: Path, output_file: Path, show_text: bool = True) -> None:
-    """Generate an HN-style HTML view of feedback."""
-    # Load feedback
-    feedbacks = []
-    with input_file.open() as f:
-        for line in f:
-            if line.strip():
-                feedbacks.append(json.loads(line))
-
-    # Sort by timestamp (newest first)
-    feedbacks.sort(key=lambda x: x["timestamp"], reverse=True)
-
-    # Generate HTML for each item
-    items_html = []
-    for i, feedback in enumerate(feedbacks, 1):
-        timestamp = datetime.fromisoformat(feedback["timestamp"])
-        time_str = timestamp.strftime("%Y-%m-%d %H:%M")
-
-        title = escape_html(feedback["title"] or "(no title)")
-        url = feedback["source_url"]
-
-        product_badges = get_product_badges(feedback["products"])
-        source_badge = get_source_badge(feedback["source"])
-        categories = ", ".join(feedback["categories"])
-
-        text_html = ""
-        if show_text and feedback["text"]:
-            text_preview = escape_html(truncate_text(feedback["text"], 400))
-            text_html = f'<div class="text">{text_preview}</div>'
-
-        score_str = (
-            f"{feedback['score']} points"
-            if feedback["score"] is not None
-            else "0 points"
-        )
-        comments_str = (
-            f"{feedback['num_comments']} comments"
-            if feedback["num_comments"] is not None
-            else "0 comments"
-        )
-
-        item_html = f"""
+ITEM_PREFIX = """
         <div class="item">
             <div class="title">
-                {i}. <a href="{url}" target="_blank">{title}</a>
+                """
+
+
+def render_item_body(feedback: dict, show_text: bool = True) -> str:
+    """Render everything in an item after its rank number.
+
+    Kept separate from the number so the fragment can be cached and reused
+    when an item's rank changes.
+    """
+    time_str = format_time(feedback["timestamp"])
+
+    title = escape_html(feedback["title"] or "(no title)")
+    url = feedback["source_url"]
+
+    product_badges = get_product_badges(feedback["products"])
+    source_badge = get_source_badge(feedback["source"])
+    categories = ", ".join(feedback["categories"])
+    sentiment_html = ""
+    if feedback["sentiment"]:
+        sentiment_html = f' | <span class="sentiment-{feedback["sentiment"]}">{feedback["sentiment"]}</span>'
+
+    text_html = ""
+    if show_text and feedback["text"]:
+        text_preview = escape_html(truncate_text(feedback["text"], 400))
+        text_html = f'<div class="text">{text_preview}</div>'
+
+    score_str = (
+        f"{feedback['score']} points"
+        if feedback["score"] is not None
+        else "0 points"
+    )
+    comments_str = (
+        f"{feedback['num_comments']} comments"
+        if feedback["num_comments"] is not None
+        else "0 comments"
+    )
+
+    return f""". <a href="{url}" target="_blank">{title}</a>
             </div>
             <div class="meta">
                 {product_badges} {source_badge} |
                 {score_str} | {comments_str} |
                 {time_str} |
-                <span class="category">{categories}</span>
+                <span class="category">{categories}</span>{sentiment_html}
             </div>
             {text_html}
         </div>
         """
-        items_html.append(item_html)
 
-    # Generate final HTML
-    html = HTML_TEMPLATE.format(
-        total_items=len(feedbacks),
-        last_updated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+
+def render_item(feedback: dict, number: int, show_text: bool = True) -> str:
+    """Render one feedback item as HTML."""
+    return f"{ITEM_PREFIX}{number}{render_item_body(feedback, show_text)}"
+
+
+def render_overview(total_items: int, last_updated: str | None = None) -> str:
+    """Render the default Overview line."""
+    if last_updated is None:
+        last_updated = datetime.now().strftime("%Y-%m-%d %H:%M")
+    return f"""<strong>{total_items}</strong> items collected |
+                Last updated: {last_updated}"""
+
+
+def render_trends(rollups: Rollups, product: str | None = None, category: str | None = None, weeks: int = TREND_WEEKS) -> str:
+    """Render weekly item counts for the last `weeks` weeks as shaded tables.
+
+    Without a product or category there is one row per product and one per
+    category; for a product the rows are its categories and vice versa.
+    """
+    last_day = rollups.last_day()
+    if last_day is None:
+        return ""
+    # Weeks start on Monday; the last column is the week of the newest item.
+    last = date.fromisoformat(last_day)
+    until = last + timedelta(days=7 - last.weekday())
+    since = until - timedelta(weeks=weeks)
+    mondays = [(since + timedelta(weeks=i)).isoformat() for i in range(weeks)]
+
+    def table(title: str, dimension: str) -> str:
+        labels = rollups.breakdown(dimension, product=product, category=category, since=since, until=until)
+        rows = [("All", product, category)] + [
+            (label, label if dimension == "product" else product, label if dimension == "category" else category)
+            for label in labels
+        ]
+        series = [
+            dict(rollups.series(product=p, category=c, since=since, until=until, period="week"))
+            for _, p, c in rows
+        ]
+        peak = max((count for counts in series[1:] for count in counts.values()), default=0) or 1
+        header = "".join(f"<th>{monday[5:]}</th>" for monday in mondays)
+        body = []
+        for (label, _, _), counts in zip(rows, series):
+            cells = []
+            for monday in mondays:
+                count = counts.get(monday, 0)
+                shade = f' style="background-color: rgba(255, 102, 0, {min(count / peak, 1):.2f})"' if count and label != "All" else ""
+                cells.append(f"<td{shade}>{count or ''}</td>")
+            body.append(f"<tr><th>{escape_html(label)}</th>{''.join(cells)}</tr>")
+        return (
+            f'<table class="trends"><tr><th>{title} per week</th>{header}</tr>'
+            + "".join(body)
+            + "</table>"
+        )
+
+    tables = []
+    if product is None:
+        tables.append(table("Products", "product"))
+    if category is None:
+        tables.append(table("Categories", "category"))
+    return "\n            ".join(tables)
+
+
+def render_page(
+    items_html: list[str],
+    overview_html: str,
+    nav_html: str = "",
+    search_html: str = "",
+    trends_html: str = "",
+) -> str:
+    """Wrap rendered items in the page template."""
+    return HTML_TEMPLATE.format(
+        overview_html=overview_html,
+        nav_html=nav_html,
+        search_html=search_html,
+        trends_html=trends_html,
         items_html="\n".join(items_html),
     )
 
-    # Write to file
-    output_file.write_text(html)
+
+def generate_html(input_file: Path, output_file: Path, show_text: bool = True) -> int:
+    """Generate an HN-style HTML view of feedback.
+
+    See `write_html`. Returns the number of items rendered.
+    """
+    return write_html(iter_jsonl(input_file), output_file, show_text)
+
+
+def generate_html_from_store(
+    store: PartitionedStore,
+    output_file: Path,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+    run: str | None = None,
+    show_text: bool = True,
+) -> int:
+    """Generate an HN-style HTML view of the items a partitioned store holds.
+
+    Only the partitions overlapping `since`..`until` are read; with `run`,
+    only that run's items are shown. Returns the number of items rendered.
+    """
+    return write_html(store.items(since, until, run), output_file, show_text)
+
+
+def write_html(feedbacks: Iterable[dict], output_file: Path, show_text: bool = True) -> int:
+    """Render feedback newest first into one HTML file, streaming.
+
+    Each item is rendered as it is read, and only its sort key and HTML go
+    through the external merge sort, so no item is decoded twice and
+    memory stays bounded for any input size. Items are written to the file
+    as the merge yields them. Returns the number of items rendered.
+    """
+    total_items = 0
+
+    def fragments() -> Iterator[dict]:
+        nonlocal total_items
+        for feedback in feedbacks:
+            total_items += 1
+            yield {
+                "timestamp": feedback["timestamp"],
+                "id": feedback["id"],
+                "html": render_item_body(feedback, show_text),
+            }
+
+    # Sort by timestamp (newest first), ties broken by ID for stable output
+    ordered = external_sort(fragments(), key=lambda x: (x["timestamp"], x["id"]), reverse=True)
+    # The sort reads every item before yielding the first, so the total is known
+    first = next(ordered, None)
+
+    head, tail = HTML_TEMPLATE.format(
+        overview_html=render_overview(total_items),
+        nav_html="",
+        search_html="",
+        trends_html="",
+        items_html=_ITEMS_MARKER,
+    ).split(_ITEMS_MARKER)
+
+    with output_file.open("w") as f:
+        f.write(head)
+        if first is not None:
+            f.write(f"{ITEM_PREFIX}1{first['html']}")
+            for i, fragment in enumerate(ordered, 2):
+                f.write(f"\n{ITEM_PREFIX}{i}{fragment['html']}")
+        f.write(tail)
+
     print(f"✓ Generated HTML: {output_file}")
+    return total_items
+
+
+# =============================================================================
+# Paginated output
+# =============================================================================
+
+PAGES_DIR = "pages"
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass
+class Section:
+    """A group of items rendered as its own set of pages."""
+    name: str
+    label: str
+    landing: str
+    total: int = 0
+    # Latest `collected_at` of its items
+    last_collected: str | None = None
+
+
+def item_sections(item: dict) -> list[str]:
+    """Names of the sections an item is listed in."""
+    return [
+        "all",
+        *(f"product-{product}" for product in dict.fromkeys(item["products"])),
+        *(f"category-{category}" for category in dict.fromkeys(item["categories"])),
+    ]
+
+
+def page_count(total: int, page_size: int) -> int:
+    """Number of archive pages for `total` items."""
+    return -(-total // page_size)
+
+
+def _link(from_file: str, to_file: str) -> str:
+    return os.path.relpath(to_file, os.path.dirname(from_file) or ".").replace(os.sep, "/")
+
+
+def _page_file(section: Section, page: int) -> str:
+    return f"{PAGES_DIR}/{section.name}-{page}.html"
+
+
+def render_nav(current_file: str, section: Section, sections: list[Section], page: int | None, num_pages: int) -> str:
+    """Render section links plus newer/older links for one page."""
+    section_links = []
+    for other in sections:
+        if other is section:
+            section_links.append(f'<span class="current">{other.label}</span>')
+        else:
+            section_links.append(f'<a href="{_link(current_file, other.landing)}">{other.label}</a>')
+
+    # Pages are numbered oldest first, so "newer" is the next page up.
+    paging = []
+    if page is None:
+        if num_pages:
+            paging.append(f'<a href="{_link(current_file, _page_file(section, num_pages))}">Browse pages →</a>')
+    else:
+        paging.append(f'<a href="{_link(current_file, section.landing)}">Latest</a>')
+        if page < num_pages:
+            paging.append(f'<a href="{_link(current_file, _page_file(section, page + 1))}">← Newer</a>')
+        paging.append(f'<span class="current">Page {page}</span>')
+        if page > 1:
+            paging.append(f'<a href="{_link(current_file, _page_file(section, page - 1))}">Older →</a>')
+
+    return (
+        '<div class="nav">'
+        + " | ".join(section_links)
+        + "<br>"
+        + " | ".join(paging)
+        + "</div>"
+    )
+
+
+def build_sections(totals: dict[str, int], last_collected: dict[str, str]) -> list[Section]:
+    """The all-items section plus one per product and category seen in `totals`.
+
+    `totals` and `last_collected` are keyed by the names `item_sections`
+    gives.
+    """
+    def section(name: str, label: str, landing: str) -> Section:
+        return Section(name, label, landing, totals.get(name, 0), last_collected.get(name))
+
+    sections = [section("all", "All", "index.html")]
+    for kind in ("product", "category"):
+        for name in sorted(name for name in totals if name.startswith(f"{kind}-")):
+            sections.append(section(name, name.partition("-")[2], f"{PAGES_DIR}/{name}.html"))
+    return sections
+
+
+def render_search_box(current_file: str, sections: list[Section], sources: list[str]) -> str:
+    """Render the search and filter controls driven by `search.js`.
+
+    The controls stay hidden until the script runs, so pages read the same
+    without JavaScript.
+    """
+    def options(label: str, values: list[str]) -> str:
+        return f'<option value="">{label}</option>' + "".join(
+            f'<option value="{escape_html(value)}">{escape_html(value)}</option>' for value in values
+        )
+
+    products = [section.label for section in sections if section.name.startswith("product-")]
+    categories = [section.label for section in sections if section.name.startswith("category-")]
+    root = _link(current_file, ".") + "/"
+    return f"""<div class="filters" id="search" data-root="{root}" hidden>
+            <input type="search" id="search-query" placeholder="Search titles and text" aria-label="Search">
+            <select id="search-product" aria-label="Product">{options("All products", products)}</select>
+            <select id="search-category" aria-label="Category">{options("All categories", categories)}</select>
+            <select id="search-source" aria-label="Source">{options("All sources", sources)}</select>
+            <span id="search-status"></span>
+        </div>
+        <div id="search-results" hidden></div>
+        <script src="{_link(current_file, f"{SEARCH_DIR}/search.js")}" defer></script>"""
+
+
+class RenderCache:
+    """Rendered item fragments and page keys from previous runs.
+
+    Fragments are keyed by feedback ID and a hash of the item's JSON line,
+    so an item is only re-rendered when it is new or its data changed.
+    Pages are keyed by a hash of everything that goes into them, so a page
+    whose inputs did not change is neither rendered nor written. With no
+    path the cache lives in memory for a single run.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.conn = sqlite3.connect(str(path) if path else ":memory:")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS fragments (
+                id TEXT PRIMARY KEY, hash TEXT NOT NULL, html TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                file TEXT PRIMARY KEY, key TEXT NOT NULL
+            );
+        """)
+        self.rendered = 0
+        self.reused = 0
+
+    def close(self) -> None:
+        """Persist and close the cache."""
+        self.conn.commit()
+        self.conn.close()
+
+    def fragment(self, item: dict, item_hash: str, show_text: bool) -> str:
+        """Return the rendered body of an item, rendering it only if needed."""
+        key = f"{item_hash}:{int(show_text)}"
+        row = self.conn.execute(
+            "SELECT hash, html FROM fragments WHERE id = ?", (item["id"],)
+        ).fetchone()
+        if row and row[0] == key:
+            self.reused += 1
+            return row[1]
+
+        html = render_item_body(item, show_text)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO fragments (id, hash, html) VALUES (?, ?, ?)",
+            (item["id"], key, html),
+        )
+        self.rendered += 1
+        return html
+
+    def page_unchanged(self, output_file: Path, page_key: str) -> bool:
+        """True if the page exists and was last written from the same inputs."""
+        row = self.conn.execute("SELECT key FROM pages WHERE file = ?", (str(output_file),)).fetchone()
+        return row is not None and row[0] == page_key and output_file.exists()
+
+    def page_written(self, output_file: Path, page_key: str) -> None:
+        """Record the inputs a page was written from."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pages (file, key) VALUES (?, ?)",
+            (str(output_file), page_key),
+        )
+
+
+RENDER_CACHE_FILE = ".render_cache.sqlite"
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text() == text:
+        return False
+    path.write_text(text)
+    return True
+
+
+def write_search_index(
+    items_oldest_first: Iterable[tuple[dict, str]],
+    output_dir: Path,
+    page_size: int,
+    cache: RenderCache,
+) -> tuple[int, int]:
+    """Write the client-side search assets described in `site_search`.
+
+    Takes `(item, line hash)` pairs oldest first and holds one segment of
+    them at a time. Segments whose items did not change since the last run
+    are skipped. Returns the number of segments built and the total number
+    of segments.
+    """
+    search_dir = output_dir / SEARCH_DIR
+    search_dir.mkdir(parents=True, exist_ok=True)
+    pairs = iter(items_oldest_first)
+
+    segments = []
+    built = 0
+    for number in itertools.count(1):
+        segment = list(itertools.islice(pairs, SEGMENT_SIZE))
+        if not segment:
+            break
+        items = [item for item, _ in segment]
+        key = segment_key(items, {item["id"]: item_hash for item, item_hash in segment})
+        index_file = search_dir / f"index-{number}.json"
+        items_file = search_dir / f"items-{number}.json"
+        if not (cache.page_unchanged(index_file, key) and items_file.exists()):
+            index, results = build_segment(items)
+            _write_if_changed(index_file, json.dumps(index, separators=(",", ":"), ensure_ascii=False))
+            _write_if_changed(items_file, json.dumps(results, separators=(",", ":"), ensure_ascii=False))
+            cache.page_written(index_file, key)
+            built += 1
+        segments.append({"count": len(items), "version": key[:12]})
+
+    # Segments past the end only exist if the history was rewritten shorter.
+    for stale in [*search_dir.glob("index-*.json"), *search_dir.glob("items-*.json")]:
+        if int(stale.stem.split("-")[1]) > len(segments):
+            stale.unlink()
+
+    # The word directory covers full segments only, so it changes when one fills up.
+    sealed = [segment for segment in segments if segment["count"] == SEGMENT_SIZE]
+    directory_key = "\0".join(segment["version"] for segment in sealed)
+    directory = {
+        "segments": len(sealed),
+        "version": hashlib.blake2b(directory_key.encode(), digest_size=6).hexdigest(),
+    }
+    manifest_file = search_dir / "manifest.json"
+    previous = json.loads(manifest_file.read_text()) if manifest_file.exists() else {}
+    if previous.get("directory") != directory:
+        for stale in search_dir.glob("words-*.json"):
+            stale.unlink()
+        index_files = [search_dir / f"index-{number}.json" for number in range(1, len(sealed) + 1)]
+        for bucket, words in build_word_directory(index_files).items():
+            (search_dir / f"words-{bucket}.json").write_text(
+                json.dumps({"tokens": words}, separators=(",", ":"), ensure_ascii=False)
+            )
+
+    manifest = {"segment_size": SEGMENT_SIZE, "page_size": page_size, "directory": directory, "segments": segments}
+    _write_if_changed(manifest_file, json.dumps(manifest, indent=2) + "\n")
+    _write_if_changed(search_dir / "search.js", SEARCH_JS)
+    return built, len(segments)
+
+
+def _line_hash(line: bytes) -> str:
+    return hashlib.blake2b(line.strip(), digest_size=12).hexdigest()
+
+
+def _last_collected(collected_at: Iterable[str | None]) -> str:
+    latest = max(filter(None, collected_at), default=None)
+    if latest is None:
+        return "never"
+    return format_time(latest)
+
+
+def generate_paginated_html(
+    input_file: Path,
+    output_dir: Path,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    show_text: bool = True,
+    cache_path: Path | None = None,
+    rollups: Rollups | None = None,
+) -> int:
+    """Generate a paginated site: landing pages plus fixed-size archive pages.
+
+    `index.html` in `output_dir` shows the newest `page_size` items. Every
+    section (all items, each product, each category) also gets a landing
+    page and archive pages under `pages/`. Items are numbered oldest first
+    and archive page 1 of a section holds its oldest `page_size` items, so
+    new items only change the last page and never shift existing ones;
+    each page lists its items newest first. Every page gets a search box
+    backed by the client-side index in `search/` (see `site_search`).
+    With `rollups`, landing pages also show weekly trends from the rollup
+    tables instead of recounting the items.
+
+    Memory stays bounded for any history: one pass counts the sections
+    while feeding the items to the external merge sort, then the sorted
+    items stream oldest first into one page per section and one search
+    segment at a time, and each page is written as soon as it is full.
+
+    Pages only depend on their items, so with a persistent `cache_path`
+    a run re-renders just the new or changed items and rewrites just the
+    pages they land on. Returns the number of files written.
+    """
+    start = time.perf_counter()
+    totals: dict[str, int] = {}
+    last_collected: dict[str, str] = {}
+    source_names: set[str] = set()
+
+    def entries() -> Iterator[dict]:
+        with input_file.open("rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                source_names.add(item["source"])
+                for name in item_sections(item):
+                    totals[name] = totals.get(name, 0) + 1
+                    if item["collected_at"] and item["collected_at"] > last_collected.get(name, ""):
+                        last_collected[name] = item["collected_at"]
+                yield {"timestamp": item["timestamp"], "id": item["id"], "hash": _line_hash(line), "item": item}
+
+    ordered = external_sort(entries(), key=lambda x: (x["timestamp"], x["id"]))
+    # The sort reads every item before yielding the first, so the sections are known
+    first = next(ordered, None)
+    sections = build_sections(totals, last_collected)
+    by_name = {section.name: section for section in sections}
+    sources = sorted(source_names)
+    loaded = time.perf_counter()
+    record("render:load", loaded - start, items=totals.get("all", 0))
+    (output_dir / PAGES_DIR).mkdir(parents=True, exist_ok=True)
+    cache = RenderCache(cache_path)
+
+    def write_page(
+        page_file: str,
+        numbered: list[tuple[int, dict, str]],
+        overview_html: str,
+        nav_html: str,
+        trends_html: str = "",
+    ) -> bool:
+        output_file = output_dir / page_file
+        search_html = render_search_box(page_file, sections, sources)
+        key_source = "\0".join(
+            [overview_html, nav_html, search_html, trends_html, str(show_text)]
+            + [f"{number}:{item['id']}:{item_hash}" for number, item, item_hash in numbered]
+        )
+        page_key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        if cache.page_unchanged(output_file, page_key):
+            return False
+
+        items_html = [
+            f"{ITEM_PREFIX}{number}{cache.fragment(item, item_hash, show_text)}"
+            for number, item, item_hash in numbered
+        ]
+        _write_if_changed(output_file, render_page(items_html, overview_html, nav_html, search_html, trends_html))
+        cache.page_written(output_file, page_key)
+        return True
+
+    def write_archive_page(section: Section, page_number: int, oldest_first: list[tuple[int, dict, str]]) -> bool:
+        page_file = _page_file(section, page_number)
+        page = oldest_first[::-1]
+        # Archive pages only mention their own items so they stay
+        # byte-identical until one of those items changes.
+        overview = (
+            f"Items <strong>#{page[-1][0]}-#{page[0][0]}</strong> of {section.label} |\n"
+            f"                Last updated: {_last_collected(item['collected_at'] for _, item, _ in page)}"
+        )
+        nav = render_nav(page_file, section, sections, page_number, page_count(section.total, page_size))
+        return write_page(page_file, page, overview, nav)
+
+    def write_landing_page(section: Section, newest: list[tuple[int, dict, str]]) -> bool:
+        overview = render_overview(section.total, _last_collected([section.last_collected]))
+        nav = render_nav(section.landing, section, sections, None, page_count(section.total, page_size))
+        trends = ""
+        if rollups is not None:
+            kind, _, label = section.name.partition("-")
+            trends = render_trends(
+                rollups,
+                product=label if kind == "product" else None,
+                category=label if kind == "category" else None,
+            )
+        return write_page(section.landing, newest, overview, nav, trends)
+
+    written = 0
+    page_seconds = 0.0
+
+    def paged() -> Iterator[tuple[dict, str]]:
+        """Fill each section's pages from the sorted items, passing the items on to the search index."""
+        nonlocal written, page_seconds
+        # Per section: the archive page being filled and the newest items, oldest first
+        filling: dict[str, list[tuple[int, dict, str]]] = {section.name: [] for section in sections}
+        newest: dict[str, deque] = {section.name: deque(maxlen=page_size) for section in sections}
+        counts: dict[str, int] = dict.fromkeys(filling, 0)
+
+        for entry in itertools.chain([first] if first is not None else [], ordered):
+            page_start = time.perf_counter()
+            item, item_hash = entry["item"], entry["hash"]
+            for name in item_sections(item):
+                counts[name] += 1
+                numbered = (counts[name], item, item_hash)
+                filling[name].append(numbered)
+                newest[name].append(numbered)
+                if len(filling[name]) == page_size:
+                    written += write_archive_page(by_name[name], counts[name] // page_size, filling[name])
+                    filling[name] = []
+            page_seconds += time.perf_counter() - page_start
+            yield item, item_hash
+
+        page_start = time.perf_counter()
+        for section in sections:
+            if filling[section.name]:
+                written += write_archive_page(section, page_count(section.total, page_size), filling[section.name])
+            written += write_landing_page(section, list(reversed(newest[section.name])))
+        page_seconds += time.perf_counter() - page_start
+
+    try:
+        segments_built, total_segments = write_search_index(paged(), output_dir, page_size, cache)
+        total_pages = sum(1 + page_count(section.total, page_size) for section in sections)
+        record(
+            "render:pages",
+            page_seconds,
+            items_rendered=cache.rendered,
+            items_reused=cache.reused,
+            pages_written=written,
+            pages=total_pages,
+        )
+        record(
+            "render:search",
+            time.perf_counter() - loaded - page_seconds,
+            segments_built=segments_built,
+            segments=total_segments,
+        )
+    finally:
+        cache.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"✓ Generated HTML in {output_dir}: rendered {cache.rendered} of {totals.get('all', 0)} items "
+        f"(reused {cache.reused} cached), wrote {written} of {total_pages} pages "
+        f"and {segments_built} of {total_segments} search segments in {elapsed:.2f}s"
+    )
+    return written
 
 
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Generate HTML from feedback JSONL")
-    parser.add_argument("input", type=str, help="Input JSONL file")
+    parser.add_argument("input", type=str, nargs="?", help="Input JSONL file")
     parser.add_argument("--output", type=str, help="Output HTML file")
+    parser.add_argument(
+        "--data", type=str,
+        help=f"Read a partitioned store (e.g. ./{DATA_DIR}) instead of an input file",
+    )
+    parser.add_argument("--since", type=str, help="With --data, earliest timestamp to show (ISO date or time, UTC)")
+    parser.add_argument("--until", type=str, help="With --data, timestamp to stop before (ISO date or time, UTC)")
+    parser.add_argument("--run", type=str, help="With --data, only this collection run's items")
     parser.add_argument("--no-text", action="store_true", help="Hide preview text")
+    parser.add_argument(
+        "--paginate", action="store_true",
+        help="Write a paginated site into the --output directory instead of one file",
+    )
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Items per page")
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help=f"With --paginate, reuse {RENDER_CACHE_FILE} in the output directory between runs",
+    )
+    parser.add_argument(
+        "--trends", action="store_true",
+        help=f"With --paginate, show weekly trends from {ROLLUP_FILE} next to the input file",
+    )
     args = parser.parse_args()
 
+    if args.data:
+        data_path = Path(args.data)
+        output_path = Path(args.output) if args.output else data_path / "feedback.html"
+        generate_html_from_store(
+            PartitionedStore(data_path), output_path, args.since, args.until, args.run, show_text=not args.no_text
+        )
+        raise SystemExit
+    if not args.input:
+        parser.error("an input file or --data is required")
     input_path = Path(args.input)
-    output_path = Path(args.output) if args.output else input_path.with_suffix(".html")
 
-    generate_html(input_path, output_path, show_text=not args.no_text)
+    if args.paginate:
+        output_dir = Path(args.output) if args.output else input_path.parent
+        rollups = Rollups(input_path.parent / ROLLUP_FILE) if args.trends else None
+        try:
+            if rollups is not None:
+                rollups.sync(input_path)
+            generate_paginated_html(
+                input_path,
+                output_dir,
+                page_size=args.page_size,
+                show_text=not args.no_text,
+                cache_path=output_dir / RENDER_CACHE_FILE if args.incremental else None,
+                rollups=rollups,
+            )
+        finally:
+            if rollups is not None:
+                rollups.close()
+    else:
+        output_path = Path(args.output) if args.output else input_path.with_suffix(".html")
+        generate_html(input_path, output_path, show_text=not args.no_text)
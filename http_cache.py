@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""On-disk HTTP response cache shared by the scrapers.
+
+Responses are stored per URL together with their `ETag` and
+`Last-Modified` headers. A request for a cached URL is answered from disk
+while the entry is younger than the caller's TTL; otherwise it is sent as
+a conditional request and a `304 Not Modified` reply reuses the stored
+body. Hit/miss counts and bytes saved are tracked per cache instance.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from transport import Transport
+
+CACHE_DIR = ".http_cache"
+
+
+@dataclass
+class CacheStats:
+    """Counters for one collection run."""
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    bytes_downloaded: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.revalidated + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of requests served without downloading a body."""
+        return (self.hits + self.revalidated) / self.requests if self.requests else 0.0
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (
+            f"{self.hits} fresh hits, {self.revalidated} revalidated, {self.misses} misses "
+            f"({self.hit_ratio:.0%} hit ratio), {self.bytes_saved / 1024:.0f} KB saved, "
+            f"{self.bytes_downloaded / 1024:.0f} KB downloaded"
+        )
+
+
+class HttpCache:
+    """Directory of cached responses keyed by URL. Safe to share between threads."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def load(self, url: str) -> tuple[dict, bytes] | None:
+        """Return the stored metadata and body for a URL, if any."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return meta, body
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """Save a successful response body and its validators."""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "stored_at": time.time(),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content_type": response.headers.get("content-type"),
+        }
+        _atomic_write(body_path, response.content)
+        _atomic_write(meta_path, json.dumps(meta).encode())
+
+    def touch(self, url: str, meta: dict) -> None:
+        """Mark a revalidated entry as fresh again."""
+        meta_path, _ = self._paths(url)
+        meta["stored_at"] = time.time()
+        _atomic_write(meta_path, json.dumps(meta).encode())
+
+    def record(self, outcome: str, size: int) -> None:
+        """Count a request outcome: "hit", "revalidated" or "miss"."""
+        with self._lock:
+            if outcome == "hit":
+                self.stats.hits += 1
+                self.stats.bytes_saved += size
+            elif outcome == "revalidated":
+                self.stats.revalidated += 1
+                self.stats.bytes_saved += size
+            else:
+                self.stats.misses += 1
+                self.stats.bytes_downloaded += size
+
+    def prune(self, max_age: float) -> int:
+        """Delete entries not refreshed within `max_age` seconds."""
+        cutoff = time.time() - max_age
+        removed = 0
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                stored_at = json.loads(meta_path.read_text()).get("stored_at", 0)
+            except (OSError, ValueError):
+                stored_at = 0
+            if stored_at < cutoff:
+                meta_path.unlink(missing_ok=True)
+                meta_path.with_suffix(".body").unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class CachingClient:
+    """`httpx.Client` (or `Transport`) wrapper whose `get` goes through an `HttpCache`.
+
+    With no cache it simply forwards to the client, so scrapers can always
+    use it.
+    """
+
+    def __init__(self, client: "httpx.Client | Transport", cache: HttpCache | None = None):
+        self.client = client
+        self.cache = cache
+
+    def get(self, url: str, headers: dict | None = None, ttl: float | None = None) -> httpx.Response:
+        """GET a URL, serving it from cache when fresh or unchanged.
+
+        `ttl` is how many seconds a cached response may be reused without
+        asking the server; without it every request is revalidated.
+        """
+        if self.cache is None:
+            return self.client.get(url, headers=headers)
+
+        cached = self.cache.load(url)
+        request_headers = dict(headers or {})
+
+        if cached:
+            meta, body = cached
+            if ttl is not None and time.time() - meta["stored_at"] < ttl:
+                self.cache.record("hit", len(body))
+                return _cached_response(url, meta, body)
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self.client.get(url, headers=request_headers)
+
+        if cached and response.status_code == 304:
+            meta, body = cached
+            self.cache.touch(url, meta)
+            self.cache.record("revalidated", len(body))
+            return _cached_response(url, meta, body)
+
+        self.cache.record("miss", len(response.content))
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped client."""
+        self.client.close()
+
+
+def _cached_response(url: str, meta: dict, body: bytes) -> httpx.Response:
+    headers = {"content-type": meta["content_type"]} if meta.get("content_type") else {}
+    return httpx.Response(200, content=body, headers=headers, request=httpx.Request("GET", url))
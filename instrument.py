@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Per-stage timings and counters for collection runs.
+
+A `RunReport` accumulates, per named stage, the seconds spent, how often
+the stage ran and any counters (requests, bytes, items) reported for it.
+While a report is `recording`, instrumented code anywhere in the pipeline
+adds to it through `timed` and `record`; with no report recording they
+cost next to nothing. Stages hit from several threads (each source's
+fetches, classification) add up the time spent on every thread, so they
+can exceed the run's wall-clock time.
+
+`collect.main` appends each run's report as one JSON line to
+`run_reports.jsonl`, so the history can be compared across runs, and can
+write a cProfile dump of the whole run (all threads) with `--profile`.
+
+Usage:
+    python instrument.py history --last 10
+    python -m pstats profile.out
+"""
+
+import cProfile
+import json
+import pstats
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPORT_FILE = "run_reports.jsonl"
+# A stage is flagged in `history` when it takes this many times its median.
+REGRESSION_FACTOR = 1.5
+
+
+@dataclass
+class StageStats:
+    """Time, call count and counters for one stage of a run."""
+    seconds: float = 0.0
+    calls: int = 0
+    counts: Counter = field(default_factory=Counter)
+
+
+class RunReport:
+    """Timings and counters for the stages of one run. Safe to share between threads."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = datetime.now(timezone.utc)
+        self.stages: dict[str, StageStats] = {}
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float = 0.0, calls: int = 1, **counts: int) -> None:
+        """Add time, calls and counters to a stage."""
+        with self._lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = StageStats()
+            stats.seconds += seconds
+            stats.calls += calls
+            stats.counts.update(counts)
+
+    def to_dict(self) -> dict:
+        """The report as JSON-serialisable data."""
+        return {
+            "run": self.name,
+            "started_at": self.started_at.isoformat(),
+            "elapsed": round(time.perf_counter() - self._start, 4),
+            "stages": {
+                stage: {"seconds": round(stats.seconds, 4), "calls": stats.calls, **stats.counts}
+                for stage, stats in self.stages.items()
+            },
+        }
+
+    def append_to(self, path: Path) -> None:
+        """Append the report to a JSONL history file."""
+        with path.open("a") as f:
+            f.write(json.dumps(self.to_dict()) + "\n")
+
+    def summary(self) -> str:
+        """One line per stage, slowest first."""
+        lines = []
+        for stage, stats in sorted(self.stages.items(), key=lambda entry: -entry[1].seconds):
+            counts = ", ".join(f"{count} {name}" for name, count in stats.counts.items())
+            lines.append(f"  {stage:<24} {stats.seconds:8.2f}s {stats.calls:7d} calls  {counts}")
+        return "\n".join(lines)
+
+
+_active: RunReport | None = None
+
+
+def active() -> RunReport | None:
+    """The report currently recording, if any."""
+    return _active
+
+
+@contextmanager
+def recording(report: RunReport) -> Iterator[RunReport]:
+    """Make `report` receive everything `timed` and `record` measure."""
+    global _active
+    previous, _active = _active, report
+    try:
+        yield report
+    finally:
+        _active = previous
+
+
+def record(stage: str, seconds: float = 0.0, calls: int = 1, **counts: int) -> None:
+    """Add to a stage of the recording report; does nothing when none is recording."""
+    if _active is not None:
+        _active.add(stage, seconds, calls, **counts)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[Counter]:
+    """Time a block as one call of `stage`.
+
+    Yields a counter the block can fill in; its counts are added to the
+    stage when the block ends.
+    """
+    counts: Counter = Counter()
+    start = time.perf_counter()
+    try:
+        yield counts
+    finally:
+        record(stage, time.perf_counter() - start, **counts)
+
+
+@contextmanager
+def profiled(path: Path | None) -> Iterator[None]:
+    """Profile the block with cProfile, including threads it starts, and dump the stats to `path`.
+
+    cProfile only follows the thread that enables it, so every thread
+    started inside the block gets its own profiler (through
+    `threading.setprofile`) and their stats are merged at the end. Does
+    nothing when `path` is None.
+    """
+    if path is None:
+        yield
+        return
+
+    profilers = [cProfile.Profile()]
+    lock = threading.Lock()
+
+    def start_thread_profiler(*_: object) -> None:
+        profiler = cProfile.Profile()
+        with lock:
+            profilers.append(profiler)
+        # Replaces this hook for the thread.
+        profiler.enable()
+
+    threading.setprofile(start_thread_profiler)
+    profilers[0].enable()
+    try:
+        yield
+    finally:
+        profilers[0].disable()
+        threading.setprofile(None)
+        with lock:
+            stats = pstats.Stats(profilers[0])
+            for profiler in profilers[1:]:
+                try:
+                    stats.add(profiler)
+                except TypeError:
+                    # A thread that never made a call has nothing to add.
+                    pass
+        stats.dump_stats(path)
+
+
+def load_history(path: Path) -> list[dict]:
+    """Every run report in a history file, oldest first."""
+    if not path.exists():
+        return []
+    with path.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def regressions(history: list[dict], factor: float = REGRESSION_FACTOR) -> list[tuple[str, float, float]]:
+    """Stages of the last run slower than `factor` times their median over earlier runs.
+
+    Returns `(stage, seconds, median)` tuples.
+    """
+    if len(history) < 2:
+        return []
+    *earlier, last = history
+    slow = []
+    for stage, stats in last["stages"].items():
+        previous = sorted(run["stages"][stage]["seconds"] for run in earlier if stage in run["stages"])
+        if not previous:
+            continue
+        median = previous[len(previous) // 2]
+        if median > 0 and stats["seconds"] > factor * median:
+            slow.append((stage, stats["seconds"], median))
+    return slow
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect collection run reports")
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Data directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    history_parser = subparsers.add_parser("history", help="Stage timings of recent runs")
+    history_parser.add_argument("--last", type=int, default=10, help="Number of runs to show")
+    history_parser.add_argument("--json", action="store_true", help="Print the reports as JSON")
+
+    args = parser.parse_args()
+
+    history = load_history(Path(args.dir) / REPORT_FILE)
+    recent = history[-args.last:]
+    if args.json:
+        print(json.dumps(recent, indent=2))
+    elif not recent:
+        print(f"No run reports in {Path(args.dir) / REPORT_FILE}")
+    else:
+        stages = sorted({stage for run in recent for stage in run["stages"]})
+        print(f"{'stage':<24}" + "".join(f"{run['started_at'][5:16].replace('T', ' '):>12}" for run in recent))
+        for stage in stages:
+            cells = "".join(
+                f"{run['stages'][stage]['seconds']:11.2f}s" if stage in run["stages"] else f"{'-':>12}"
+                for run in recent
+            )
+            print(f"{stage:<24}{cells}")
+        print(f"{'total':<24}" + "".join(f"{run['elapsed']:11.2f}s" for run in recent))
+        for stage, seconds, median in regressions(history):
+            print(f"⚠️  {stage} took {seconds:.2f}s, {seconds / median:.1f}x its median of {median:.2f}s")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Streaming JSONL reading, writing and sorting with bounded memory.
+
+Readers yield one item at a time, the writer flushes every item as it is
+written, and `external_sort` orders arbitrarily large inputs by spilling
+sorted runs to temporary files and merging them.
+"""
+
+import heapq
+import json
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Yield each JSON object in a JSONL file, skipping blank lines."""
+    with path.open() as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def count_jsonl(path: Path) -> int:
+    """Count the non-blank lines of a JSONL file without decoding them."""
+    with path.open("rb") as f:
+        return sum(1 for line in f if line.strip())
+
+
+class JsonlWriter:
+    """Write JSON objects one per line, flushing after each item.
+
+    Items reach the file as soon as they are written, so a crashed run
+    keeps everything produced so far and nothing is buffered in memory.
+    """
+
+    def __init__(self, path: Path, mode: str = "w"):
+        self.path = path
+        self.count = 0
+        self._file = path.open(mode)
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def write(self, item: dict) -> None:
+        """Append one item and flush it to disk."""
+        self._file.write(json.dumps(item) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+
+def _write_run(chunk: list[dict], tmp_dir: str | None) -> Path:
+    fd, name = tempfile.mkstemp(prefix="sort-run-", suffix=".jsonl", dir=tmp_dir)
+    with os.fdopen(fd, "w") as f:
+        for item in chunk:
+            f.write(json.dumps(item) + "\n")
+    return Path(name)
+
+
+def external_sort(
+    items: Iterable[dict],
+    key: Callable[[dict], Any],
+    reverse: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    tmp_dir: str | None = None,
+) -> Iterator[dict]:
+    """Yield items sorted by `key`, holding at most `chunk_size` in memory.
+
+    Input is consumed in chunks that are sorted and spilled to temporary
+    files, then the runs are lazily merged. Inputs that fit in one chunk
+    are sorted in memory without touching disk. The sort is stable.
+    """
+    runs: list[Path] = []
+    try:
+        chunk: list[dict] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                chunk.sort(key=key, reverse=reverse)
+                runs.append(_write_run(chunk, tmp_dir))
+                chunk = []
+
+        chunk.sort(key=key, reverse=reverse)
+        if not runs:
+            yield from chunk
+            return
+
+        streams = [iter_jsonl(run) for run in runs]
+        streams.append(iter(chunk))
+        yield from heapq.merge(*streams, key=key, reverse=reverse)
+    finally:
+        for run in runs:
+            run.unlink(missing_ok=True)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Run several feedback sources concurrently and merge their output.
+
+Each source is a zero-argument callable returning an iterable of items.
+Sources run on their own threads and their items are yielded as soon as
+they are produced, so total run time is bounded by the slowest source
+rather than the sum of all of them.
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+# Seconds to wait for sources to stop when the merged stream is closed early.
+STOP_TIMEOUT = 30.0
+
+
+@dataclass
+class SourceStats:
+    """Timing and item count for one source in a collection run."""
+    name: str
+    items: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+
+def run_sources(
+    sources: Mapping[str, Callable[[], Iterable[T]]],
+    stats: dict[str, SourceStats] | None = None,
+    stop: threading.Event | None = None,
+) -> Iterator[tuple[str, T]]:
+    """Run all sources concurrently and yield `(source_name, item)` pairs.
+
+    Items from different sources are interleaved in arrival order; items
+    from a single source keep their original order. If `stats` is given it
+    is filled with a `SourceStats` entry per source as each one finishes.
+    A source that raises is recorded in its stats entry and does not stop
+    the others. Closing the generator early sets `stop` (a new event if
+    none is given), which sources can pass on to their requests to give up
+    in-flight work; each source is also stopped after its current item. It
+    then waits up to `STOP_TIMEOUT` seconds in all for the source threads
+    to finish. Sources still running after that have no `stats` entry, so
+    callers can tell whether resources the sources share are free to
+    release.
+    """
+    results: queue.Queue = queue.Queue()
+    if stop is None:
+        stop = threading.Event()
+    if stats is None:
+        stats = {}
+
+    def worker(name: str, source: Callable[[], Iterable[T]]) -> None:
+        source_stats = SourceStats(name=name)
+        start = time.perf_counter()
+        try:
+            for item in source():
+                if stop.is_set():
+                    break
+                source_stats.items += 1
+                results.put((name, item))
+        except Exception as e:
+            source_stats.error = str(e)
+        finally:
+            source_stats.elapsed = time.perf_counter() - start
+            results.put((name, _DONE, source_stats))
+
+    threads = [
+        threading.Thread(target=worker, args=(name, source), name=f"source-{name}", daemon=True)
+        for name, source in sources.items()
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        remaining = len(threads)
+        while remaining:
+            message = results.get()
+            if message[1] is _DONE:
+                stats[message[0]] = message[2]
+                remaining -= 1
+                continue
+            yield message
+    finally:
+        stop.set()
+        deadline = time.monotonic() + STOP_TIMEOUT
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        while not results.empty():
+            message = results.get()
+            if message[1] is _DONE:
+                stats[message[0]] = message[2]
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""Collection runs stored in date partitions with a manifest.
+
+Each run's items are stored under `data/` by the UTC day they were
+posted, one part file per run and day:
+
+    data/year=2026/month=08/day=22/part-2026-08-22_17-10-38.jsonl
+
+`data/manifest.json` records every part's row count, first and last
+timestamp and content hash, and per partition the number of distinct
+items and the timestamp range, so a reader asking for a time range only
+opens the partitions that overlap it. Content hashes leave out
+`collected_at`, so a run that collected exactly the items of an earlier
+one is recorded as a copy of it without writing anything, and a part
+identical to one its partition already holds is not written twice.
+
+An item collected by several runs has a copy in each of their parts;
+readers yield one per ID, from the latest run. `feedback_all.jsonl`
+stays the deduplicated history the indexes are built from; the
+partitions replace the loose `feedback_<timestamp>.jsonl` snapshots,
+which `migrate` moves into the store.
+
+Usage:
+    python partitions.py migrate --remove
+    python partitions.py stats
+    python partitions.py read --since 2026-08-01 --until 2026-08-08
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from rollup import item_day
+
+DATA_DIR = "data"
+MANIFEST_FILE = "manifest.json"
+# Runs being collected, moved into partitions once they finish.
+INCOMING_DIR = "incoming"
+# Fields that differ between runs collecting the same items.
+VOLATILE_FIELDS = ("collected_at",)
+
+
+def partition_key(day: str) -> str:
+    """Partition directory for a YYYY-MM-DD day, relative to the store root."""
+    year, month, day_of_month = day.split("-")
+    return f"year={year}/month={month}/day={day_of_month}"
+
+
+def content_hash(items: Iterable[dict]) -> str:
+    """Hash of a set of items, ignoring their order and `VOLATILE_FIELDS`."""
+    lines = sorted(
+        json.dumps({k: v for k, v in item.items() if k not in VOLATILE_FIELDS}, sort_keys=True)
+        for item in items
+    )
+    return hashlib.blake2b("\n".join(lines).encode(), digest_size=16).hexdigest()
+
+
+def run_hash(part_hashes: dict[str, str]) -> str:
+    """Hash of a run from the `content_hash` of its items in each partition."""
+    lines = sorted(f"{key} {part_hash}" for key, part_hash in part_hashes.items())
+    return hashlib.blake2b("\n".join(lines).encode(), digest_size=16).hexdigest()
+
+
+def _parse_time(value: str | datetime) -> datetime:
+    timestamp = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class Manifest:
+    """What the store holds, persisted as `manifest.json`.
+
+    `partitions` maps partition keys to their `items`, `rows`,
+    `min_timestamp`, `max_timestamp` and `parts`, which map part file
+    names to the `run`, `rows`, timestamp range and `hash` of each part.
+    `runs` maps run IDs to their `rows`, `hash`, `copy_of` (the earlier
+    run it repeated, if any) and `parts`: the file holding the run's items
+    in each partition, possibly an identical part of an earlier run.
+    """
+    partitions: dict[str, dict] = field(default_factory=dict)
+    runs: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        """Load the manifest, or start empty if the file doesn't exist."""
+        if not path.exists():
+            return cls()
+        return cls(**json.loads(path.read_text()))
+
+    def save(self, path: Path) -> None:
+        """Write the manifest atomically."""
+        # Not `asdict`, which deep-copies, or `indent`, which needs the slow pure-Python encoder
+        _write_atomic(path, json.dumps({"partitions": self.partitions, "runs": self.runs}).encode())
+
+
+@dataclass
+class RunResult:
+    """What adding one run to the store did."""
+    run: str
+    rows: int = 0
+    parts_written: int = 0
+    parts_reused: int = 0
+    # The earlier run this one repeated exactly; nothing was written
+    copy_of: str | None = None
+
+
+class PartitionedStore:
+    """Collection runs partitioned by day under `root`, with a manifest."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.manifest_path = root / MANIFEST_FILE
+        self.manifest = Manifest.load(self.manifest_path)
+
+    def __len__(self) -> int:
+        return sum(partition["items"] for partition in self.manifest.partitions.values())
+
+    def incoming_path(self, run: str) -> Path:
+        """Where a run in progress writes its items before `add_run_file`, creating the directory."""
+        path = self.root / INCOMING_DIR / f"feedback_{run}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def files(self) -> list[Path]:
+        """Every part file, oldest partition first."""
+        return [
+            self.root / key / name
+            for key in sorted(self.manifest.partitions)
+            for name in self.manifest.partitions[key]["parts"]
+        ]
+
+    def add_run(self, run: str, items: Iterable[dict]) -> RunResult:
+        """Store a run's items, partitioned by day, and save the manifest.
+
+        A run whose items equal an earlier run's is only recorded as a copy
+        of it; a part equal to one already in its partition is not written.
+        """
+        if run in self.manifest.runs:
+            raise ValueError(f"Run {run} is already stored")
+
+        by_partition: dict[str, list[dict]] = {}
+        for item in items:
+            by_partition.setdefault(partition_key(item_day(item)), []).append(item)
+        rows = sum(len(part) for part in by_partition.values())
+        part_hashes = {key: content_hash(part) for key, part in by_partition.items()}
+        this_hash = run_hash(part_hashes)
+        result = RunResult(run, rows=rows)
+
+        for other, entry in self.manifest.runs.items():
+            if entry["hash"] == this_hash and entry["rows"] == rows:
+                result.copy_of = other
+                self.manifest.runs[run] = {"rows": rows, "hash": this_hash, "copy_of": other, "parts": entry["parts"]}
+                self.manifest.save(self.manifest_path)
+                return result
+
+        parts = {}
+        for key in sorted(by_partition):
+            part_items = by_partition[key]
+            part_hash = part_hashes[key]
+            partition = self.manifest.partitions.setdefault(key, {"parts": {}})
+            same = next((name for name, part in partition["parts"].items() if part["hash"] == part_hash), None)
+            if same is not None:
+                parts[key] = same
+                result.parts_reused += 1
+                continue
+
+            name = f"part-{run}.jsonl"
+            data = "".join(json.dumps(item) + "\n" for item in part_items).encode()
+            _write_atomic(self.root / key / name, data)
+            partition["parts"][name] = self._part_entry(run, part_items, part_hash)
+            self._update_partition(key)
+            parts[key] = name
+            result.parts_written += 1
+
+        self.manifest.runs[run] = {"rows": rows, "hash": this_hash, "copy_of": None, "parts": parts}
+        self.manifest.save(self.manifest_path)
+        return result
+
+    def add_run_file(self, path: Path, run: str | None = None) -> RunResult:
+        """Store a run from a JSONL file, by default named `feedback_<run>.jsonl`."""
+        run = run or path.stem.removeprefix("feedback_")
+        with path.open() as f:
+            return self.add_run(run, (json.loads(line) for line in f if line.strip()))
+
+    def add_incoming(self) -> list[RunResult]:
+        """Store runs left in `INCOMING_DIR` by interrupted collections, then remove them."""
+        results = []
+        for path in sorted((self.root / INCOMING_DIR).glob("feedback_*.jsonl")):
+            # A run stored just before the interruption only needs its file removed
+            if path.stem.removeprefix("feedback_") not in self.manifest.runs:
+                results.append(self.add_run_file(path))
+            path.unlink()
+        return results
+
+    @staticmethod
+    def _part_entry(run: str, items: list[dict], part_hash: str) -> dict:
+        timestamps = [_parse_time(item["timestamp"]) for item in items]
+        return {
+            "run": run,
+            "rows": len(items),
+            "min_timestamp": min(timestamps).isoformat(),
+            "max_timestamp": max(timestamps).isoformat(),
+            "hash": part_hash,
+        }
+
+    def _update_partition(self, key: str) -> None:
+        partition = self.manifest.partitions[key]
+        parts = partition["parts"].values()
+        ids = set()
+        for name in partition["parts"]:
+            ids.update(item["id"] for item in self._read(key, name))
+        partition["items"] = len(ids)
+        partition["rows"] = sum(part["rows"] for part in parts)
+        partition["min_timestamp"] = min(part["min_timestamp"] for part in parts)
+        partition["max_timestamp"] = max(part["max_timestamp"] for part in parts)
+
+    def refresh(self, paths: Iterable[Path]) -> int:
+        """Update the manifest for part files rewritten in place (e.g. by `reclassify`).
+
+        Returns the number of parts whose entries changed.
+        """
+        changed = 0
+        runs = set()
+        for path in paths:
+            if not path.resolve().is_relative_to(self.root.resolve()):
+                continue
+            key = path.resolve().parent.relative_to(self.root.resolve()).as_posix()
+            path = self.root / key / path.name
+            part = self.manifest.partitions.get(key, {}).get("parts", {}).get(path.name)
+            if part is None:
+                continue
+            items = list(self._read(key, path.name))
+            entry = self._part_entry(part["run"], items, content_hash(items)) if items else None
+            if entry == part:
+                continue
+            if entry is None:
+                del self.manifest.partitions[key]["parts"][path.name]
+                path.unlink()
+            else:
+                self.manifest.partitions[key]["parts"][path.name] = entry
+            if self.manifest.partitions[key]["parts"]:
+                self._update_partition(key)
+            else:
+                del self.manifest.partitions[key]
+            runs.update(run for run, entry in self.manifest.runs.items() if entry["parts"].get(key) == path.name)
+            changed += 1
+
+        for run in runs:
+            entry = self.manifest.runs[run]
+            entry["parts"] = {
+                key: name for key, name in entry["parts"].items()
+                if name in self.manifest.partitions.get(key, {}).get("parts", {})
+            }
+            parts = {key: self.manifest.partitions[key]["parts"][name] for key, name in entry["parts"].items()}
+            entry["rows"] = sum(part["rows"] for part in parts.values())
+            entry["hash"] = run_hash({key: part["hash"] for key, part in parts.items()})
+        if changed:
+            self.manifest.save(self.manifest_path)
+        return changed
+
+    def _read(self, key: str, name: str) -> Iterator[dict]:
+        with (self.root / key / name).open() as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def partitions(self, since: datetime | str | None = None, until: datetime | str | None = None) -> list[str]:
+        """Keys of the partitions holding items from `since` (inclusive) to `until` (exclusive), oldest first."""
+        since = _parse_time(since) if since is not None else None
+        until = _parse_time(until) if until is not None else None
+        return [
+            key
+            for key, partition in sorted(self.manifest.partitions.items())
+            if (since is None or _parse_time(partition["max_timestamp"]) >= since)
+            and (until is None or _parse_time(partition["min_timestamp"]) < until)
+        ]
+
+    def items(
+        self,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        run: str | None = None,
+    ) -> Iterator[dict]:
+        """Yield each item posted from `since` (inclusive) to `until` (exclusive) once.
+
+        Only partitions overlapping the range are opened, and only items
+        in partitions reaching past either end are checked one by one.
+        With `run`, only that run's items are read. Partitions are read
+        oldest first; an item stored by several runs comes from the latest.
+        """
+        since = _parse_time(since) if since is not None else None
+        until = _parse_time(until) if until is not None else None
+        run_parts = None
+        if run is not None:
+            if run not in self.manifest.runs:
+                raise KeyError(f"Unknown run {run}")
+            run_parts = self.manifest.runs[run]["parts"]
+
+        for key in self.partitions(since, until):
+            partition = self.manifest.partitions[key]
+            if run_parts is not None:
+                if key not in run_parts:
+                    continue
+                names = [run_parts[key]]
+            else:
+                names = list(reversed(partition["parts"]))
+            check = (
+                (since is not None and _parse_time(partition["min_timestamp"]) < since)
+                or (until is not None and _parse_time(partition["max_timestamp"]) >= until)
+            )
+
+            seen = set()
+            for name in names:
+                for item in self._read(key, name):
+                    if item["id"] in seen:
+                        continue
+                    seen.add(item["id"])
+                    if check:
+                        timestamp = _parse_time(item["timestamp"])
+                        if (since is not None and timestamp < since) or (until is not None and timestamp >= until):
+                            continue
+                    yield item
+
+    def count(
+        self,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        run: str | None = None,
+    ) -> int:
+        """Number of items `items` yields for the same arguments.
+
+        Whole-store counts come from the manifest; ranges and runs are
+        counted by reading the partitions they touch.
+        """
+        if since is None and until is None and run is None:
+            return len(self)
+        return sum(1 for _ in self.items(since, until, run))
+
+
+def migrate(store: PartitionedStore, paths: Iterable[Path], remove: bool = False) -> list[RunResult]:
+    """Move loose `feedback_<run>.jsonl` snapshots into the store.
+
+    `feedback_initial.jsonl` predates every timestamped run and is stored
+    first. Runs already in the store are skipped. With `remove`, each file
+    is deleted once its run is stored.
+    """
+    results = []
+    for path in sorted(paths, key=lambda p: (p.stem != "feedback_initial", p.name)):
+        run = path.stem.removeprefix("feedback_")
+        if run not in store.manifest.runs:
+            results.append(store.add_run_file(path, run))
+        if remove:
+            path.unlink()
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from store import CUMULATIVE_FILE
+
+    parser = argparse.ArgumentParser(description="Manage the date-partitioned run store")
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Directory holding data/")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Move feedback_*.jsonl snapshots into data/")
+    migrate_parser.add_argument("--remove", action="store_true", help="Delete each snapshot once stored")
+
+    subparsers.add_parser("stats", help="Partitions, parts and runs in the store")
+
+    read_parser = subparsers.add_parser("read", help="Print the items of a time range as JSONL")
+    read_parser.add_argument("--since", type=str, help="Earliest timestamp (ISO date or time, UTC)")
+    read_parser.add_argument("--until", type=str, help="Timestamp to stop before (ISO date or time, UTC)")
+    read_parser.add_argument("--run", type=str, help="Only this run's items")
+
+    args = parser.parse_args()
+    data_dir = Path(args.dir)
+    partitioned = PartitionedStore(data_dir / DATA_DIR)
+
+    if args.command == "migrate":
+        snapshots = [path for path in data_dir.glob("feedback_*.jsonl") if path.name != CUMULATIVE_FILE]
+        print(f"📦 Moving {len(snapshots)} snapshot files into {partitioned.root}...")
+        results = migrate(partitioned, snapshots, remove=args.remove)
+        for result in results:
+            if result.copy_of:
+                print(f"  = {result.run:<20} {result.rows:4d} items, same as {result.copy_of}: dropped")
+            elif result.parts_reused:
+                print(f"  + {result.run:<20} {result.rows:4d} items, {result.parts_reused} parts already stored")
+        print(
+            f"  ✓ {len(results)} runs: {sum(r.parts_written for r in results)} parts written, "
+            f"{sum(r.parts_reused for r in results)} identical parts and "
+            f"{sum(bool(r.copy_of) for r in results)} identical runs dropped"
+        )
+    elif args.command == "read":
+        for item in partitioned.items(args.since, args.until, args.run):
+            print(json.dumps(item))
+        raise SystemExit
+
+    manifest = partitioned.manifest
+    print(
+        f"📊 {len(partitioned)} items in {len(manifest.partitions)} partitions "
+        f"({sum(len(p['parts']) for p in manifest.partitions.values())} parts, "
+        f"{sum(p['rows'] for p in manifest.partitions.values())} rows) from {len(manifest.runs)} runs"
+    )
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Re-run keyword classification and sentiment scoring over historical feedback files.
+
+After the keyword tables in `scraper` or the lexicon in `sentiment`
+change, stored records keep the labels they were collected with (records
+collected before sentiment scoring have none). `reclassify` streams every JSONL file
+through the current classifier in a process pool, in line-aligned chunks
+so large files are spread over all workers, rewrites a file atomically
+only if some record changed, and reports per-file throughput and which
+labels were added or removed. Each chunk's sentiment is scored as one
+batch.
+
+Records are classified on the same text the scrapers use (see
+`scraper.classification_text`). Records that are no longer
+relevant are kept and counted unless `--drop-irrelevant` is given.
+
+Rewriting the cumulative file moves its lines, so the SQLite indexes
+derived from it are removed and rebuilt from it on next use. Rewritten
+part files of the partitioned store get their manifest entries updated.
+
+Usage:
+    python reclassify.py --dry-run
+    python reclassify.py --workers 8 feedback_all.jsonl
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dedup import DEDUP_INDEX_FILE
+from partitions import DATA_DIR, PartitionedStore
+from rollup import ROLLUP_FILE
+from scraper import classification_text, classify
+from search import SEARCH_INDEX_FILE
+from sentiment import label_texts
+from store import CUMULATIVE_FILE, INDEX_FILE
+
+CHUNK_SIZE = 1 << 20
+
+# Indexes that locate lines of the cumulative file by byte offset.
+DERIVED_INDEXES = [INDEX_FILE, DEDUP_INDEX_FILE, SEARCH_INDEX_FILE, ROLLUP_FILE]
+
+
+@dataclass
+class FileReport:
+    """What reclassifying one file changed."""
+    path: Path
+    items: int = 0
+    changed: int = 0
+    irrelevant: int = 0
+    dropped: int = 0
+    seconds: float = 0.0
+    rewritten: bool = False
+    # Label changes such as ("products", "+claude"), ("categories", "-tone")
+    # or ("sentiment", "+negative")
+    labels: Counter = field(default_factory=Counter)
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def merge(self, other: "FileReport") -> None:
+        """Add another chunk's counts to this report."""
+        self.items += other.items
+        self.changed += other.changed
+        self.irrelevant += other.irrelevant
+        self.dropped += other.dropped
+        self.seconds += other.seconds
+        self.labels += other.labels
+
+
+def split_lines(path: Path, chunk_size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Byte ranges of roughly `chunk_size` covering a file, each ending at a line break."""
+    size = path.stat().st_size
+    ranges = []
+    with path.open("rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _part_path(path: Path, start: int) -> Path:
+    return path.with_name(f".{path.name}.{start}.part")
+
+
+def reclassify_chunk(
+    path: Path,
+    start: int,
+    end: int,
+    dry_run: bool = False,
+    drop_irrelevant: bool = False,
+) -> tuple[FileReport, Path | None]:
+    """Reclassify the records in one byte range of a JSONL file.
+
+    If any record changed (and this is not a dry run), the range's new
+    contents are written to a part file, whose path is returned with the
+    report; unchanged lines are copied byte for byte. The range is read
+    whole so the sentiment of all its records is scored as one batch.
+    """
+    began = time.perf_counter()
+    report = FileReport(path)
+    output = bytearray()
+
+    with path.open("rb") as src:
+        src.seek(start)
+        lines = src.read(end - start).splitlines(keepends=True)
+    items = [json.loads(line) if line.strip() else None for line in lines]
+    texts = [classification_text(item["id"], item["title"], item["text"]) if item else None for item in items]
+    sentiments = iter(label_texts([text for text in texts if text is not None]))
+
+    for line, item, text in zip(lines, items, texts):
+        if item is None:
+            output += line
+            continue
+        report.items += 1
+        sentiment = next(sentiments)
+
+        classification = classify(text)
+        if not classification.relevant:
+            report.irrelevant += 1
+            if drop_irrelevant:
+                report.dropped += 1
+                continue
+
+        products = [product.value for product in classification.products]
+        categories = [category.value for category in classification.categories]
+        if products == item["products"] and categories == item["categories"] and sentiment == item["sentiment"]:
+            output += line
+            continue
+
+        report.changed += 1
+        for kind, old, new in (
+            ("products", item["products"], products),
+            ("categories", item["categories"], categories),
+            ("sentiment", [item["sentiment"]] if item["sentiment"] else [], [sentiment]),
+        ):
+            report.labels.update((kind, f"+{label}") for label in new if label not in old)
+            report.labels.update((kind, f"-{label}") for label in old if label not in new)
+        item["products"] = products
+        item["categories"] = categories
+        item["sentiment"] = sentiment
+        output += (json.dumps(item) + "\n").encode()
+
+    part = None
+    if (report.changed or report.dropped) and not dry_run:
+        part = _part_path(path, start)
+        part.write_bytes(output)
+    report.seconds = time.perf_counter() - began
+    return report, part
+
+
+def _replace_ranges(path: Path, ranges: list[tuple[int, int]], parts: list[Path | None]) -> None:
+    """Atomically rewrite a file with some of its byte ranges replaced by part files."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with path.open("rb") as src, tmp_path.open("wb") as dst:
+            for (start, end), part in zip(ranges, parts):
+                if part is None:
+                    src.seek(start)
+                    dst.write(src.read(end - start))
+                else:
+                    dst.write(part.read_bytes())
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def reclassify(
+    paths: list[Path],
+    workers: int | None = None,
+    dry_run: bool = False,
+    drop_irrelevant: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    verbose: bool = True,
+) -> list[FileReport]:
+    """Reclassify files in a process pool and return one report per file.
+
+    Files are split into line-aligned chunks of about `chunk_size` bytes so
+    a large file (like the cumulative one) is spread over all workers.
+    Once every chunk of a file is done, the file is rewritten from the
+    changed chunks and the untouched ranges of the original. A report's
+    `seconds` is the worker time spent on the file.
+    """
+    paths = sorted(paths, key=lambda p: p.stat().st_size, reverse=True)
+    ranges = {path: split_lines(path, chunk_size) for path in paths}
+    results: dict[Path, list] = {path: [None] * len(ranges[path]) for path in paths}
+    remaining = {path: len(ranges[path]) for path in paths}
+    reports = [FileReport(path) for path in paths if not ranges[path]]
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(reclassify_chunk, path, start, end, dry_run, drop_irrelevant): (path, i)
+                for path in paths
+                for i, (start, end) in enumerate(ranges[path])
+            }
+            for future in as_completed(futures):
+                path, i = futures[future]
+                results[path][i] = future.result()
+                remaining[path] -= 1
+                if remaining[path]:
+                    continue
+
+                report = FileReport(path)
+                for chunk_report, _ in results[path]:
+                    report.merge(chunk_report)
+                parts = [part for _, part in results[path]]
+                if any(parts):
+                    _replace_ranges(path, ranges[path], parts)
+                    report.rewritten = True
+                reports.append(report)
+                if verbose:
+                    print(
+                        f"  {report.path.name:<40} {report.items:6d} items {report.changed:5d} changed "
+                        f"{report.irrelevant:4d} irrelevant {report.items_per_second:8.0f} items/s"
+                        + (" (rewritten)" if report.rewritten else "")
+                    )
+    finally:
+        for path in paths:
+            for start, _ in ranges[path]:
+                _part_path(path, start).unlink(missing_ok=True)
+    return reports
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reclassify stored feedback with the current keyword tables and lexicon")
+    parser.add_argument(
+        "files", nargs="*",
+        help=f"JSONL files (default: every feedback_*.jsonl and {DATA_DIR}/ part file in --dir)",
+    )
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Data directory")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without rewriting files")
+    parser.add_argument("--drop-irrelevant", action="store_true", help="Remove records that are no longer relevant")
+    args = parser.parse_args()
+
+    data_dir = Path(args.dir)
+    partitioned = PartitionedStore(data_dir / DATA_DIR)
+    files = [Path(name) for name in args.files] or sorted(data_dir.glob("feedback_*.jsonl")) + partitioned.files()
+    print(f"🔁 Reclassifying {len(files)} files{' (dry run)' if args.dry_run else ''}...")
+
+    start = time.perf_counter()
+    results = reclassify(files, workers=args.workers, dry_run=args.dry_run, drop_irrelevant=args.drop_irrelevant)
+    elapsed = time.perf_counter() - start
+
+    total_items = sum(r.items for r in results)
+    label_changes = sum((r.labels for r in results), Counter())
+    print(
+        f"\n📊 {total_items} items in {elapsed:.2f}s ({total_items / elapsed:.0f} items/s): "
+        f"{sum(r.changed for r in results)} relabelled, {sum(r.irrelevant for r in results)} no longer relevant, "
+        f"{sum(r.dropped for r in results)} dropped, {sum(r.rewritten for r in results)} files rewritten"
+    )
+    for (kind, change), count in sorted(label_changes.items(), key=lambda entry: -entry[1]):
+        print(f"  {kind:<10} {change:<22} {count:6d}")
+
+    if any(r.rewritten and r.path.resolve() == (data_dir / CUMULATIVE_FILE).resolve() for r in results):
+        for name in DERIVED_INDEXES:
+            (data_dir / name).unlink(missing_ok=True)
+        print(f"🧹 Removed {', '.join(DERIVED_INDEXES)}; they are rebuilt from {CUMULATIVE_FILE} on next use")
+    refreshed = partitioned.refresh(r.path for r in results if r.rewritten)
+    if refreshed:
+        print(f"🗂️  Updated {refreshed} part files in {partitioned.manifest_path}")
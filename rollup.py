@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Per-day feedback counts by product, category and source.
+
+`rollups.sqlite` holds one row per day, product, category and source
+with the number of items posted that day. Items mention several products
+and categories, so each item is also counted under the wildcard `*` for
+either dimension: the `*` rows give exact per-product, per-category and
+overall counts, where summing the specific rows would count an item once
+per label.
+
+Like the search index, the rollup remembers how many bytes of the
+cumulative JSONL file it covers and only counts lines appended since, so
+`collect.main` keeps it current and trend queries never re-read the raw
+data. A file rewritten in place is counted again from scratch.
+
+Usage:
+    python rollup.py query --product claude --category onboarding --period week
+    python rollup.py rebuild
+"""
+
+import json
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from store import is_rewritten, set_indexed_size
+
+ROLLUP_FILE = "rollups.sqlite"
+ALL = "*"
+PERIODS = {
+    "day": "day",
+    # SQLite's 'weekday 0' moves to the next Sunday, so this is the Monday starting the week.
+    "week": "date(day, 'weekday 0', '-6 days')",
+    "month": "substr(day, 1, 7) || '-01'",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT NOT NULL,
+    product TEXT NOT NULL,
+    category TEXT NOT NULL,
+    source TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (product, category, source, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def item_day(item: dict) -> str:
+    """UTC date an item was posted, as YYYY-MM-DD."""
+    timestamp = datetime.fromisoformat(item["timestamp"])
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.date().isoformat()
+
+
+def item_keys(item: dict) -> list[tuple[str, str, str, str]]:
+    """Every (day, product, category, source) row an item counts towards."""
+    day = item_day(item)
+    products = [*item["products"], ALL]
+    categories = [*item["categories"], ALL]
+    return [(day, product, category, item["source"]) for product in products for category in categories]
+
+
+class Rollups:
+    """SQLite rollup of daily counts over a cumulative feedback JSONL file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "Rollups":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the rollup database."""
+        self.conn.close()
+
+    @property
+    def indexed_size(self) -> int:
+        """Number of bytes of the JSONL file counted in the rollup."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'indexed_size'").fetchone()
+        return int(row[0]) if row else 0
+
+    def add(self, items: Iterable[dict]) -> int:
+        """Count items into the rollup; return how many were counted."""
+        counts: Counter[tuple[str, str, str, str]] = Counter()
+        added = 0
+        for item in items:
+            counts.update(item_keys(item))
+            added += 1
+        self.conn.executemany(
+            "INSERT INTO daily (day, product, category, source, count) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT DO UPDATE SET count = count + excluded.count",
+            [(*key, count) for key, count in counts.items()],
+        )
+        return added
+
+    def sync(self, jsonl_path: Path) -> int:
+        """Count lines appended to the JSONL file since the last sync.
+
+        If the file was rewritten, the rollup is rebuilt from scratch.
+        Returns the number of newly counted items.
+        """
+        if not jsonl_path.exists():
+            return 0
+
+        start = self.indexed_size
+        if is_rewritten(self.conn, jsonl_path, start):
+            self.conn.execute("DELETE FROM daily")
+            start = 0
+
+        def appended() -> Iterable[dict]:
+            nonlocal offset
+            with jsonl_path.open("rb") as f:
+                f.seek(start)
+                for line in f:
+                    # Leave a partially written last line for the next sync.
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    yield item
+
+        offset = start
+        added = self.add(appended())
+        set_indexed_size(self.conn, jsonl_path, offset)
+        self.conn.commit()
+        return added
+
+    def series(
+        self,
+        product: str | None = None,
+        category: str | None = None,
+        sources: list[str] | None = None,
+        since: str | date | None = None,
+        until: str | date | None = None,
+        period: str = "day",
+    ) -> list[tuple[str, int]]:
+        """Item counts per period, oldest first.
+
+        `period` is "day", "week" (labelled by its Monday) or "month"
+        (labelled by its first day); periods without items are left out.
+        Counts cover items mentioning `product` and having `category` (any,
+        when None) from any of `sources`, posted on or after `since` and
+        before `until` (ISO dates).
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period {period!r}")
+        conditions = ["product = ?", "category = ?"]
+        params: list = [product or ALL, category or ALL]
+        if sources:
+            conditions.append(f"source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if since:
+            conditions.append("day >= ?")
+            params.append(str(since))
+        if until:
+            conditions.append("day < ?")
+            params.append(str(until))
+        rows = self.conn.execute(
+            f"SELECT {PERIODS[period]} AS period, SUM(count) FROM daily "
+            f"WHERE {' AND '.join(conditions)} GROUP BY period ORDER BY period",
+            params,
+        )
+        return [(label, count) for label, count in rows]
+
+    def breakdown(
+        self,
+        dimension: str,
+        product: str | None = None,
+        category: str | None = None,
+        since: str | date | None = None,
+        until: str | date | None = None,
+    ) -> dict[str, int]:
+        """Item counts per value of `dimension` ("product", "category" or
+        "source"), most frequent first, within the other filters."""
+        if dimension not in ("product", "category", "source"):
+            raise ValueError(f"Unknown dimension {dimension!r}")
+        conditions = []
+        params: list = []
+        for column, value in (("product", product), ("category", category)):
+            if column == dimension:
+                conditions.append(f"{column} != ?")
+                params.append(ALL)
+            else:
+                conditions.append(f"{column} = ?")
+                params.append(value or ALL)
+        if since:
+            conditions.append("day >= ?")
+            params.append(str(since))
+        if until:
+            conditions.append("day < ?")
+            params.append(str(until))
+        rows = self.conn.execute(
+            f"SELECT {dimension}, SUM(count) AS total FROM daily "
+            f"WHERE {' AND '.join(conditions)} GROUP BY {dimension} ORDER BY total DESC, {dimension}",
+            params,
+        )
+        return dict(rows.fetchall())
+
+    def last_day(self) -> str | None:
+        """Most recent day with any items."""
+        return self.conn.execute("SELECT MAX(day) FROM daily").fetchone()[0]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from store import CUMULATIVE_FILE
+
+    parser = argparse.ArgumentParser(description="Query feedback trend rollups")
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Data directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query_parser = subparsers.add_parser("query", help="Print item counts per period")
+    query_parser.add_argument("--product", type=str, help="Only items mentioning this product")
+    query_parser.add_argument("--category", type=str, help="Only items in this category")
+    query_parser.add_argument("--source", action="append", help="Only items from this source")
+    query_parser.add_argument("--since", type=str, help="First day (YYYY-MM-DD)")
+    query_parser.add_argument("--until", type=str, help="Day after the last (YYYY-MM-DD)")
+    query_parser.add_argument("--period", choices=sorted(PERIODS), default="week", help="Bucket size")
+    query_parser.add_argument("--json", action="store_true", help="Print the series as JSON")
+
+    subparsers.add_parser("rebuild", help="Recount the cumulative file from scratch")
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.dir)
+    if args.command == "rebuild":
+        (data_dir / ROLLUP_FILE).unlink(missing_ok=True)
+
+    with Rollups(data_dir / ROLLUP_FILE) as rollups:
+        added = rollups.sync(data_dir / CUMULATIVE_FILE)
+        if args.command == "rebuild":
+            print(f"🔁 Counted {added} items from {CUMULATIVE_FILE}")
+        else:
+            series = rollups.series(
+                product=args.product,
+                category=args.category,
+                sources=args.source,
+                since=args.since,
+                until=args.until,
+                period=args.period,
+            )
+            if args.json:
+                print(json.dumps(dict(series), indent=2))
+            else:
+                peak = max((count for _, count in series), default=0)
+                for label, count in series:
+                    print(f"{label}  {count:6d}  {'█' * round(40 * count / peak)}")
@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
 """Standalone AI Product Feedback Scraper.
 
-This script collects AI product feedback from Reddit and HackerNews,
-categorizes it, and outputs to JSONL format.
+This script collects AI product feedback from Reddit, HackerNews and
+Twitter/X, categorizes it, and outputs to JSONL format. Each platform is a
+`Source` registered in `SOURCES`; registered sources run concurrently.
 """
 
+import functools
+import heapq
+import itertools
 import json
-from collections.abc import Iterator
-from dataclasses import dataclass
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from urllib.parse import urlencode
 
-import httpx
+from http_cache import CachingClient, HttpCache
+from instrument import active, record, timed
+from jsonl_io import JsonlWriter
+from orchestrator import SourceStats, run_sources
+from sentiment import label_texts
+from transport import HostRateLimiter, MeteredTransport, Stopped, Transport, batched, fetch_concurrently
 
 
 # =============================================================================
@@ -24,6 +39,7 @@ class FeedbackSource(Enum):
     """Source platforms for feedback."""
     REDDIT = "reddit"
     HACKERNEWS = "hackernews"
+    TWITTER = "twitter"
 
 
 class AIProduct(Enum):
@@ -50,7 +66,7 @@ class FeedbackCategory(Enum):
     GENERAL_UX = "general_ux"
 
 
-@dataclass
+@dataclass(slots=True)
 class Feedback:
     """A piece of feedback about an AI product."""
     id: str
@@ -87,6 +103,26 @@ class Feedback:
             "processed": self.processed,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Feedback":
+        """Build a Feedback from a dictionary produced by `to_dict`."""
+        return cls(
+            id=data["id"],
+            source=FeedbackSource(data["source"]),
+            source_url=data["source_url"],
+            title=data["title"],
+            text=data["text"],
+            author=data["author"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            score=data["score"],
+            num_comments=data["num_comments"],
+            products=[AIProduct(p) for p in data["products"]],
+            categories=[FeedbackCategory(c) for c in data["categories"]],
+            sentiment=data["sentiment"],
+            collected_at=datetime.fromisoformat(data["collected_at"]),
+            processed=data.get("processed", False),
+        )
+
 
 # =============================================================================
 # Keywords for filtering
@@ -114,6 +150,53 @@ UX_KEYWORDS = [
 ]
 
 
+# Keywords that map text to a product, checked in this order.
+PRODUCT_KEYWORDS: list[tuple[AIProduct, list[str]]] = [
+    (AIProduct.CLAUDE, ["claude", "anthropic"]),
+    (AIProduct.CHATGPT, ["chatgpt", "gpt-4", "gpt-3", "openai"]),
+    (AIProduct.GEMINI, ["gemini", "bard"]),
+    (AIProduct.COPILOT, ["copilot"]),
+    (AIProduct.PERPLEXITY, ["perplexity"]),
+    (AIProduct.GROK, ["grok"]),
+]
+
+# Keywords that map text to a feedback category, checked in this order.
+CATEGORY_KEYWORDS: list[tuple[FeedbackCategory, list[str]]] = [
+    # Naming & terminology
+    (FeedbackCategory.NAMING_TERMINOLOGY, [
+        "why is it called", "why did they name", "confusing name",
+        "what does", "what's a", "what is a", "difference between",
+    ]),
+    # Feature discovery
+    (FeedbackCategory.FEATURE_DISCOVERY, [
+        "didn't know", "didn't realize", "had no idea", "just learned",
+        "didn't even know", "hidden feature", "found by accident",
+    ]),
+    # Error messages
+    (FeedbackCategory.ERROR_MESSAGES, ["error message", "error:", "failed"]),
+    # Tone
+    (FeedbackCategory.TONE, [
+        "tone", "sounds", "comes across", "robotic", "verbose", "patronizing",
+    ]),
+    # Content clarity
+    (FeedbackCategory.CONTENT_CLARITY, [
+        "unclear", "confusing", "doesn't make sense", "hard to read", "wall of text",
+    ]),
+    # Onboarding
+    (FeedbackCategory.ONBOARDING, [
+        "onboarding", "getting started", "new user", "first time", "learning curve",
+    ]),
+    # Navigation
+    (FeedbackCategory.NAVIGATION, [
+        "navigation", "find", "locate", "menu", "can't find",
+    ]),
+    # Response quality
+    (FeedbackCategory.RESPONSE_QUALITY, [
+        "response", "output", "answer", "result", "quality",
+    ]),
+]
+
+
 # =============================================================================
 # Helper functions
 # =============================================================================
@@ -131,276 +214,1215 @@ def is_relevant(text: str) -> bool:
 def extract_products(text: str) -> list[AIProduct]:
     """Extract mentioned AI products from text."""
     text_lower = text.lower()
-    products = []
-
-    if any(kw in text_lower for kw in ["claude", "anthropic"]):
-        products.append(AIProduct.CLAUDE)
-    if any(kw in text_lower for kw in ["chatgpt", "gpt-4", "gpt-3", "openai"]):
-        products.append(AIProduct.CHATGPT)
-    if any(kw in text_lower for kw in ["gemini", "bard"]):
-        products.append(AIProduct.GEMINI)
-    if "copilot" in text_lower:
-        products.append(AIProduct.COPILOT)
-    if "perplexity" in text_lower:
-        products.append(AIProduct.PERPLEXITY)
-    if "grok" in text_lower:
-        products.append(AIProduct.GROK)
-
+    products = [
+        product
+        for product, keywords in PRODUCT_KEYWORDS
+        if any(kw in text_lower for kw in keywords)
+    ]
     return products if products else [AIProduct.UNKNOWN]
 
 
 def extract_categories(text: str) -> list[FeedbackCategory]:
     """Extract feedback categories from text."""
     text_lower = text.lower()
-    categories = []
-
-    # Naming & terminology
-    if any(kw in text_lower for kw in [
-        "why is it called", "why did they name", "confusing name",
-        "what does", "what's a", "what is a", "difference between"
-    ]):
-        categories.append(FeedbackCategory.NAMING_TERMINOLOGY)
-
-    # Feature discovery
-    if any(kw in text_lower for kw in [
-        "didn't know", "didn't realize", "had no idea", "just learned",
-        "didn't even know", "hidden feature", "found by accident"
-    ]):
-        categories.append(FeedbackCategory.FEATURE_DISCOVERY)
-
-    # Error messages
-    if any(kw in text_lower for kw in ["error message", "error:", "failed"]):
-        categories.append(FeedbackCategory.ERROR_MESSAGES)
-
-    # Tone
-    if any(kw in text_lower for kw in [
-        "tone", "sounds", "comes across", "robotic", "verbose", "patronizing"
-    ]):
-        categories.append(FeedbackCategory.TONE)
+    categories = [
+        category
+        for category, keywords in CATEGORY_KEYWORDS
+        if any(kw in text_lower for kw in keywords)
+    ]
+    return categories if categories else [FeedbackCategory.GENERAL_UX]
 
-    # Content clarity
-    if any(kw in text_lower for kw in [
-        "unclear", "confusing", "doesn't make sense", "hard to read", "wall of text"
-    ]):
-        categories.append(FeedbackCategory.CONTENT_CLARITY)
 
-    # Onboarding
-    if any(kw in text_lower for kw in [
-        "onboarding", "getting started", "new user", "first time", "learning curve"
-    ]):
-        categories.append(FeedbackCategory.ONBOARDING)
+# =============================================================================
+# Compiled keyword matcher
+# =============================================================================
 
-    # Navigation
-    if any(kw in text_lower for kw in [
-        "navigation", "find", "locate", "menu", "can't find"
-    ]):
-        categories.append(FeedbackCategory.NAVIGATION)
+@dataclass
+class Classification:
+    """Relevance, products and categories found in one piece of text."""
+    relevant: bool
+    products: list[AIProduct]
+    categories: list[FeedbackCategory]
 
-    # Response quality
-    if any(kw in text_lower for kw in [
-        "response", "output", "answer", "result", "quality"
-    ]):
-        categories.append(FeedbackCategory.RESPONSE_QUALITY)
 
-    return categories if categories else [FeedbackCategory.GENERAL_UX]
+class KeywordMatcher:
+    """Classify text against every keyword table in a single pass.
+
+    All keyword lists are merged into one table where each distinct keyword
+    carries a bitmask of the lists it belongs to, so a keyword shared by
+    several lists (e.g. "confusing") is searched once instead of once per
+    function. Keywords sharing a four-character prefix are grouped and only
+    searched when the prefix occurs. The result is identical to calling
+    `is_relevant`, `extract_products` and `extract_categories` separately.
+
+    Plain substring search is used rather than a combined regex or a
+    pure-Python Aho-Corasick automaton: both scan character by character in
+    Python-level code and benchmarked slower than CPython's substring search.
+    """
+
+    _AI = 1
+    _UX = 2
+
+    def __init__(
+        self,
+        ai_keywords: list[str],
+        ux_keywords: list[str],
+        product_keywords: list[tuple[AIProduct, list[str]]],
+        category_keywords: list[tuple[FeedbackCategory, list[str]]],
+    ):
+        flags: dict[str, int] = {}
+
+        def add(keywords: list[str], bit: int) -> None:
+            for kw in keywords:
+                flags[kw] = flags.get(kw, 0) | bit
+
+        add(ai_keywords, self._AI)
+        add(ux_keywords, self._UX)
+
+        self._product_shift = 2
+        self._products = [product for product, _ in product_keywords]
+        for i, (_, keywords) in enumerate(product_keywords):
+            add(keywords, 1 << (self._product_shift + i))
+
+        self._category_shift = self._product_shift + len(product_keywords)
+        self._categories = [category for category, _ in category_keywords]
+        for i, (_, keywords) in enumerate(category_keywords):
+            add(keywords, 1 << (self._category_shift + i))
+
+        groups: dict[str, list[tuple[str, int]]] = {}
+        for kw, bits in flags.items():
+            groups.setdefault(kw[:4], []).append((kw, bits))
+        self._groups = [
+            (prefix if len(members) > 1 else None, tuple(members))
+            for prefix, members in groups.items()
+        ]
+
+        self._product_cache: dict[int, tuple[AIProduct, ...]] = {}
+        self._category_cache: dict[int, tuple[FeedbackCategory, ...]] = {}
+
+    def scan(self, text: str) -> int:
+        """Return the OR of the bitmasks of every keyword found in text."""
+        text_lower = text.lower()
+        mask = 0
+        for prefix, members in self._groups:
+            if prefix is not None and prefix not in text_lower:
+                continue
+            for kw, bits in members:
+                if kw in text_lower:
+                    mask |= bits
+        return mask
+
+    def classify(self, text: str) -> Classification:
+        """Classify text in one scan."""
+        mask = self.scan(text) if text else 0
+        return Classification(
+            relevant=bool(mask & self._AI) and bool(mask & self._UX),
+            products=list(self._decode_products(mask)),
+            categories=list(self._decode_categories(mask)),
+        )
+
+    def _decode_products(self, mask: int) -> tuple[AIProduct, ...]:
+        bits = (mask >> self._product_shift) & ((1 << len(self._products)) - 1)
+        if bits not in self._product_cache:
+            found = tuple(p for i, p in enumerate(self._products) if bits >> i & 1)
+            self._product_cache[bits] = found or (AIProduct.UNKNOWN,)
+        return self._product_cache[bits]
+
+    def _decode_categories(self, mask: int) -> tuple[FeedbackCategory, ...]:
+        bits = (mask >> self._category_shift) & ((1 << len(self._categories)) - 1)
+        if bits not in self._category_cache:
+            found = tuple(c for i, c in enumerate(self._categories) if bits >> i & 1)
+            self._category_cache[bits] = found or (FeedbackCategory.GENERAL_UX,)
+        return self._category_cache[bits]
+
+
+# Built once at import time from the keyword tables above.
+KEYWORD_MATCHER = KeywordMatcher(AI_KEYWORDS, UX_KEYWORDS, PRODUCT_KEYWORDS, CATEGORY_KEYWORDS)
+
+
+def classify(text: str) -> Classification:
+    """Return relevance, products and categories for text in one scan.
+
+    Relevance filtering and labelling share the scan, so they are reported
+    as one `classify` stage counting the items seen and kept.
+    """
+    if active() is None:
+        return KEYWORD_MATCHER.classify(text)
+    start = time.perf_counter()
+    classification = KEYWORD_MATCHER.classify(text)
+    record("classify", time.perf_counter() - start, items=1, relevant=int(classification.relevant))
+    return classification
+
+
+def classification_text(item_id: str, title: str | None, text: str | None) -> str:
+    """Text the scrapers classify an item on.
+
+    HackerNews comments (whose title is the story's, prefixed with "Re:")
+    and tweets (whose title only names the author) use their text alone,
+    everything else title and text.
+    """
+    if item_id.startswith(("hn_comment_", "twitter_")):
+        return text or ""
+    return f"{title or ''}\n\n{text or ''}"
+
+
+def label_sentiment(items: list[Feedback]) -> None:
+    """Set the sentiment of feedback items, scored as one batch."""
+    with timed("sentiment") as counts:
+        labels = label_texts([classification_text(item.id, item.title, item.text) for item in items])
+        for item, sentiment in zip(items, labels):
+            item.sentiment = sentiment
+        counts["items"] += len(items)
 
 
 # =============================================================================
 # Reddit Scraper
 # =============================================================================
 
-def scrape_reddit(limit: int = 100) -> Iterator[Feedback]:
-    """Scrape Reddit for AI product feedback."""
-    subreddits = [
-        "artificial", "ChatGPT", "ClaudeAI", "OpenAI",
-        "LocalLLaMA", "ArtificialIntelligence", "MachineLearning", "singularity",
-    ]
+# Progress files that let the next run continue where this one stopped.
+STATE_DIR = "state"
 
-    client = httpx.Client(timeout=30.0)
-    collected = 0
 
-    for subreddit in subreddits:
-        if collected >= limit:
-            break
+def _save_json(path: Path, data: object) -> None:
+    """Write a state file atomically, so a crash never leaves it half written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2) + "\n")
+    os.replace(tmp_path, path)
 
-        try:
-            url = f"https://www.reddit.com/r/{subreddit}/new.json"
-            response = client.get(
-                url,
-                headers={"User-Agent": "AI Product Feedback Collector v1.0"}
-            )
-            response.raise_for_status()
-            data = response.json()
 
-            for post in data["data"]["children"]:
-                if collected >= limit:
-                    break
+REDDIT_URL = "https://www.reddit.com"
+REDDIT_SUBREDDITS = [
+    "artificial", "ChatGPT", "ClaudeAI", "OpenAI",
+    "LocalLLaMA", "ArtificialIntelligence", "MachineLearning", "singularity",
+]
+REDDIT_USER_AGENT = "AI Product Feedback Collector v1.0"
+# Largest page Reddit serves; listings stop after roughly 1000 posts anyway.
+REDDIT_PAGE_SIZE = 100
+REDDIT_MAX_PAGES = 10
+REDDIT_CHECKPOINT_FILE = "reddit_checkpoints.json"
+
+
+class RedditCheckpoints:
+    """How far each subreddit's `new` listing has been read, persisted between runs.
+
+    Per subreddit, `newest` marks the newest post seen (`name` and
+    `created`); the next run reads down to it. `gaps` are stretches a run
+    started but did not finish (because its budget ran out or it crashed),
+    each to be resumed from the `after` fullname down to its `until` marker.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._state: dict[str, dict] = (
+            json.loads(path.read_text()) if path and path.exists() else {}
+        )
+
+    def get(self, subreddit: str) -> dict:
+        """Return a copy of one subreddit's checkpoint."""
+        state = self._state.get(subreddit, {"newest": None, "gaps": []})
+        return json.loads(json.dumps(state))
+
+    def update(self, subreddit: str, state: dict) -> None:
+        """Replace one subreddit's checkpoint and save the file."""
+        self._state[subreddit] = state
+        if self.path:
+            _save_json(self.path, self._state)
+
+
+def _reddit_post_feedback(post_data: dict, classification: Classification) -> Feedback:
+    return Feedback(
+        id=f"reddit_{post_data['id']}",
+        source=FeedbackSource.REDDIT,
+        source_url=f"https://reddit.com{post_data['permalink']}",
+        title=post_data.get("title", ""),
+        text=post_data.get("selftext", ""),
+        author=post_data.get("author"),
+        timestamp=datetime.fromtimestamp(
+            post_data["created_utc"], tz=timezone.utc
+        ),
+        score=post_data.get("score"),
+        num_comments=post_data.get("num_comments"),
+        products=classification.products,
+        categories=classification.categories,
+        sentiment=None,
+        collected_at=datetime.now(timezone.utc),
+        processed=False,
+    )
+
+
+class _SubredditWalk:
+    """Pages through one subreddit's listing down to its checkpoint.
+
+    New posts above the checkpoint are read first, then any gaps left by
+    earlier runs, until `budget` relevant posts were yielded or `max_pages`
+    pages were fetched. A post counts as read once the caller has resumed
+    after it, so closing the scraper mid-page loses nothing.
+    """
+
+    def __init__(self, subreddit: str, budget: int, checkpoints: RedditCheckpoints, max_pages: int):
+        self.subreddit = subreddit
+        self.budget = budget
+        self.checkpoints = checkpoints
+        self.max_pages = max_pages
+        self.state = checkpoints.get(subreddit)
+        self.top = {"after": None, "until": self.state["newest"]}
+        self.gaps = [self.top, *self.state["gaps"]]
+        self.collected = 0
+        self.pages = 0
+        self.stopped = False
+
+    def next_url(self, base_url: str) -> str | None:
+        """URL of the next page to read, or None when the walk is over."""
+        if self.stopped or not self.gaps or self.collected >= self.budget or self.pages >= self.max_pages:
+            return None
+        url = f"{base_url}/r/{self.subreddit}/new.json?limit={REDDIT_PAGE_SIZE}"
+        after = self.gaps[0]["after"]
+        return f"{url}&after={after}" if after else url
+
+    def read_page(self, listing: dict) -> Iterator[Feedback]:
+        """Yield the relevant posts of a fetched page and advance the checkpoint."""
+        gap = self.gaps[0]
+        self.pages += 1
+        finished = not listing["children"] or not listing.get("after")
 
+        try:
+            for post in listing["children"]:
                 post_data = post["data"]
+                until = gap["until"]
+                if until and (post_data["name"] == until["name"] or post_data["created_utc"] < until["created"]):
+                    finished = True
+                    break
+                if self.collected >= self.budget:
+                    finished = False
+                    break
+
                 title = post_data.get("title", "")
                 text = post_data.get("selftext", "")
-                combined_text = f"{title}\n\n{text}"
+                classification = classify(f"{title}\n\n{text}")
+                if classification.relevant:
+                    yield _reddit_post_feedback(post_data, classification)
+                    self.collected += 1
+
+                # The newest post becomes the next run's stopping point as soon
+                # as the walk below it is recorded as a gap.
+                if gap is self.top and gap["after"] is None:
+                    self.state["newest"] = {"name": post_data["name"], "created": post_data["created_utc"]}
+                gap["after"] = post_data["name"]
+
+            if finished:
+                self.gaps.pop(0)
+        finally:
+            self.save()
+
+    def stop(self) -> None:
+        """End the walk early, keeping unfinished gaps for the next run."""
+        self.stopped = True
+        self.save()
+
+    def save(self) -> None:
+        pending = [gap for gap in self.gaps if gap["after"] is not None]
+        self.checkpoints.update(self.subreddit, {"newest": self.state["newest"], "gaps": pending})
+
+
+def scrape_reddit(
+    limit: int = 100,
+    base_url: str = REDDIT_URL,
+    cache: HttpCache | None = None,
+    subreddits: list[str] | None = None,
+    checkpoint_path: Path | None = None,
+    max_pages: int = REDDIT_MAX_PAGES,
+    rate_limit: float | None = None,
+    transport: Transport | None = None,
+    concurrency: int | None = None,
+) -> Iterator[Feedback]:
+    """Scrape Reddit for AI product feedback.
+
+    Up to `concurrency` subreddits (all by default) are read at once, each
+    with an equal share of `limit`, following the listing's `after` cursor
+    page by page (`REDDIT_PAGE_SIZE` posts per request). Each subreddit has
+    at most one page request in flight; pages are processed as they arrive. With a `checkpoint_path`,
+    each walk stops at the newest post seen by the previous run and
+    unfinished walks are resumed; without one, up to `max_pages` pages per
+    subreddit are read. Requests go through `transport` (retries, pooling,
+    rate limiting); without one a private transport is used, limited to
+    `rate_limit` requests per second. With a `cache`, listings that have not
+    changed since the last run are revalidated with a conditional request
+    instead of re-downloaded.
+    """
+    subreddits = subreddits or REDDIT_SUBREDDITS
+    checkpoints = RedditCheckpoints(checkpoint_path)
+    walks = [
+        _SubredditWalk(
+            subreddit,
+            limit // len(subreddits) + (1 if i < limit % len(subreddits) else 0),
+            checkpoints,
+            max_pages,
+        )
+        for i, subreddit in enumerate(subreddits)
+    ]
+    concurrency = max(1, min(concurrency or len(walks), len(walks)))
+    own_transport = transport is None
+    if transport is None:
+        transport = Transport(
+            max_connections=concurrency,
+            rate_limiter=HostRateLimiter(rate_limit) if rate_limit else None,
+        )
+    client = CachingClient(transport, cache)
+
+    def fetch_page(url: str) -> dict:
+        response = client.get(url, headers={"User-Agent": REDDIT_USER_AGENT})
+        response.raise_for_status()
+        return response.json()["data"]
+
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending: dict[Future, _SubredditWalk] = {}
+    queued = iter(walks)
+
+    def request_next(walk: _SubredditWalk | None = None) -> None:
+        """Request the walk's next page, or start a queued walk once it is over."""
+        url = walk.next_url(base_url) if walk else None
+        while not url:
+            walk = next(queued, None)
+            if walk is None:
+                return
+            url = walk.next_url(base_url)
+        pending[pool.submit(fetch_page, url)] = walk
 
-                if not is_relevant(combined_text):
+    try:
+        for _ in range(concurrency):
+            request_next()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                walk = pending.pop(future)
+                try:
+                    listing = future.result()
+                except Exception as e:
+                    print(f"  Error scraping r/{walk.subreddit}: {e}")
+                    walk.stop()
+                    request_next()
                     continue
+                yield from walk.read_page(listing)
+                request_next(walk)
 
-                feedback = Feedback(
-                    id=f"reddit_{post_data['id']}",
-                    source=FeedbackSource.REDDIT,
-                    source_url=f"https://reddit.com{post_data['permalink']}",
-                    title=title,
-                    text=text,
-                    author=post_data.get("author"),
-                    timestamp=datetime.fromtimestamp(
-                        post_data["created_utc"], tz=timezone.utc
-                    ),
-                    score=post_data.get("score"),
-                    num_comments=post_data.get("num_comments"),
-                    products=extract_products(combined_text),
-                    categories=extract_categories(combined_text),
-                    sentiment=None,
-                    collected_at=datetime.now(timezone.utc),
-                    processed=False,
-                )
-
-                yield feedback
-                collected += 1
-
-        except Exception as e:
-            print(f"  Error scraping r/{subreddit}: {e}")
-            continue
-
-    client.close()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if own_transport:
+            client.close()
 
 
 # =============================================================================
 # HackerNews Scraper
 # =============================================================================
 
-def scrape_hackernews(limit: int = 100) -> Iterator[Feedback]:
-    """Scrape HackerNews for AI product feedback."""
-    client = httpx.Client(timeout=30.0)
-    base_url = "https://hacker-news.firebaseio.com/v0"
+HN_API_URL = "https://hacker-news.firebaseio.com/v0"
+HN_MAX_STORIES = 500
+# Replies followed per comment (and top-level comments per story), in HN's
+# ranking order, and how many levels down a thread is followed.
+HN_MAX_KIDS = 10
+HN_MAX_DEPTH = 3
+# Comment requests one run may spend over all threads, catch-up included.
+HN_COMMENT_BUDGET = 2_000
+HN_CONCURRENCY = 16
+# Items are rarely edited after the first hour, so cached copies are reused
+# for this long before the API is asked again.
+HN_ITEM_TTL = 6 * 60 * 60
+# Stories this young are re-checked for new comments on the next run, up to
+# HN_CATCH_UP_LIMIT of them (busiest threads first).
+HN_CATCH_UP_HOURS = 48
+HN_CATCH_UP_LIMIT = 30
+HN_CURSOR_FILE = "hn_cursor.json"
+
+
+@dataclass
+class HNCursor:
+    """Where previous HackerNews runs stopped, persisted between runs.
+
+    `last_story_id` and `last_story_time` mark the newest story inspected so
+    far; only newer stories are fetched. `skipped_ids` are stories below the
+    mark that a run never reached (e.g. because `limit` was hit), so the next
+    run still picks them up. `recent` maps the IDs of young stories to their
+    `time`, `descendants` and the highest comment ID already checked, so
+    growing threads can be caught up on.
+    """
+    last_story_id: int = 0
+    last_story_time: int = 0
+    skipped_ids: list[int] = field(default_factory=list)
+    recent: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "HNCursor":
+        """Load the cursor, or start from scratch if the file doesn't exist."""
+        if not path.exists():
+            return cls()
+        return cls(**json.loads(path.read_text()))
+
+    def save(self, path: Path) -> None:
+        """Write the cursor atomically."""
+        _save_json(path, asdict(self))
+
+
+def _hn_story_feedback(story: dict, classification: Classification) -> Feedback:
+    return Feedback(
+        id=f"hn_story_{story['id']}",
+        source=FeedbackSource.HACKERNEWS,
+        source_url=f"https://news.ycombinator.com/item?id={story['id']}",
+        title=story.get("title", ""),
+        text=story.get("text", ""),
+        author=story.get("by"),
+        timestamp=datetime.fromtimestamp(story["time"], tz=timezone.utc),
+        score=story.get("score"),
+        num_comments=story.get("descendants"),
+        products=classification.products,
+        categories=classification.categories,
+        sentiment=None,
+        collected_at=datetime.now(timezone.utc),
+        processed=False,
+    )
+
+
+def _hn_comment_feedback(comment: dict, title: str, classification: Classification) -> Feedback:
+    return Feedback(
+        id=f"hn_comment_{comment['id']}",
+        source=FeedbackSource.HACKERNEWS,
+        source_url=f"https://news.ycombinator.com/item?id={comment['id']}",
+        title=f"Re: {title[:50]}...",
+        text=comment["text"],
+        author=comment.get("by"),
+        timestamp=datetime.fromtimestamp(comment["time"], tz=timezone.utc),
+        score=None,
+        num_comments=None,
+        products=classification.products,
+        categories=classification.categories,
+        sentiment=None,
+        collected_at=datetime.now(timezone.utc),
+        processed=False,
+    )
+
+
+def _hn_kids_to_check(story: dict, after: int = 0, fanout: int = HN_MAX_KIDS) -> list[int]:
+    """First-level comments to inspect: the first few newer than `after`."""
+    return [kid for kid in story.get("kids", []) if kid > after][:fanout]
+
+
+@dataclass
+class CommentCrawlStats:
+    """How much of the comment threads one crawl reached, and at what cost."""
+    threads: int = 0
+    # Comments the crawled threads hold, by their stories' `descendants`
+    descendants: int = 0
+    requests: int = 0
+    comments: int = 0
+    # Replies left out, with their own replies uncounted
+    beyond_depth: int = 0
+    beyond_fanout: int = 0
+    over_budget: int = 0
+
+    @property
+    def coverage(self) -> float:
+        return self.comments / self.descendants if self.descendants else 1.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.comments} of {self.descendants} comments ({self.coverage:.0%}) in {self.threads} threads "
+            f"with {self.requests} requests; left out {self.over_budget} over budget, "
+            f"{self.beyond_depth} too deep, {self.beyond_fanout} past fan-out"
+        )
+
+
+class HNCommentCrawler:
+    """Breadth-first walk of HackerNews comment threads under a request budget.
+
+    Threads are added with `add`, then `crawl` fetches their comments with
+    up to `concurrency` requests in flight. Threads of relevant stories are
+    walked first, then the rest; within each group the next request goes to
+    the shallowest comment waiting, and among equally deep ones to the
+    busiest thread. So when `budget` runs out it is the deepest replies of
+    the least promising threads that are left out. With `prioritize` off,
+    all threads are walked breadth-first in the order they were added. Each
+    thread is followed at most `max_depth` levels down (top-level comments
+    are level 1), through at most `max_fanout` replies of each comment.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], dict | None],
+        pool: ThreadPoolExecutor,
+        budget: int = HN_COMMENT_BUDGET,
+        max_depth: int = HN_MAX_DEPTH,
+        max_fanout: int = HN_MAX_KIDS,
+        concurrency: int = HN_CONCURRENCY,
+        prioritize: bool = True,
+    ):
+        self.fetch = fetch
+        self.pool = pool
+        self.budget = budget
+        self.max_depth = max_depth
+        self.max_fanout = max_fanout
+        self.concurrency = max(1, concurrency)
+        self.prioritize = prioritize
+        self.stats = CommentCrawlStats()
+        # Heap of (group, depth, rank, order, story ID, comment ID)
+        self._frontier: list[tuple] = []
+        self._order = itertools.count()
+        # Comments waiting or in flight per thread
+        self._pending: Counter = Counter()
+
+    def add(self, story_id: int, kid_ids: list[int], descendants: int = 0, relevant: bool = False) -> None:
+        """Queue a thread's top-level comments; `descendants` is how many comments it holds."""
+        self.stats.threads += 1
+        self.stats.descendants += descendants
+        group, rank = (int(not relevant), -descendants) if self.prioritize else (0, 0)
+        self._push(story_id, kid_ids, group, 1, rank)
+
+    def _push(self, story_id: int, kid_ids: list[int], group: int, depth: int, rank: int) -> None:
+        if depth > self.max_depth:
+            self.stats.beyond_depth += len(kid_ids)
+            return
+        self.stats.beyond_fanout += max(0, len(kid_ids) - self.max_fanout)
+        for kid in kid_ids[:self.max_fanout]:
+            heapq.heappush(self._frontier, (group, depth, rank, next(self._order), story_id, kid))
+            self._pending[story_id] += 1
+
+    def complete(self, story_id: int) -> bool:
+        """True once the crawl has gone as far into a thread as its depth and fan-out allow."""
+        return not self._pending[story_id]
+
+    def crawl(self) -> Iterator[tuple[int, dict]]:
+        """Yield `(story_id, comment)` for every live comment reached.
+
+        Results are released (the comment yielded, its replies queued) in
+        frontier order: a finished request waits until it is the lowest
+        entry still in flight. Replies always sort after their parent, so
+        this is the order a serial crawl visits comments in, and neither it
+        nor which comments fit in the budget depends on network timing.
+        """
+        # Heap of (frontier entry, future); entries are unique, so futures are never compared
+        in_flight: list[tuple[tuple, Future]] = []
+        try:
+            while True:
+                while self._frontier and len(in_flight) < self.concurrency and self.stats.requests < self.budget:
+                    entry = heapq.heappop(self._frontier)
+                    heapq.heappush(in_flight, (entry, self.pool.submit(self.fetch, entry[-1])))
+                    self.stats.requests += 1
+                if not in_flight:
+                    break
+
+                (group, depth, rank, _, story_id, _), future = heapq.heappop(in_flight)
+                self._pending[story_id] -= 1
+                comment = future.result()
+                if not comment:
+                    continue
+                self._push(story_id, comment.get("kids", []), group, depth + 1, rank)
+                if "text" in comment and not comment.get("deleted") and not comment.get("dead"):
+                    self.stats.comments += 1
+                    yield story_id, comment
+
+            self.stats.over_budget += len(self._frontier)
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+
+def scrape_hackernews(
+    limit: int = 100,
+    concurrency: int = HN_CONCURRENCY,
+    rate_limit: float | None = None,
+    base_url: str = HN_API_URL,
+    cache: HttpCache | None = None,
+    item_ttl: float = HN_ITEM_TTL,
+    cursor_path: Path | None = None,
+    catch_up_hours: float = HN_CATCH_UP_HOURS,
+    catch_up_limit: int = HN_CATCH_UP_LIMIT,
+    transport: Transport | None = None,
+    comment_budget: int = HN_COMMENT_BUDGET,
+    max_depth: int = HN_MAX_DEPTH,
+    max_fanout: int = HN_MAX_KIDS,
+) -> Iterator[Feedback]:
+    """Scrape HackerNews for AI product feedback.
+
+    Stories are fetched in batches of `concurrency` items and yielded in the
+    order of `newstories.json`. Their comment threads are then crawled
+    breadth-first by an `HNCommentCrawler`: up to `max_depth` levels down,
+    `max_fanout` replies per comment and `comment_budget` comment requests
+    in all, with relevant stories and then the busiest threads served
+    first. Comments are yielded in crawl order, whatever order their
+    requests finish in. Requests go
+    through `transport` (retries, pooling, rate limiting); without one a
+    private transport is used, limited to `rate_limit` requests per second.
+    With a `cache`, items fetched within `item_ttl` seconds are served from
+    disk.
+
+    With a `cursor_path`, only stories newer than the previous run's
+    high-water mark (plus any it skipped) are fetched, and up to
+    `catch_up_limit` stories younger than `catch_up_hours` are re-checked
+    for new top-level comments, which are crawled along with the new
+    threads. The cursor is saved when the generator finishes or is closed;
+    a story only counts as done once the crawl has finished its thread and
+    all its items have been yielded, so threads cut short by the budget are
+    crawled again (mostly from `cache`) on the next run.
+    """
+    own_transport = transport is None
+    if transport is None:
+        transport = Transport(
+            max_connections=concurrency,
+            rate_limiter=HostRateLimiter(rate_limit) if rate_limit else None,
+        )
+    client = CachingClient(transport, cache)
+    cursor = HNCursor.load(cursor_path) if cursor_path else None
     collected = 0
+    done: dict[int, dict] = {}
 
-    def fetch_item(item_id: int) -> dict | None:
+    def fetch(item_id: int, ttl: float | None) -> dict | None:
+        url = f"{base_url}/item/{item_id}.json"
         try:
-            response = client.get(f"{base_url}/item/{item_id}.json")
+            response = client.get(url, ttl=ttl)
             response.raise_for_status()
             return response.json()
+        except Stopped:
+            # Ends the crawl instead of reading as a missing item
+            raise
         except Exception:
             return None
 
+    def fetch_item(item_id: int) -> dict | None:
+        return fetch(item_id, item_ttl)
+
+    def fetch_fresh(item_id: int) -> dict | None:
+        return fetch(item_id, None)
+
+    def mark_done(story: dict, kid_ids: list[int], previous_max_kid: int = 0) -> None:
+        done[story["id"]] = {
+            "time": story.get("time", 0),
+            "descendants": story.get("descendants", 0),
+            "max_kid": max(kid_ids, default=previous_max_kid),
+        }
+
+    story_ids: list[int] = []
+    # Threads to crawl: story and the top-level comment checked up to before this run
+    threads: dict[int, tuple[dict, int]] = {}
+    crawler: HNCommentCrawler | None = None
     try:
         response = client.get(f"{base_url}/newstories.json")
         response.raise_for_status()
-        story_ids = response.json()[:500]
-
-        for story_id in story_ids:
-            if collected >= limit:
-                break
+        story_ids = response.json()[:HN_MAX_STORIES]
+        if cursor:
+            skipped = set(cursor.skipped_ids)
+            story_ids = [i for i in story_ids if i > cursor.last_story_id or i in skipped]
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            crawler = HNCommentCrawler(
+                fetch_item, pool, budget=comment_budget, max_depth=max_depth, max_fanout=max_fanout,
+                concurrency=concurrency,
+            )
 
-            story = fetch_item(story_id)
-            if not story:
-                continue
+            for batch in batched(story_ids, max(1, concurrency)):
+                if collected >= limit:
+                    break
 
-            title = story.get("title", "")
-            text = story.get("text", "")
-            combined_text = f"{title}\n\n{text}"
-
-            if is_relevant(combined_text):
-                feedback = Feedback(
-                    id=f"hn_story_{story['id']}",
-                    source=FeedbackSource.HACKERNEWS,
-                    source_url=f"https://news.ycombinator.com/item?id={story['id']}",
-                    title=title,
-                    text=text,
-                    author=story.get("by"),
-                    timestamp=datetime.fromtimestamp(story["time"], tz=timezone.utc),
-                    score=story.get("score"),
-                    num_comments=story.get("descendants"),
-                    products=extract_products(combined_text),
-                    categories=extract_categories(combined_text),
-                    sentiment=None,
-                    collected_at=datetime.now(timezone.utc),
-                    processed=False,
-                )
-
-                yield feedback
-                collected += 1
-
-            # Check first-level comments
-            if collected < limit and "kids" in story:
-                for comment_id in story.get("kids", [])[:10]:
+                stories = fetch_concurrently(fetch_item, batch, pool)
+                for story_id in batch:
                     if collected >= limit:
                         break
 
-                    comment = fetch_item(comment_id)
-                    if not comment or "text" not in comment:
+                    story = stories[story_id]
+                    if not story:
                         continue
 
-                    comment_text = comment["text"]
-
-                    if is_relevant(comment_text):
-                        feedback = Feedback(
-                            id=f"hn_comment_{comment['id']}",
-                            source=FeedbackSource.HACKERNEWS,
-                            source_url=f"https://news.ycombinator.com/item?id={comment['id']}",
-                            title=f"Re: {title[:50]}...",
-                            text=comment_text,
-                            author=comment.get("by"),
-                            timestamp=datetime.fromtimestamp(comment["time"], tz=timezone.utc),
-                            score=None,
-                            num_comments=None,
-                            products=extract_products(comment_text),
-                            categories=extract_categories(comment_text),
-                            sentiment=None,
-                            collected_at=datetime.now(timezone.utc),
-                            processed=False,
-                        )
-
-                        yield feedback
+                    combined_text = f"{story.get('title', '')}\n\n{story.get('text', '')}"
+                    classification = classify(combined_text)
+                    if classification.relevant:
+                        yield _hn_story_feedback(story, classification)
                         collected += 1
 
+                    threads[story_id] = (story, 0)
+                    crawler.add(story_id, story.get("kids", []), story.get("descendants", 0), classification.relevant)
+
+            # Catch up on comment threads from earlier runs that are still growing
+            if cursor and collected < limit and catch_up_limit > 0:
+                cutoff = time.time() - catch_up_hours * 3600
+                candidates = sorted(
+                    (
+                        (int(story_id), entry)
+                        for story_id, entry in cursor.recent.items()
+                        if entry["time"] >= cutoff and int(story_id) not in threads
+                    ),
+                    key=lambda pair: pair[1]["descendants"],
+                    reverse=True,
+                )[:catch_up_limit]
+
+                stories = fetch_concurrently(fetch_fresh, [story_id for story_id, _ in candidates], pool)
+                for story_id, entry in candidates:
+                    story = stories[story_id]
+                    if not story:
+                        continue
+                    relevant = classify(f"{story.get('title', '')}\n\n{story.get('text', '')}").relevant
+                    threads[story_id] = (story, entry["max_kid"])
+                    crawler.add(
+                        story_id,
+                        [kid for kid in story.get("kids", []) if kid > entry["max_kid"]],
+                        max(0, story.get("descendants", 0) - entry["descendants"]),
+                        relevant,
+                    )
+
+            if collected < limit:
+                comments = crawler.crawl()
+                try:
+                    for story_id, comment in comments:
+                        classification = classify(comment["text"])
+                        if classification.relevant:
+                            yield _hn_comment_feedback(comment, threads[story_id][0].get("title", ""), classification)
+                            collected += 1
+                            if collected >= limit:
+                                break
+                finally:
+                    comments.close()
+
+    except Stopped:
+        pass
     except Exception as e:
         print(f"  Error scraping HackerNews: {e}")
 
-    client.close()
+    finally:
+        if own_transport:
+            client.close()
+        if crawler:
+            print(f"  HackerNews comments: {crawler.stats.summary()}")
+            record("hn_comments", calls=0, **asdict(crawler.stats))
+            for story_id, (story, after) in threads.items():
+                if crawler.complete(story_id):
+                    mark_done(story, _hn_kids_to_check(story, after, max_fanout), after)
+        if cursor and cursor_path:
+            _advance_hn_cursor(cursor, story_ids, done, catch_up_hours)
+            cursor.save(cursor_path)
+
+
+def _advance_hn_cursor(cursor: HNCursor, story_ids: list[int], done: dict[int, dict], catch_up_hours: float) -> None:
+    """Move the cursor past the stories finished in this run."""
+    newest = max((story_id for story_id in done if story_id in story_ids), default=None)
+    if newest is not None and newest > cursor.last_story_id:
+        cursor.last_story_id = newest
+        cursor.last_story_time = done[newest]["time"]
+    cursor.skipped_ids = [story_id for story_id in story_ids if story_id not in done]
+
+    cutoff = time.time() - catch_up_hours * 3600
+    recent = {**cursor.recent, **{str(story_id): entry for story_id, entry in done.items()}}
+    cursor.recent = {story_id: entry for story_id, entry in recent.items() if entry["time"] >= cutoff}
 
 
 # =============================================================================
-# Main collection function
+# Twitter/X Scraper
 # =============================================================================
 
-def collect_feedback(limit: int = 100, output_path: Path | None = None) -> list[Feedback]:
-    """Collect feedback from all sources."""
-    all_feedback = []
+TWITTER_API_URL = "https://api.twitter.com/2"
+TWITTER_TOKEN_ENV = "TWITTER_BEARER_TOKEN"
+# Recent search serves at most 100 tweets per request (and at least 10).
+TWITTER_PAGE_SIZE = 100
+TWITTER_MAX_PAGES = 10
+# Longest query the recent search endpoint accepts on the basic tier.
+TWITTER_MAX_QUERY_LENGTH = 512
+TWITTER_CONCURRENCY = 4
+TWITTER_SINCE_FILE = "twitter_since.json"
+TWITTER_PRODUCTS = ["claude", "chatgpt", "gemini", "copilot", "perplexity", "grok"]
+TWITTER_TOPICS = [
+    "ux", "ui", "interface", "confusing", "unclear", "onboarding", "\"error message\"",
+    "tone", "verbose", "wording", "navigation", "settings", "\"hard to find\"", "frustrating",
+    "annoying", "\"user experience\"", "terminology", "\"new feature\"", "hallucination",
+    "\"doesn't understand\"", "design", "menu", "sidebar", "layout", "refuses",
+]
+
+
+def twitter_queries(
+    products: list[str] | None = None,
+    topics: list[str] | None = None,
+    max_length: int = TWITTER_MAX_QUERY_LENGTH,
+) -> list[str]:
+    """Search queries matching any product together with any topic.
+
+    Topics are packed into as few queries as fit in `max_length`, so each
+    request pages through all of them at once instead of one search per
+    keyword pair.
+    """
+    products = products or TWITTER_PRODUCTS
+    topics = topics or TWITTER_TOPICS
+
+    def query(terms: list[str]) -> str:
+        return f"({' OR '.join(products)}) ({' OR '.join(terms)}) -is:retweet lang:en"
+
+    queries = []
+    terms: list[str] = []
+    for topic in topics:
+        if terms and len(query([*terms, topic])) > max_length:
+            queries.append(query(terms))
+            terms = []
+        terms.append(topic)
+    if terms:
+        queries.append(query(terms))
+    return queries
+
+
+def _tweet_feedback(tweet: dict, username: str | None, classification: Classification) -> Feedback:
+    metrics = tweet.get("public_metrics", {})
+    return Feedback(
+        id=f"twitter_{tweet['id']}",
+        source=FeedbackSource.TWITTER,
+        source_url=f"https://x.com/{username or 'i/web'}/status/{tweet['id']}",
+        title=f"Post by @{username}" if username else None,
+        text=tweet["text"],
+        author=username,
+        timestamp=datetime.fromisoformat(tweet["created_at"]),
+        score=metrics.get("like_count"),
+        num_comments=metrics.get("reply_count"),
+        products=classification.products,
+        categories=classification.categories,
+        sentiment=None,
+        collected_at=datetime.now(timezone.utc),
+        processed=False,
+    )
+
+
+def scrape_twitter(
+    limit: int = 100,
+    base_url: str = TWITTER_API_URL,
+    cache: HttpCache | None = None,
+    bearer_token: str | None = None,
+    queries: list[str] | None = None,
+    since_path: Path | None = None,
+    max_pages: int = TWITTER_MAX_PAGES,
+    page_size: int = TWITTER_PAGE_SIZE,
+    rate_limit: float | None = None,
+    transport: Transport | None = None,
+    concurrency: int = TWITTER_CONCURRENCY,
+) -> Iterator[Feedback]:
+    """Scrape Twitter/X recent search for AI product feedback.
+
+    Each of `queries` (by default `twitter_queries()`) is paged through with
+    the response's `next_token`, `page_size` tweets per request, up to
+    `max_pages` pages; up to `concurrency` queries are in flight at once and
+    tweets matched by several queries are yielded once. Tweets are
+    classified on their text like HackerNews comments. `bearer_token`
+    defaults to the `TWITTER_BEARER_TOKEN` environment variable. Requests
+    go through `transport`; without one a private transport is used,
+    limited to `rate_limit` requests per second.
+
+    With a `since_path`, each query only asks for tweets newer than the
+    newest one it returned last time. A query's mark moves once it has been
+    read to the end (or to `max_pages`), not when `limit` cut it short.
+    """
+    bearer_token = bearer_token or os.environ.get(TWITTER_TOKEN_ENV)
+    if not bearer_token:
+        raise ValueError(f"{TWITTER_TOKEN_ENV} is not set")
+    queries = queries or twitter_queries()
+    since: dict[str, str] = json.loads(since_path.read_text()) if since_path and since_path.exists() else {}
+    concurrency = max(1, min(concurrency, len(queries)))
+    own_transport = transport is None
+    if transport is None:
+        transport = Transport(
+            max_connections=concurrency,
+            rate_limiter=HostRateLimiter(rate_limit) if rate_limit else None,
+        )
+    client = CachingClient(transport, cache)
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+
+    def fetch_page(query: str, next_token: str | None) -> dict:
+        params = {
+            "query": query,
+            "max_results": page_size,
+            "tweet.fields": "created_at,public_metrics,author_id",
+            "expansions": "author_id",
+            "user.fields": "username",
+        }
+        if query in since:
+            params["since_id"] = since[query]
+        if next_token:
+            params["next_token"] = next_token
+        response = client.get(f"{base_url}/tweets/search/recent?{urlencode(params)}", headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending: dict[Future, str] = {}
+    queued = iter(queries)
+    pages: dict[str, int] = {}
+    newest: dict[str, str] = {}
+    seen: set[str] = set()
+    collected = 0
+
+    def request(query: str | None = None, next_token: str | None = None) -> None:
+        """Request a query's next page, or start a queued query."""
+        if query is None:
+            query = next(queued, None)
+            if query is None:
+                return
+        pending[pool.submit(fetch_page, query, next_token)] = query
+
+    try:
+        for _ in range(concurrency):
+            request()
+
+        while pending and collected < limit:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                query = pending.pop(future)
+                try:
+                    page = future.result()
+                except Exception as e:
+                    print(f"  Error searching Twitter for {query!r}: {e}")
+                    request()
+                    continue
+
+                pages[query] = pages.get(query, 0) + 1
+                meta = page.get("meta", {})
+                if pages[query] == 1 and meta.get("newest_id"):
+                    newest[query] = meta["newest_id"]
+                usernames = {user["id"]: user.get("username") for user in page.get("includes", {}).get("users", [])}
+
+                for tweet in page.get("data", []):
+                    if collected >= limit:
+                        break
+                    if tweet["id"] in seen:
+                        continue
+                    seen.add(tweet["id"])
+                    classification = classify(tweet["text"])
+                    if classification.relevant:
+                        yield _tweet_feedback(tweet, usernames.get(tweet.get("author_id")), classification)
+                        collected += 1
+
+                if collected >= limit:
+                    break
+                if meta.get("next_token") and pages[query] < max_pages:
+                    request(query, meta["next_token"])
+                else:
+                    if query in newest:
+                        since[query] = newest[query]
+                    request()
 
-    print("\n🔍 Scraping Reddit...")
-    reddit_count = 0
-    for feedback in scrape_reddit(limit=limit):
-        all_feedback.append(feedback)
-        reddit_count += 1
-        print(f"  [{reddit_count}] {feedback.products[0].value}: {feedback.title[:60] if feedback.title else '(no title)'}...")
-    print(f"  ✓ Collected {reddit_count} items from Reddit")
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if own_transport:
+            client.close()
+        if since_path:
+            _save_json(since_path, since)
 
-    print("\n🔍 Scraping HackerNews...")
-    hn_count = 0
-    for feedback in scrape_hackernews(limit=limit):
-        all_feedback.append(feedback)
-        hn_count += 1
-        print(f"  [{hn_count}] {feedback.products[0].value}: {feedback.title[:60] if feedback.title else '(no title)'}...")
-    print(f"  ✓ Collected {hn_count} items from HackerNews")
 
-    print(f"\n📊 Total collected: {len(all_feedback)} items")
+# =============================================================================
+# Main collection function
+# =============================================================================
 
+@dataclass
+class Source:
+    """A feedback source plugin run by `stream_feedback`.
+
+    Every source follows the same contract: `scrape` is called with
+    `limit`, `cache`, `transport` and `concurrency` keyword arguments (plus
+    any `source_options` given for it), fetches pages through the shared
+    transport, parses the relevant ones into `Feedback` and yields each item
+    as soon as it is parsed, handling failed requests itself. `concurrency`
+    is the most requests the source keeps in flight, and the shared
+    transport gets that many connections for it. `host_rates` caps requests
+    per second to the source's hosts. `state_options` returns the keyword
+    arguments that keep the source's progress files in a state directory.
+    Sources whose `configured` check fails (e.g. a missing API token) are
+    skipped unless asked for by name.
+    """
+    name: str
+    scrape: Callable[..., Iterator[Feedback]]
+    concurrency: int
+    host_rates: dict[str, float] = field(default_factory=dict)
+    state_options: Callable[[Path], dict] | None = None
+    configured: Callable[[], bool] = lambda: True
+
+
+# Every source registered here runs concurrently in `stream_feedback`.
+SOURCES: dict[str, Source] = {}
+
+
+def register_source(source: Source) -> Source:
+    """Add a source to `SOURCES`, replacing any source of the same name."""
+    SOURCES[source.name] = source
+    return source
+
+
+register_source(Source(
+    name="reddit",
+    scrape=scrape_reddit,
+    concurrency=len(REDDIT_SUBREDDITS),
+    host_rates={"www.reddit.com": 1.0},
+    state_options=lambda state_dir: {"checkpoint_path": state_dir / REDDIT_CHECKPOINT_FILE},
+))
+register_source(Source(
+    name="hackernews",
+    scrape=scrape_hackernews,
+    concurrency=HN_CONCURRENCY,
+    state_options=lambda state_dir: {"cursor_path": state_dir / HN_CURSOR_FILE},
+))
+register_source(Source(
+    name="twitter",
+    scrape=scrape_twitter,
+    concurrency=TWITTER_CONCURRENCY,
+    # App-only recent search allows 450 requests per 15 minutes.
+    host_rates={"api.twitter.com": 0.5},
+    state_options=lambda state_dir: {"since_path": state_dir / TWITTER_SINCE_FILE},
+    configured=lambda: bool(os.environ.get(TWITTER_TOKEN_ENV)),
+))
+
+
+def source_state_options(state_dir: Path) -> dict[str, dict]:
+    """`source_options` that keep each source's progress files in `state_dir`."""
+    return {name: source.state_options(state_dir) for name, source in SOURCES.items() if source.state_options}
+
+
+# Items collected before their sentiment is scored together.
+SENTIMENT_BATCH_SIZE = 64
+
+
+def stream_feedback(
+    limit: int = 100,
+    output_path: Path | None = None,
+    sources: list[str] | None = None,
+    cache: HttpCache | None = None,
+    source_options: dict[str, dict] | None = None,
+    transport: Transport | None = None,
+) -> Iterator[Feedback]:
+    """Collect feedback from all sources, yielding items as they arrive.
+
+    `limit` applies to each source separately. `sources` selects a subset of
+    `SOURCES` by name; all configured sources run when omitted. Each item is
+    written to `output_path` (if given) before it is yielded, so nothing is
+    accumulated in memory. `cache` is shared by every source's HTTP requests.
+    `source_options` maps source names to extra keyword arguments for that
+    source, e.g. `{"hackernews": {"cursor_path": path}}`. Sentiment is
+    scored in batches of `SENTIMENT_BATCH_SIZE`, so items are written and
+    yielded a batch at a time. All sources share
+    one `transport`; by default a pooled one using HTTP/2 where available,
+    with connections for every selected source's `concurrency` and their
+    `host_rates`.
+    """
+    if sources is None:
+        selected = [name for name, source in SOURCES.items() if source.configured()]
+        for name in SOURCES:
+            if name not in selected:
+                print(f"⏭️  Skipping {name}: not configured")
+    else:
+        selected = sources
+    unknown = [name for name in selected if name not in SOURCES]
+    if unknown:
+        raise ValueError(f"Unknown source(s): {', '.join(unknown)}")
+
+    stats: dict[str, SourceStats] = {}
+    own_transport = transport is None
+    if transport is None:
+        transport = Transport(
+            max_connections=max(1, sum(SOURCES[name].concurrency for name in selected)),
+            http2=True,
+            rate_limiter=HostRateLimiter(
+                None, host_rates={host: rate for name in selected for host, rate in SOURCES[name].host_rates.items()}
+            ),
+        )
+    writer = JsonlWriter(output_path) if output_path else None
+    count = 0
+    # Set when the stream is closed early; ends the sources' requests
+    stop = threading.Event()
+
+    print(f"\n🔍 Scraping {', '.join(selected)}...")
+    runners = {
+        name: functools.partial(
+            SOURCES[name].scrape,
+            **{
+                "limit": limit,
+                "cache": cache,
+                "transport": MeteredTransport(transport, f"fetch:{name}", stop),
+                "concurrency": SOURCES[name].concurrency,
+                **(source_options or {}).get(name, {}),
+            },
+        )
+        for name in selected
+    }
+    pending: list[tuple[str, Feedback]] = []
+
+    def flush() -> Iterator[Feedback]:
+        nonlocal count
+        if not pending:
+            return
+        label_sentiment([feedback for _, feedback in pending])
+        for name, feedback in pending:
+            if writer:
+                with timed("write") as counts:
+                    writer.write(feedback.to_dict())
+                    counts["items"] += 1
+            count += 1
+            print(f"  [{count}] {name} {feedback.products[0].value}: {feedback.title[:60] if feedback.title else '(no title)'}...")
+            yield feedback
+        pending.clear()
+
+    merged = run_sources(runners, stats, stop)
+    try:
+        for pair in merged:
+            pending.append(pair)
+            if len(pending) >= SENTIMENT_BATCH_SIZE:
+                yield from flush()
+        yield from flush()
+    finally:
+        # Stops the sources and waits for them before their shared transport is closed
+        merged.close()
+        if writer:
+            writer.close()
+        if own_transport:
+            running = [name for name in selected if name not in stats]
+            if running:
+                print(f"⚠️  {', '.join(running)} still running; leaving the HTTP transport open")
+            else:
+                transport.close()
+
+    for name in selected:
+        source_stats = stats[name]
+        record(f"source:{name}", source_stats.elapsed, items=source_stats.items, failed=int(bool(source_stats.error)))
+        if source_stats.error:
+            print(f"  ✗ {name} failed after {source_stats.items} items ({source_stats.elapsed:.1f}s): {source_stats.error}")
+        else:
+            print(f"  ✓ Collected {source_stats.items} items from {name} in {source_stats.elapsed:.1f}s")
+
+    print(f"\n📊 Total collected: {count} items")
+    print(f"🌐 HTTP: {transport.stats.summary()}")
+    record(
+        "http",
+        calls=0,
+        requests=transport.stats.requests,
+        retries=transport.stats.retries,
+        failed=transport.stats.failures,
+        throttled=transport.stats.throttled,
+        connections=transport.stats.connections,
+    )
+    if cache:
+        print(f"🗃️  HTTP cache: {cache.stats.summary()}")
+        record(
+            "http_cache",
+            calls=0,
+            hits=cache.stats.hits,
+            revalidated=cache.stats.revalidated,
+            misses=cache.stats.misses,
+            bytes_saved=cache.stats.bytes_saved,
+        )
     if output_path:
-        with output_path.open("w") as f:
-            for feedback in all_feedback:
-                f.write(json.dumps(feedback.to_dict()) + "\n")
         print(f"💾 Saved to {output_path}")
 
-    return all_feedback
+
+def collect_feedback(
+    limit: int = 100,
+    output_path: Path | None = None,
+    sources: list[str] | None = None,
+    cache: HttpCache | None = None,
+    source_options: dict[str, dict] | None = None,
+) -> list[Feedback]:
+    """Collect feedback from all sources into a list.
+
+    Convenience wrapper around `stream_feedback` for small runs.
+    """
+    return list(stream_feedback(
+        limit=limit, output_path=output_path, sources=sources, cache=cache, source_options=source_options
+    ))
 
 
 if __name__ == "__main__":
@@ -409,7 +1431,19 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Collect AI product feedback")
     parser.add_argument("--limit", type=int, default=100, help="Max items per source")
     parser.add_argument("--output", type=str, help="Output JSONL file path")
+    parser.add_argument(
+        "--sources", nargs="+", choices=sorted(SOURCES), help="Sources to scrape (default: all)"
+    )
+    parser.add_argument("--cache-dir", type=str, help="Directory for the HTTP response cache")
+    parser.add_argument(
+        "--state-dir", type=str, help="Directory remembering where the last run stopped in each source"
+    )
     args = parser.parse_args()
 
     output = Path(args.output) if args.output else None
-    collect_feedback(limit=args.limit, output_path=output)
+    http_cache = HttpCache(Path(args.cache_dir)) if args.cache_dir else None
+    options = source_state_options(Path(args.state_dir)) if args.state_dir else None
+    for _ in stream_feedback(
+        limit=args.limit, output_path=output, sources=args.sources, cache=http_cache, source_options=options
+    ):
+        pass
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Full-text search over collected feedback.
+
+A SQLite FTS5 index of every item's title and text sits next to the
+cumulative JSONL file, with the fields used for filtering (source,
+timestamp and product/category bitmasks from `compact`) in an indexed
+side table. Like the ID index in `store`, it remembers how many bytes of
+the JSONL file it covers and only indexes lines appended since, so
+`collect.main` keeps it current in a few milliseconds per run; a file
+rewritten in place is re-indexed from scratch.
+
+Usage:
+    python search.py query "error message" --product claude --since 2025-11-01
+    python search.py rebuild
+"""
+
+import json
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from compact import CATEGORY_BITS, PRODUCT_BITS, encode_labels
+from store import is_rewritten, set_indexed_size
+
+SEARCH_INDEX_FILE = "search_index.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    products INTEGER NOT NULL,
+    categories INTEGER NOT NULL,
+    source_url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_timestamp ON docs (timestamp);
+-- Covers `page`: filtered listings scan it without touching the table.
+CREATE INDEX IF NOT EXISTS docs_listing ON docs (timestamp, id, source, products, categories);
+CREATE VIRTUAL TABLE IF NOT EXISTS fts USING fts5(title, text, tokenize = 'porter unicode61');
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@dataclass
+class SearchResult:
+    """One matching item."""
+    id: str
+    source: str
+    timestamp: datetime
+    title: str
+    snippet: str
+    source_url: str
+
+
+def _epoch(value: str | datetime) -> int:
+    parsed = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching items containing every word.
+
+    Text without any words gives an empty string, which is not a valid
+    FTS5 query; `SearchIndex.search` then applies only the filters.
+    """
+    return " ".join(f'"{token}"' for token in _TOKEN_RE.findall(text))
+
+
+class SearchIndex:
+    """FTS5 search index over a cumulative feedback JSONL file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the index database."""
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    @property
+    def indexed_size(self) -> int:
+        """Number of bytes of the JSONL file covered by the index."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'indexed_size'").fetchone()
+        return int(row[0]) if row else 0
+
+    def add(self, items: Iterable[dict]) -> int:
+        """Index items whose IDs are not indexed yet; return how many were added."""
+        added = 0
+        for item in items:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO docs (id, source, timestamp, products, categories, source_url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    item["id"],
+                    item["source"],
+                    _epoch(item["timestamp"]),
+                    encode_labels(item["products"], PRODUCT_BITS),
+                    encode_labels(item["categories"], CATEGORY_BITS),
+                    item["source_url"],
+                ),
+            )
+            if cursor.rowcount:
+                self.conn.execute(
+                    "INSERT INTO fts (rowid, title, text) VALUES (?, ?, ?)",
+                    (cursor.lastrowid, item.get("title") or "", item.get("text") or ""),
+                )
+                added += 1
+        return added
+
+    def sync(self, jsonl_path: Path) -> int:
+        """Index lines appended to the JSONL file since the last sync.
+
+        If the file was rewritten, the index is rebuilt from scratch.
+        Returns the number of newly indexed items.
+        """
+        if not jsonl_path.exists():
+            return 0
+
+        start = self.indexed_size
+        if is_rewritten(self.conn, jsonl_path, start):
+            self.conn.execute("DELETE FROM docs")
+            self.conn.execute("DELETE FROM fts")
+            start = 0
+
+        items = []
+        with jsonl_path.open("rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                # Leave a partially written last line for the next sync.
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    try:
+                        items.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        pass
+                offset += len(line)
+
+        added = self.add(items)
+        set_indexed_size(self.conn, jsonl_path, offset)
+        self.conn.commit()
+        return added
+
+    def search(
+        self,
+        query: str | None = None,
+        products: list[str] | None = None,
+        categories: list[str] | None = None,
+        sources: list[str] | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        limit: int = 20,
+        raw: bool = False,
+        order: str = "relevance",
+    ) -> list[SearchResult]:
+        """Find items matching a text query and filters.
+
+        `query` is free text matched word by word (stemmed), or FTS5 query
+        syntax with `raw`. Items must mention any of `products`, have any of
+        `categories` and come from any of `sources`; `since`/`until` bound the
+        item timestamp (ISO dates or datetimes, `until` exclusive).
+
+        Text matches are ranked by relevance, or with `order="recent"` most
+        recently collected first, which stays fast even for words found in
+        most items since ranking stops after `limit` matches. Without a
+        query, or with one that has no words in it (just punctuation),
+        items are listed newest first.
+        """
+        if order not in ("relevance", "recent"):
+            raise ValueError(f"Unknown order {order!r}")
+        conditions, params = self._filters(products, categories, sources, since, until)
+        match = (query.strip() if raw else fts_query(query)) if query else ""
+        if match:
+            conditions.insert(0, "fts MATCH ?")
+            params.insert(0, match)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        if match:
+            # Driving the join from the FTS table lets SQLite stop after
+            # `limit` rows when ordering by collection order.
+            tables = "fts CROSS JOIN docs ON docs.rowid = fts.rowid"
+            order_by = "fts.rank" if order == "relevance" else "fts.rowid DESC"
+            snippet = "snippet(fts, -1, '[', ']', '…', 12)"
+        else:
+            tables = "docs CROSS JOIN fts ON fts.rowid = docs.rowid"
+            order_by = "docs.timestamp DESC"
+            snippet = "substr(fts.text, 1, 80)"
+        rows = self.conn.execute(
+            f"SELECT docs.id, docs.source, docs.timestamp, fts.title, {snippet}, docs.source_url "
+            f"FROM {tables} {where} ORDER BY {order_by} LIMIT ?",
+            (*params, limit),
+        )
+        return [
+            SearchResult(
+                id=item_id,
+                source=source,
+                timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc),
+                title=title,
+                snippet=text,
+                source_url=source_url,
+            )
+            for item_id, source, timestamp, title, text, source_url in rows
+        ]
+
+    def page(
+        self,
+        products: list[str] | None = None,
+        categories: list[str] | None = None,
+        sources: list[str] | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        after: tuple[int, str] | None = None,
+        limit: int = 50,
+    ) -> list[tuple[int, str]]:
+        """Keys (epoch timestamp, ID) of matching items, newest first.
+
+        Filters work as in `search`. With `after`, the listing starts
+        after that key, the last of the previous page, so every page is
+        one range scan of the `docs_listing` index however deep it is.
+        """
+        conditions, params = self._filters(products, categories, sources, since, until)
+        if after is not None:
+            conditions.append("(docs.timestamp, docs.id) < (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.conn.execute(
+            f"SELECT docs.timestamp, docs.id FROM docs {where} ORDER BY docs.timestamp DESC, docs.id DESC LIMIT ?",
+            (*params, limit),
+        )
+        return rows.fetchall()
+
+    @staticmethod
+    def _filters(
+        products: list[str] | None,
+        categories: list[str] | None,
+        sources: list[str] | None,
+        since: str | datetime | None,
+        until: str | datetime | None,
+    ) -> tuple[list[str], list]:
+        conditions = []
+        params: list = []
+        if products:
+            conditions.append("docs.products & ? != 0")
+            params.append(encode_labels(products, PRODUCT_BITS))
+        if categories:
+            conditions.append("docs.categories & ? != 0")
+            params.append(encode_labels(categories, CATEGORY_BITS))
+        if sources:
+            conditions.append(f"docs.source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if since:
+            conditions.append("docs.timestamp >= ?")
+            params.append(_epoch(since))
+        if until:
+            conditions.append("docs.timestamp < ?")
+            params.append(_epoch(until))
+        return conditions, params
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from store import CUMULATIVE_FILE
+
+    parser = argparse.ArgumentParser(description="Search collected feedback")
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Data directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query_parser = subparsers.add_parser("query", help="Search the index")
+    query_parser.add_argument("query", nargs="?", help="Words to search for")
+    query_parser.add_argument("--product", action="append", choices=sorted(PRODUCT_BITS), help="Filter by product")
+    query_parser.add_argument("--category", action="append", choices=sorted(CATEGORY_BITS), help="Filter by category")
+    query_parser.add_argument("--source", action="append", help="Filter by source")
+    query_parser.add_argument("--since", type=str, help="Only items on or after this date")
+    query_parser.add_argument("--until", type=str, help="Only items before this date")
+    query_parser.add_argument("--limit", type=int, default=20, help="Max results")
+    query_parser.add_argument("--raw", action="store_true", help="Treat the query as FTS5 syntax")
+    query_parser.add_argument("--recent", action="store_true", help="Most recently collected first instead of by relevance")
+
+    subparsers.add_parser("rebuild", help="Re-index the cumulative file from scratch")
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.dir)
+    if args.command == "rebuild":
+        (data_dir / SEARCH_INDEX_FILE).unlink(missing_ok=True)
+
+    with SearchIndex(data_dir / SEARCH_INDEX_FILE) as index:
+        added = index.sync(data_dir / CUMULATIVE_FILE)
+        if args.command == "rebuild":
+            print(f"🔁 Indexed {added} items from {CUMULATIVE_FILE}")
+        else:
+            start = time.perf_counter()
+            results = index.search(
+                args.query,
+                products=args.product,
+                categories=args.category,
+                sources=args.source,
+                since=args.since,
+                until=args.until,
+                limit=args.limit,
+                raw=args.raw,
+                order="recent" if args.recent else "relevance",
+            )
+            elapsed = time.perf_counter() - start
+            for result in results:
+                print(f"{result.timestamp:%Y-%m-%d} {result.source:<10} {result.title[:70]}")
+                print(f"    {result.snippet}")
+                print(f"    {result.source_url}")
+            print(f"\n{len(results)} results in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Offline lexicon-based sentiment scoring for feedback text.
+
+Each word in `LEXICON` carries a weight (positive or negative). A word
+within `NEGATION_WINDOW` words after a negator ("not", "never", "doesn't")
+counts `NEGATION_FACTOR` times its weight, and one right after an
+intensifier ("very", "really") `INTENSIFIER_BOOST` times; punctuation ends
+the reach of both. An item's score is the sum over its words; `label`
+turns it into "positive", "negative" or "neutral".
+
+Texts are scored in batches: a batch is joined into one lowercased byte
+string and tokenized with a single regex pass, so the per-item cost is
+one dictionary lookup per word.
+
+`scraper.stream_feedback` scores items in micro-batches as they are
+collected; `reclassify.py` fills in historical files.
+
+Usage:
+    python sentiment.py "The new onboarding is really not confusing"
+"""
+
+import re
+from collections.abc import Sequence
+
+POSITIVE = "positive"
+NEGATIVE = "negative"
+NEUTRAL = "neutral"
+# Scores at least this far from zero get a positive or negative label.
+LABEL_THRESHOLD = 0.5
+
+NEGATION_WINDOW = 3
+NEGATION_FACTOR = -0.5
+INTENSIFIER_BOOST = 1.5
+
+NEGATORS = [
+    "not", "no", "never", "without", "hardly", "barely", "nothing", "nobody", "neither", "nor",
+    "don't", "doesn't", "didn't", "isn't", "aren't", "wasn't", "weren't", "won't", "wouldn't",
+    "can't", "cannot", "couldn't", "shouldn't", "hasn't", "haven't", "dont", "doesnt", "didnt",
+    "isnt", "cant", "wont",
+]
+INTENSIFIERS = [
+    "very", "really", "so", "super", "extremely", "incredibly", "absolutely", "totally",
+    "completely", "way", "too", "most", "highly", "insanely",
+]
+
+_STRONG_POSITIVE = [
+    "love", "loved", "loving", "amazing", "awesome", "excellent", "fantastic", "brilliant",
+    "incredible", "perfect", "outstanding", "superb", "wonderful", "delightful", "best",
+]
+_POSITIVE = [
+    "good", "great", "nice", "like", "liked", "likes", "helpful", "useful", "clear", "clearer",
+    "intuitive", "easy", "easier", "simple", "smooth", "fast", "faster", "quick", "accurate",
+    "reliable", "consistent", "polished", "clean", "elegant", "friendly", "impressive",
+    "impressed", "improved", "improvement", "better", "works", "worked", "fixed", "solid",
+    "thanks", "thank", "glad", "happy", "enjoy", "enjoyed", "recommend", "powerful", "concise",
+    "thoughtful", "responsive", "seamless", "handy", "fun", "favorite", "favourite", "pleasant",
+    "appreciate", "appreciated", "readable", "understandable", "straightforward", "wow",
+]
+_NEGATIVE = [
+    "bad", "worse", "poor", "confusing", "confused", "unclear", "vague", "misleading",
+    "frustrating", "frustrated", "annoying", "annoyed", "slow", "slower", "broken", "buggy",
+    "bug", "bugs", "fails", "failed", "failing", "failure", "wrong", "incorrect", "inaccurate",
+    "unreliable", "inconsistent", "clunky", "cluttered", "messy", "hard", "harder", "difficult",
+    "verbose", "robotic", "preachy", "condescending", "patronizing", "lazy", "hallucinates",
+    "hallucinated", "hallucination", "hallucinations", "refuses", "refused", "refusal",
+    "crash", "crashes", "crashed", "stuck", "lost", "missing", "hidden", "cryptic", "ugly",
+    "disappointed", "disappointing", "problem", "problems", "issue", "issues", "complain",
+    "complaint", "struggle", "struggling", "waste", "wasted", "pointless", "unusable",
+    "degraded", "nerfed", "sucks", "meh", "overwhelming", "tedious", "painful", "laggy",
+]
+_STRONG_NEGATIVE = [
+    "terrible", "horrible", "awful", "hate", "hated", "useless", "garbage", "worst",
+    "infuriating", "unacceptable", "atrocious", "trash", "disaster", "nightmare", "ridiculous",
+]
+
+LEXICON: dict[str, float] = {
+    **{word: 2.0 for word in _STRONG_POSITIVE},
+    **{word: 1.0 for word in _POSITIVE},
+    **{word: -1.0 for word in _NEGATIVE},
+    **{word: -2.0 for word in _STRONG_NEGATIVE},
+}
+
+# Items are joined with this byte, which never occurs in a word.
+_SEPARATOR = b"\x01"
+_TOKEN_RE = re.compile(rb"[a-z']+|[\x01.,;:!?]")
+_CLAUSE_BREAKS = b"\x01.,;:!?"
+# HTML-escaped and typographic apostrophes, so "doesn&#x27;t" reads as "doesn't".
+_APOSTROPHES = [b"&#x27;", b"&#39;", "\u2019".encode()]
+
+_LEXICON_BYTES = {word.encode(): weight for word, weight in LEXICON.items()}
+_NEGATOR_SET = frozenset(word.encode() for word in NEGATORS)
+_INTENSIFIER_SET = frozenset(word.encode() for word in INTENSIFIERS)
+
+
+def _batch_bytes(texts: Sequence[str]) -> bytes:
+    """All texts as one lowercased byte string, separated by `_SEPARATOR`."""
+    data = _SEPARATOR.join(text.encode() for text in texts)
+    if data.count(_SEPARATOR) != len(texts) - 1:
+        data = _SEPARATOR.join(text.encode().replace(_SEPARATOR, b" ") for text in texts)
+    data = data.lower()
+    for apostrophe in _APOSTROPHES:
+        data = data.replace(apostrophe, b"'")
+    return data
+
+
+def _scores(data: bytes, count: int) -> list[float]:
+    scores = [0.0] * count
+    item = 0
+    position = 0
+    last_negator = -NEGATION_WINDOW - 1
+    boost = False
+    for token in _TOKEN_RE.findall(data):
+        if len(token) == 1 and token in _CLAUSE_BREAKS:
+            item += token == _SEPARATOR
+            last_negator = -NEGATION_WINDOW - 1
+            boost = False
+            continue
+        position += 1
+        weight = _LEXICON_BYTES.get(token)
+        if weight is not None:
+            if position - last_negator <= NEGATION_WINDOW:
+                weight *= NEGATION_FACTOR
+            if boost:
+                weight *= INTENSIFIER_BOOST
+            scores[item] += weight
+        if token in _NEGATOR_SET:
+            last_negator = position
+        boost = token in _INTENSIFIER_SET
+    return scores
+
+
+def score_texts(texts: Sequence[str]) -> list[float]:
+    """Sentiment score of each text, scored as one batch."""
+    if not texts:
+        return []
+    return _scores(_batch_bytes(texts), len(texts))
+
+
+def label(score: float) -> str:
+    """Label for a score: `POSITIVE`, `NEGATIVE` or `NEUTRAL`."""
+    if score >= LABEL_THRESHOLD:
+        return POSITIVE
+    if score <= -LABEL_THRESHOLD:
+        return NEGATIVE
+    return NEUTRAL
+
+
+def label_texts(texts: Sequence[str]) -> list[str]:
+    """Sentiment label of each text, scored as one batch."""
+    return [label(score) for score in score_texts(texts)]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Score the sentiment of texts")
+    parser.add_argument("texts", nargs="+", help="Texts to score")
+    args = parser.parse_args()
+
+    for text, score in zip(args.texts, score_texts(args.texts)):
+        print(f"{score:+6.2f}  {label(score):<8}  {text}")
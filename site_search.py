@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Client-side search assets for the generated site.
+
+Items are numbered chronologically like archive pages (1 = oldest) and
+split into segments of `SEGMENT_SIZE`. Each segment gets two JSON files in
+`search/`:
+
+- `index-N.json`: a bitset of the segment's items for every product,
+  category and source, plus a token -> items map over each item's title
+  and preview text. A posting list is stored as offset deltas or, when
+  that would be longer, as a bitset, so no token costs more than a bitset.
+- `items-N.json`: what a search result shows for each item.
+
+Numbering from the oldest item means a full segment never changes again:
+a run only rewrites the newest segment, and browsers keep the others
+cached. A word directory over the full segments, split by the first
+character of each word into `words-*.json` files, maps words to the
+segments containing them; it is rebuilt only when a segment fills up.
+
+`search.js` looks up the query's words in the directory, then fetches
+just the segments that can match, newest first, stopping once it has a
+page of results. `manifest.json` lists the segments with a version for
+cache busting and is the only file refetched on every visit.
+"""
+
+import base64
+import hashlib
+import html
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+SEARCH_DIR = "search"
+SEGMENT_SIZE = 1000
+# Index what the item preview shows, not the whole post.
+INDEXED_TEXT_CHARS = 400
+MIN_TOKEN_LENGTH = 2
+
+# Bump when the segment format changes so every segment is rewritten.
+FORMAT_VERSION = 1
+
+_TOKEN_RE = re.compile(r"\w+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def tokens(item: dict) -> set[str]:
+    """Searchable words of an item: its title and the start of its text.
+
+    `search.js` splits queries the same way, so the two must stay in sync.
+    """
+    text = _TAG_RE.sub(" ", html.unescape(item["text"] or ""))[:INDEXED_TEXT_CHARS]
+    words = _TOKEN_RE.findall(f"{item['title'] or ''}\n{text}".lower())
+    return {word for word in words if len(word) >= MIN_TOKEN_LENGTH and not word.isdigit()}
+
+
+def bitset(offsets: list[int], count: int) -> str:
+    """Base64 bitset of `count` bits with `offsets` set (bit i of byte i // 8)."""
+    bits = bytearray((count + 7) // 8)
+    for offset in offsets:
+        bits[offset >> 3] |= 1 << (offset & 7)
+    return base64.b64encode(bits).decode()
+
+
+def encode_postings(offsets: list[int], count: int) -> list[int] | str:
+    """Ascending offsets as deltas, or as a bitset when that is shorter."""
+    deltas = [offsets[0], *(b - a for a, b in zip(offsets, offsets[1:]))]
+    # Each delta costs its digits plus a comma.
+    delta_size = sum(len(str(delta)) + 1 for delta in deltas)
+    if delta_size > (count + 7) // 8 * 4 // 3 + 2:
+        return bitset(offsets, count)
+    return deltas
+
+
+def segment_key(items: list[dict], hashes: dict[str, str]) -> str:
+    """Hash of everything a segment's files are built from."""
+    key_source = "\0".join([str(FORMAT_VERSION)] + [f"{item['id']}:{hashes[item['id']]}" for item in items])
+    return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+
+
+def word_bucket(word: str) -> str:
+    """Name of the directory file holding a word: its first character in hex."""
+    return f"{ord(word[0]):x}"
+
+
+def build_word_directory(index_files: list[Path]) -> dict[str, dict]:
+    """Map each word of the given segment indexes to the segments containing it.
+
+    Returns the directory split into buckets by `word_bucket`, with segment
+    lists encoded like posting lists (segment 1 is offset 0).
+    """
+    segments_by_word: dict[str, list[int]] = {}
+    for offset, index_file in enumerate(index_files):
+        for word in json.loads(index_file.read_text())["tokens"]:
+            segments_by_word.setdefault(word, []).append(offset)
+
+    buckets: dict[str, dict] = {}
+    for word in sorted(segments_by_word):
+        buckets.setdefault(word_bucket(word), {})[word] = encode_postings(segments_by_word[word], len(index_files))
+    return buckets
+
+
+def build_segment(items: list[dict]) -> tuple[dict, list[list]]:
+    """Build the index and result data for one segment of items, oldest first."""
+    labels: dict[str, dict[str, list[int]]] = {"products": {}, "categories": {}, "sources": {}}
+    postings: dict[str, list[int]] = {}
+    results = []
+
+    for offset, item in enumerate(items):
+        for product in item["products"]:
+            labels["products"].setdefault(product, []).append(offset)
+        for category in item["categories"]:
+            labels["categories"].setdefault(category, []).append(offset)
+        labels["sources"].setdefault(item["source"], []).append(offset)
+        for token in tokens(item):
+            postings.setdefault(token, []).append(offset)
+
+        results.append([
+            item["title"] or "(no title)",
+            item["source_url"],
+            item["source"],
+            datetime.fromisoformat(item["timestamp"]).strftime("%Y-%m-%d %H:%M"),
+            item["products"],
+            item["categories"],
+            item["score"] or 0,
+            item["num_comments"] or 0,
+        ])
+
+    count = len(items)
+    index = {
+        "count": count,
+        "labels": {
+            kind: {value: bitset(offsets, count) for value, offsets in sorted(values.items())}
+            for kind, values in labels.items()
+        },
+        "tokens": {token: encode_postings(postings[token], count) for token in sorted(postings)},
+    }
+    return index, results
+
+
+SEARCH_JS = r"""// Client-side search over the JSON segments written by site_search.py.
+(() => {
+    const box = document.getElementById("search");
+    if (!box || !window.fetch) return;
+    const root = box.dataset.root;
+    const query = document.getElementById("search-query");
+    const filters = {
+        products: document.getElementById("search-product"),
+        categories: document.getElementById("search-category"),
+        sources: document.getElementById("search-source"),
+    };
+    const status = document.getElementById("search-status");
+    const results = document.getElementById("search-results");
+    const feed = document.getElementById("feed");
+    const PAGE = 50;
+    const files = new Map();
+    let manifest = null;
+    let limit = PAGE;
+    let run = 0;
+    let timer = null;
+
+    const load = (file, version) => {
+        if (!files.has(file)) {
+            const url = `${root}search/${file}` + (version ? `?v=${version}` : "");
+            const options = version ? {} : { cache: "no-cache" };
+            files.set(file, fetch(url, options).then((response) => {
+                // Directory buckets without any words are never written.
+                if (response.status === 404 && file.startsWith("words-")) return { tokens: {} };
+                if (!response.ok) throw new Error(`${response.status} fetching ${file}`);
+                return response.json();
+            }).catch((error) => {
+                files.delete(file);
+                throw error;
+            }));
+        }
+        return files.get(file);
+    };
+
+    // Must split text the same way as site_search.tokens.
+    const words = (text) => (text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [])
+        .filter((word) => [...word].length >= 2 && !/^\d+$/.test(word));
+
+    // Must match site_search.word_bucket.
+    const bucket = (word) => word.codePointAt(0).toString(16);
+
+    const decode = (postings, count) => {
+        const bits = new Uint8Array((count + 7) >> 3);
+        if (typeof postings === "string") {
+            const raw = atob(postings);
+            for (let i = 0; i < raw.length; i++) bits[i] = raw.charCodeAt(i);
+        } else if (postings) {
+            let offset = 0;
+            for (const delta of postings) {
+                offset += delta;
+                bits[offset >> 3] |= 1 << (offset & 7);
+            }
+        }
+        return bits;
+    };
+
+    const and = (a, b) => {
+        if (!a) return b;
+        for (let i = 0; i < a.length; i++) a[i] &= b[i];
+        return a;
+    };
+
+    const has = (bits, i) => bits[i >> 3] >> (i & 7) & 1;
+
+    // Posting bits of a word. The last word may still be being typed, so
+    // it also matches longer words.
+    const match = (tokens, count, word, prefix) => {
+        const bits = decode(tokens[word], count);
+        if (!prefix) return bits;
+        for (const token in tokens) {
+            if (token.length > word.length && token.startsWith(word)) {
+                const more = decode(tokens[token], count);
+                for (let i = 0; i < bits.length; i++) bits[i] |= more[i];
+            }
+        }
+        return bits;
+    };
+
+    const element = (tag, className, text) => {
+        const node = document.createElement(tag);
+        if (className) node.className = className;
+        if (text !== undefined) node.textContent = text;
+        return node;
+    };
+
+    const badge = (name) => element("span", `badge badge-${name}`, name);
+
+    const renderItem = (number, item) => {
+        const [title, url, source, time, products, categories, score, comments] = item;
+        const div = element("div", "item");
+        const titleDiv = element("div", "title", `${number}. `);
+        const link = element("a", "", title);
+        link.href = url;
+        link.target = "_blank";
+        titleDiv.append(link);
+
+        const meta = element("div", "meta");
+        for (const product of products) meta.append(badge(product), " ");
+        meta.append(badge(source), ` | ${score} points | ${comments} comments | ${time} | `);
+        meta.append(element("span", "category", categories.join(", ")), " | ");
+        const page = element("a", "", "archive");
+        page.href = `${root}pages/all-${Math.ceil(number / manifest.page_size)}.html`;
+        meta.append(page);
+
+        div.append(titleDiv, meta);
+        return div;
+    };
+
+    const search = async () => {
+        const id = ++run;
+        const terms = words(query.value);
+        const active = Object.entries(filters).filter(([, select]) => select.value);
+        if (!terms.length && !active.length) {
+            results.hidden = true;
+            feed.hidden = false;
+            status.textContent = "";
+            return;
+        }
+
+        const start = performance.now();
+        status.textContent = "Searching…";
+        manifest = manifest || await load("manifest.json");
+        const { directory } = manifest;
+        const last = terms.length - 1;
+
+        // Full segments not containing every word need not be fetched.
+        let candidates = null;
+        if (terms.length && directory.segments) {
+            const buckets = await Promise.all(terms.map((term) => load(`words-${bucket(term)}.json`, directory.version)));
+            if (id !== run) return;
+            terms.forEach((term, i) => {
+                candidates = and(candidates, match(buckets[i].tokens, directory.segments, term, i === last));
+            });
+        }
+        const order = [];
+        for (let segment = manifest.segments.length - 1; segment >= 0; segment--) {
+            if (!candidates || segment >= directory.segments || has(candidates, segment)) order.push(segment);
+        }
+
+        // Newest segments first, stopping once there is a page of results.
+        const matches = [];
+        let visited = 0;
+        for (; visited < order.length && matches.length < limit; visited++) {
+            const segment = order[visited];
+            const { count, version } = manifest.segments[segment];
+            const index = await load(`index-${segment + 1}.json`, version);
+            if (id !== run) return;
+            let bits = null;
+            for (const [kind, select] of active) bits = and(bits, decode(index.labels[kind][select.value], count));
+            terms.forEach((term, i) => {
+                bits = and(bits, match(index.tokens, count, term, i === last));
+            });
+            for (let offset = count - 1; offset >= 0; offset--) {
+                if (has(bits, offset)) matches.push([segment, offset]);
+            }
+        }
+
+        const shown = matches.slice(0, limit);
+        const segments = [...new Set(shown.map(([s]) => s))];
+        const items = await Promise.all(segments.map((s) => load(`items-${s + 1}.json`, manifest.segments[s].version)));
+        if (id !== run) return;
+        const bySegment = new Map(segments.map((s, i) => [s, items[i]]));
+
+        results.replaceChildren(...shown.map(([s, offset]) =>
+            renderItem(s * manifest.segment_size + offset + 1, bySegment.get(s)[offset])));
+        const more = visited < order.length || matches.length > limit;
+        if (more) {
+            const button = element("button", "", "More results");
+            button.addEventListener("click", () => {
+                limit += PAGE;
+                search().catch(fail);
+            });
+            results.append(button);
+        }
+        const elapsed = Math.round(performance.now() - start);
+        status.textContent = `${shown.length}${more ? "+" : ""} matches (${elapsed} ms)`;
+        results.hidden = false;
+        feed.hidden = true;
+    };
+
+    const fail = (error) => {
+        status.textContent = `Search unavailable: ${error.message}`;
+    };
+
+    const schedule = () => {
+        limit = PAGE;
+        clearTimeout(timer);
+        timer = setTimeout(() => search().catch(fail), 150);
+    };
+
+    query.addEventListener("input", schedule);
+    for (const select of Object.values(filters)) select.addEventListener("change", schedule);
+    box.hidden = false;
+})();
+"""
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Cumulative feedback store with a persistent ID index.
+
+`feedback_all.jsonl` stays the source of truth. Alongside it a SQLite
+index records every stored ID with the byte offset of its line, so
+checking whether an item was already collected is a single indexed
+lookup and appending never has to re-read old data.
+
+The index remembers how many bytes of the JSONL file it has covered and
+indexes any extra lines on open, so it stays correct if the file is
+appended to by something else. It also keeps a fingerprint of those
+bytes, so a file rewritten in place (e.g. by `reclassify.py`) is
+re-indexed from scratch even if it did not shrink; other indexes of the
+file do the same with `is_rewritten` and `set_indexed_size`. Run
+`python store.py rebuild` once to (re)create the index and fold every
+`feedback_*.jsonl` snapshot and every run in the partitioned store
+(`data/`) into the cumulative file.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from instrument import record
+
+CUMULATIVE_FILE = "feedback_all.jsonl"
+INDEX_FILE = "feedback_index.sqlite"
+# Bytes hashed at each end of the indexed part of a JSONL file.
+FINGERPRINT_BYTES = 4096
+# IDs bound per lookup query; well under SQLite's host-parameter limit
+# (999 before 3.32).
+LOOKUP_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def fingerprint(jsonl_path: Path, size: int) -> str:
+    """Fingerprint of the first `size` bytes of a file, from its first and last few KB."""
+    with jsonl_path.open("rb") as f:
+        head = f.read(min(size, FINGERPRINT_BYTES))
+        f.seek(max(0, size - FINGERPRINT_BYTES))
+        tail = f.read(size - f.tell())
+    return hashlib.blake2b(b"%d\n%b\n%b" % (size, head, tail), digest_size=16).hexdigest()
+
+
+def is_rewritten(conn: sqlite3.Connection, jsonl_path: Path, indexed_size: int) -> bool:
+    """Whether the bytes an index covers changed since it recorded them.
+
+    `conn` is the index database, with the `meta` table `set_indexed_size`
+    writes to. A file that shrank or whose fingerprint no longer matches
+    was rewritten, so the offsets the index holds mean nothing any more.
+    """
+    if not indexed_size:
+        return False
+    if jsonl_path.stat().st_size < indexed_size:
+        return True
+    row = conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+    return row is None or row[0] != fingerprint(jsonl_path, indexed_size)
+
+
+def set_indexed_size(conn: sqlite3.Connection, jsonl_path: Path, size: int) -> None:
+    """Record that an index covers the first `size` bytes of a JSONL file."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+        [("indexed_size", str(size)), ("fingerprint", fingerprint(jsonl_path, size) if size else "")],
+    )
+
+
+class FeedbackStore:
+    """Append-only JSONL feedback file with an ID index."""
+
+    def __init__(self, jsonl_path: Path, index_path: Path | None = None):
+        self.jsonl_path = jsonl_path
+        self.index_path = index_path or jsonl_path.with_name(INDEX_FILE)
+        self.conn = sqlite3.connect(self.index_path)
+        self.conn.executescript(SCHEMA)
+        self.sync()
+
+    def __enter__(self) -> "FeedbackStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the index database."""
+        self.conn.close()
+
+    def __contains__(self, item_id: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM items WHERE id = ?", (item_id,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def lines(self, item_ids: list[str]) -> list[bytes]:
+        """The stored JSON lines of items, in the order given, without newlines.
+
+        Each line is read at its indexed offset, so only the requested
+        items are touched. IDs that aren't stored are skipped.
+        """
+        offsets = {}
+        for i in range(0, len(item_ids), LOOKUP_CHUNK):
+            chunk = item_ids[i:i + LOOKUP_CHUNK]
+            offsets.update(self.conn.execute(
+                f"SELECT id, offset FROM items WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            ))
+        lines = []
+        with self.jsonl_path.open("rb") as f:
+            for item_id in item_ids:
+                if item_id in offsets:
+                    f.seek(offsets[item_id])
+                    lines.append(f.readline().rstrip(b"\n"))
+        return lines
+
+    @property
+    def indexed_size(self) -> int:
+        """Number of bytes of the JSONL file covered by the index."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'indexed_size'").fetchone()
+        return int(row[0]) if row else 0
+
+    def sync(self) -> int:
+        """Index lines appended to the JSONL file since the last sync.
+
+        If the file was rewritten, the index is rebuilt from scratch.
+        Returns the number of newly indexed items.
+        """
+        if not self.jsonl_path.exists():
+            return 0
+
+        size = self.jsonl_path.stat().st_size
+        start = self.indexed_size
+        if is_rewritten(self.conn, self.jsonl_path, start):
+            self.conn.execute("DELETE FROM items")
+            start = 0
+        if size == start:
+            return 0
+
+        added = 0
+        with self.jsonl_path.open("rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                # Leave a partially written last line for the next sync.
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        item = None
+                    if item is not None:
+                        cursor = self.conn.execute(
+                            "INSERT OR IGNORE INTO items (id, offset, timestamp) VALUES (?, ?, ?)",
+                            (item["id"], offset, item["timestamp"]),
+                        )
+                        added += cursor.rowcount
+                offset += len(line)
+
+        set_indexed_size(self.conn, self.jsonl_path, offset)
+        self.conn.commit()
+        return added
+
+    def _repair_last_line(self) -> None:
+        """End or drop a partially written last line left after the indexed bytes.
+
+        A fragment that is a whole record, missing only its newline, is
+        terminated and indexed; anything else is what remains of an
+        interrupted write and is truncated so no reader trips over it.
+        """
+        start = self.indexed_size
+        with self.jsonl_path.open("rb+") as f:
+            f.seek(start)
+            fragment = f.read()
+            if not fragment:
+                return
+            try:
+                json.loads(fragment)
+            except ValueError:
+                f.truncate(start)
+                return
+            f.write(b"\n")
+        self.sync()
+
+    def append(self, items: Iterable[dict]) -> int:
+        """Append items whose IDs are not stored yet; return how many were added.
+
+        A partial last line is repaired first, so new records start on a
+        line of their own at the offsets the index records for them.
+        """
+        self.sync()
+        if self.jsonl_path.exists():
+            self._repair_last_line()
+        offset = self.indexed_size
+        added = 0
+        seen = set()
+
+        with self.jsonl_path.open("ab") as f:
+            for item in items:
+                start = time.perf_counter()
+                if item["id"] in seen or item["id"] in self:
+                    record("store", time.perf_counter() - start, items=1)
+                    continue
+                seen.add(item["id"])
+                line = (json.dumps(item) + "\n").encode()
+                f.write(line)
+                self.conn.execute(
+                    "INSERT INTO items (id, offset, timestamp) VALUES (?, ?, ?)",
+                    (item["id"], offset, item["timestamp"]),
+                )
+                offset += len(line)
+                added += 1
+                record("store", time.perf_counter() - start, items=1, added=1, bytes=len(line))
+
+        set_indexed_size(self.conn, self.jsonl_path, offset)
+        self.conn.commit()
+        return added
+
+
+def rebuild(store: FeedbackStore, snapshots: Iterable[Path]) -> int:
+    """Re-index the cumulative file from scratch and ingest snapshot files.
+
+    Items from the snapshots that are missing from the cumulative file are
+    appended to it. Returns the number of items added.
+    """
+    store.conn.execute("DELETE FROM items")
+    set_indexed_size(store.conn, store.jsonl_path, 0)
+    store.conn.commit()
+    store.sync()
+
+    added = 0
+    for path in snapshots:
+        if path.resolve() == store.jsonl_path.resolve():
+            continue
+        with path.open() as f:
+            items = [json.loads(line) for line in f if line.strip()]
+        count = store.append(items)
+        added += count
+        if count:
+            print(f"  + {count:4d} items from {path.name}")
+    return added
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from partitions import DATA_DIR, PartitionedStore
+
+    parser = argparse.ArgumentParser(description="Manage the cumulative feedback store")
+    parser.add_argument("command", choices=["rebuild", "stats"], help="Action to run")
+    parser.add_argument("--dir", type=str, default=str(Path(__file__).parent), help="Data directory")
+    args = parser.parse_args()
+
+    data_dir = Path(args.dir)
+    with FeedbackStore(data_dir / CUMULATIVE_FILE) as feedback_store:
+        if args.command == "rebuild":
+            print(f"🔁 Rebuilding index {feedback_store.index_path.name}...")
+            snapshot_files = sorted(data_dir.glob("feedback_*.jsonl")) + PartitionedStore(data_dir / DATA_DIR).files()
+            new_items = rebuild(feedback_store, snapshot_files)
+            print(f"  ✓ Ingested {new_items} new items from {len(snapshot_files)} snapshot files")
+        print(f"📊 {len(feedback_store)} items indexed in {feedback_store.jsonl_path.name}")
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""HTTP helpers shared by the scrapers.
+
+Provides a per-host token-bucket rate limiter, a pooled `Transport` that
+retries transient failures with jittered exponential backoff (honouring
+`Retry-After`) and counts retries, throttling and connection reuse, a
+`MeteredTransport` view that reports one caller's requests to the
+recording run report, and a bounded-concurrency fetch helper that returns results in input order, so
+scrapers can issue many requests at once while still producing
+deterministic output.
+
+HTTP/2 is used when requested and the optional `h2` package is installed
+(`pip install httpx[http2]`); otherwise requests fall back to HTTP/1.1.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from instrument import record
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+# =============================================================================
+# Rate limiting
+# =============================================================================
+
+class HostRateLimiter:
+    """Token-bucket rate limiter keyed by request host.
+
+    `rate` is the sustained number of requests per second allowed per host and
+    `burst` the number of requests that may be issued back to back before
+    throttling kicks in. `host_rates` overrides the rate for specific hosts;
+    with `rate=None`, hosts not listed there are not limited. Safe to share
+    between threads.
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        burst: int | None = None,
+        host_rates: dict[str, float] | None = None,
+    ):
+        self.host_rates = dict(host_rates or {})
+        if any(r <= 0 for r in [rate or 1, *self.host_rates.values()]):
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str, stop: threading.Event | None = None) -> float:
+        """Block until a request to the URL's host is allowed, or `stop` is set.
+
+        Returns the number of seconds spent waiting.
+        """
+        host = urlsplit(url).netloc
+        rate = self.host_rates.get(host, self.rate)
+        if rate is None:
+            return 0.0
+        burst = float(self.burst if self.burst is not None else max(1, int(rate)))
+
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (burst, now))
+            tokens = min(burst, tokens + (now - last) * rate)
+            # Going negative reserves a future slot for this caller.
+            tokens -= 1.0
+            self._buckets[host] = (tokens, now)
+            wait = -tokens / rate if tokens < 0 else 0.0
+
+        if wait > 0:
+            if stop is not None:
+                stop.wait(wait)
+            else:
+                time.sleep(wait)
+        return wait
+
+
+# =============================================================================
+# Pooled transport with retries
+# =============================================================================
+
+DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+MAX_BACKOFF = 30.0
+# Longest `Retry-After` honoured; servers asking for more are given up on.
+MAX_RETRY_AFTER = 120.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class Stopped(Exception):
+    """Raised instead of sending a request once the caller was asked to stop."""
+
+
+@dataclass
+class TransportStats:
+    """Counters for one collection run."""
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    throttled: int = 0
+    throttle_wait: float = 0.0
+    rate_limit_wait: float = 0.0
+    connections: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of attempts sent over an already open connection."""
+        return 1 - self.connections / self.attempts if self.attempts else 0.0
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (
+            f"{self.requests} requests, {self.retries} retries, {self.failures} failed, "
+            f"{self.throttled} throttled ({self.throttle_wait:.1f}s backing off, "
+            f"{self.rate_limit_wait:.1f}s rate limited), {self.connections} connections "
+            f"({self.reuse_ratio:.0%} reuse)"
+        )
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Seconds to wait according to a `Retry-After` header, if present."""
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class Transport:
+    """Pooled HTTP client shared by the scrapers.
+
+    Requests go through an optional `HostRateLimiter` and are retried up to
+    `retries` times on connection errors, timeouts and 429/5xx replies,
+    sleeping a jittered exponential backoff (`backoff * 2**attempt`, capped
+    at `max_backoff`) or the server's `Retry-After` when given. The last
+    reply (or error) is returned to the caller as is. A request given a
+    `stop` event raises `Stopped` instead of sending another attempt once it
+    is set, and wakes from backoff and rate-limit waits when it is. Safe to
+    share between threads; `stats` accumulates over the transport's lifetime.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 16,
+        http2: bool = False,
+        rate_limiter: HostRateLimiter | None = None,
+        retries: int = MAX_RETRIES,
+        backoff: float = BACKOFF_BASE,
+        max_backoff: float = MAX_BACKOFF,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        headers: dict | None = None,
+    ):
+        self.client = httpx.Client(
+            http2=http2 and HTTP2_AVAILABLE,
+            timeout=timeout,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=30.0,
+            ),
+        )
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats = TransportStats()
+        self._lock = threading.Lock()
+
+    def _trace(self, event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.complete":
+            with self._lock:
+                self.stats.connections += 1
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0.5, 1.0) * min(self.max_backoff, self.backoff * 2 ** attempt)
+
+    def get(self, url: str, headers: dict | None = None, stop: threading.Event | None = None) -> httpx.Response:
+        """GET a URL, retrying transient failures until `stop` is set."""
+        with self._lock:
+            self.stats.requests += 1
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                waited = self.rate_limiter.acquire(url, stop)
+                with self._lock:
+                    self.stats.rate_limit_wait += waited
+            if stop is not None and stop.is_set():
+                raise Stopped(f"Stopped before requesting {url}")
+
+            with self._lock:
+                self.stats.attempts += 1
+            try:
+                response = self.client.get(url, headers=headers, extensions={"trace": self._trace})
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    with self._lock:
+                        self.stats.failures += 1
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                with self._lock:
+                    self.stats.statuses[response.status_code] = self.stats.statuses.get(response.status_code, 0) + 1
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+
+                wait = retry_after(response)
+                if attempt >= self.retries or (wait is not None and wait > MAX_RETRY_AFTER):
+                    with self._lock:
+                        self.stats.failures += 1
+                    return response
+                delay = wait if wait is not None else self._backoff(attempt)
+                if response.status_code in (429, 503):
+                    with self._lock:
+                        self.stats.throttled += 1
+                        self.stats.throttle_wait += delay
+
+            with self._lock:
+                self.stats.retries += 1
+            if stop is not None:
+                stop.wait(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.client.close()
+
+
+class MeteredTransport:
+    """A shared `Transport` as seen by one caller, reported as its own stage.
+
+    The time, bytes received and failed replies of every request made
+    through it are added to `stage` of the recording `instrument` report,
+    so sources sharing one transport are measured separately. Its requests
+    stop with `Stopped` once `stop` is set. Closing it leaves the shared
+    transport open.
+    """
+
+    def __init__(self, transport: Transport, stage: str, stop: threading.Event | None = None):
+        self.transport = transport
+        self.stage = stage
+        self.stop = stop
+
+    @property
+    def stats(self) -> TransportStats:
+        return self.transport.stats
+
+    def get(self, url: str, headers: dict | None = None) -> httpx.Response:
+        """GET a URL through the shared transport."""
+        start = time.perf_counter()
+        try:
+            response = self.transport.get(url, headers=headers, stop=self.stop)
+        except Stopped:
+            raise
+        except Exception:
+            record(self.stage, time.perf_counter() - start, requests=1, failed=1)
+            raise
+        record(
+            self.stage,
+            time.perf_counter() - start,
+            requests=1,
+            bytes=len(response.content),
+            failed=int(response.status_code >= 400),
+        )
+        return response
+
+    def close(self) -> None:
+        """Do nothing; the shared transport is closed by its owner."""
+
+
+# =============================================================================
+# Concurrent fetching
+# =============================================================================
+
+def fetch_concurrently(
+    fetch: Callable[[K], V],
+    keys: Iterable[K],
+    pool: ThreadPoolExecutor,
+) -> dict[K, V]:
+    """Run `fetch` for every key on the pool and map keys to results.
+
+    Duplicate keys are fetched once. Exceptions raised by `fetch` propagate,
+    so callers that want best-effort behaviour should catch inside `fetch`.
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    return dict(zip(unique_keys, pool.map(fetch, unique_keys)))
+
+
+def batched(items: list[K], size: int) -> Iterable[list[K]]:
+    """Yield consecutive slices of `items` with at most `size` elements."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]